@@ -6,27 +6,30 @@ applications and notebooks can simply do:
 
     from llumdocs import translate_text, summarize_document
 
-instead of importing from internal subpackages.
+instead of importing from internal subpackages. The re-exports are resolved
+lazily, so importing a subpackage such as ``llumdocs.api`` stays cheap.
 """
 
 from __future__ import annotations
 
-# Re-export public API from services
-from llumdocs.services import (
-    EmailIntelligenceError,
-    EmailIntelligenceService,
-    SummaryType,
-    TextTransformError,
-    TranslationError,
-    analyze_sentiment,
-    classify_email,
-    detect_phishing,
-    extract_keywords,
-    make_text_more_technical,
-    simplify_text,
-    summarize_document,
-    translate_text,
-)
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from llumdocs.services import (
+        EmailIntelligenceError,
+        EmailIntelligenceService,
+        SummaryType,
+        TextTransformError,
+        TranslationError,
+        analyze_sentiment,
+        classify_email,
+        detect_phishing,
+        extract_keywords,
+        make_text_more_technical,
+        simplify_text,
+        summarize_document,
+        translate_text,
+    )
 
 __all__ = [
     "TranslationError",
@@ -43,3 +46,14 @@ __all__ = [
     "detect_phishing",
     "analyze_sentiment",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Re-export public API from services on first access
+    if name in __all__:
+        from llumdocs import services
+
+        value = getattr(services, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
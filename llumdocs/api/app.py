@@ -2,13 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
+import importlib.util
 import os
+from collections.abc import AsyncIterator
 
 import uvicorn
+from anyio import to_thread
 from dotenv import load_dotenv
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-
+from fastapi import FastAPI, status
+from fastapi.responses import ORJSONResponse, Response
+from starlette.middleware.gzip import GZipMiddleware
+
+from llumdocs.api.caching import clear_ttl_cache, ttl_cache
+from llumdocs.api.cors import ASGICors
+from llumdocs.api.error_handling import service_error_handler
+from llumdocs.http_client import create_async_client, set_async_client
+from llumdocs.services.errors import TextTransformError, TranslationError
 from llumdocs.services.ollama_client import _base as ollama_base, health as ollama_health
 
 # Load environment variables from .env file (if present)
@@ -22,67 +34,184 @@ from llumdocs.api.image_endpoints import router as image_router  # noqa: E402
 from llumdocs.api.text_tools_endpoints import router as text_tools_router  # noqa: E402
 from llumdocs.api.translation_endpoints import router as translation_router  # noqa: E402
 
+# Parsed once at import; CORS configuration does not change at runtime
+CORS_ALLOW_ORIGINS = tuple(
+    origin.strip() for origin in os.getenv("LLUMDOCS_CORS_ORIGINS", "*").split(",")
+)
 
-def create_app() -> FastAPI:
-    app = FastAPI(title="LlumDocs API", version="0.1.0")
+# Size of the anyio worker threadpool that runs the blocking (sync) endpoints
+THREADPOOL_SIZE = int(os.getenv("LLUMDOCS_THREADPOOL", "64"))
+
+# Optional features that can be switched off via LLUMDOCS_FEATURES
+FEATURES = frozenset({"ollama_probe", "ready_probe", "document_extraction"})
+
+
+def _enabled_features() -> frozenset[str]:
+    """Parse LLUMDOCS_FEATURES (comma-separated); every feature is on when unset."""
+    raw = os.getenv("LLUMDOCS_FEATURES")
+    if raw is None:
+        return FEATURES
+    return frozenset(name.strip().lower() for name in raw.split(",")) & FEATURES
+
+
+async def _probe_ollama() -> None:
+    """Log whether Ollama is reachable without delaying server startup."""
+    base = ollama_base()
+    print(f"[LlumDocs] OLLAMA_API_BASE = {base}")
+    try:
+        await asyncio.to_thread(ollama_health, timeout=2.0)
+        print("[LlumDocs] Ollama reachable \u2714")
+    except Exception as e:  # pragma: no cover - best-effort diagnostics
+        print(f"[LlumDocs] Ollama NOT reachable \u2716 : {e}")
+
+
+@contextlib.asynccontextmanager
+async def _lifespan(app: FastAPI, *, probe_ollama: bool = True) -> AsyncIterator[None]:
+    # Sync endpoints (document extraction, image description) run on anyio's threadpool
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
+    # One pooled client for every async LLM call made by this process
+    http_client = create_async_client()
+    app.state.http_client = http_client
+    set_async_client(http_client)
+
+    # Run the probe in the background so uvicorn accepts connections immediately
+    probe = asyncio.create_task(_probe_ollama()) if probe_ollama else None
+    try:
+        yield
+    finally:
+        if probe is not None:
+            probe.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await probe
+        set_async_client(None)
+        await http_client.aclose()
+
+
+def _check_unique_routes(app: FastAPI) -> None:
+    """Fail fast if a router or endpoint got registered twice on the same method and path."""
+    seen: set[tuple[str, str]] = set()
+    for route in app.routes:
+        for method in getattr(route, "methods", None) or ():
+            key = (method, route.path)
+            if key in seen:
+                raise RuntimeError(f"Duplicate route registered: {method} {route.path}")
+            seen.add(key)
+
+
+def create_app(
+    *,
+    enable_ollama_probe: bool | None = None,
+    enable_ready_probe: bool | None = None,
+    enable_doc_extraction: bool | None = None,
+) -> FastAPI:
+    """Build the LlumDocs API application.
+
+    Each ``enable_*`` flag defaults to whether the matching feature is listed in
+    ``LLUMDOCS_FEATURES`` (``ollama_probe``, ``ready_probe``,
+    ``document_extraction``). When the variable is unset, every feature is on.
+    """
+    features = _enabled_features()
+    if enable_ollama_probe is None:
+        enable_ollama_probe = "ollama_probe" in features
+    if enable_ready_probe is None:
+        enable_ready_probe = "ready_probe" in features
+    if enable_doc_extraction is None:
+        enable_doc_extraction = "document_extraction" in features
+
+    app = FastAPI(
+        title="LlumDocs API",
+        version="0.1.0",
+        default_response_class=ORJSONResponse,
+        lifespan=functools.partial(_lifespan, probe_ollama=enable_ollama_probe),
+    )
+    clear_ttl_cache()
 
-    allow_origins = os.getenv("LLUMDOCS_CORS_ORIGINS", "*").split(",")
     app.add_middleware(
-        CORSMiddleware,
-        allow_origins=[origin.strip() for origin in allow_origins],
+        ASGICors,
+        allow_origins=CORS_ALLOW_ORIGINS,
         allow_methods=["*"],
         allow_headers=["*"],
-        allow_credentials=False,
     )
+    # Extraction responses embed a base64 PDF; small JSON bodies are left uncompressed
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
 
-    app.include_router(translation_router)
-    app.include_router(text_tools_router)
-    app.include_router(image_router)
-    app.include_router(document_extraction_router)
-
-    @app.on_event("startup")
-    def _log_ollama() -> None:
-        base = ollama_base()
-        print(f"[LlumDocs] OLLAMA_API_BASE = {base}")
-        try:
-            ollama_health(timeout=2.0)
-            print("[LlumDocs] Ollama reachable \u2714")
-        except Exception as e:  # pragma: no cover - best-effort diagnostics
-            print(f"[LlumDocs] Ollama NOT reachable \u2716 : {e}")
-
-    @app.get("/health", summary="Simple healthcheck")
-    async def health():
-        """Lightweight liveness probe used by deployment platforms."""
-        return {"status": "ok"}
-
-    @app.get("/ready", summary="Readiness probe")
-    async def ready():
-        """Readiness probe for deployment platforms. Checks basic configuration."""
-        return {"status": "ready"}
-
-    @app.get("/health/ollama", summary="Ollama connectivity healthcheck")
-    async def health_ollama():
-        """Check that Ollama is reachable from the API process."""
-        ollama_health(timeout=2.0)
-        return {"ok": True, "base": ollama_base()}
+    for error in (TextTransformError, TranslationError):
+        app.add_exception_handler(error, service_error_handler)
 
+    @app.get(
+        "/health",
+        summary="Simple healthcheck",
+        status_code=status.HTTP_204_NO_CONTENT,
+        response_class=Response,
+    )
+    async def health() -> Response:
+        """Lightweight liveness probe used by deployment platforms (empty 204)."""
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    if enable_ready_probe:
+
+        @app.get("/ready", summary="Readiness probe")
+        @ttl_cache(seconds=2.0)
+        async def ready():
+            """Readiness probe for deployment platforms. Checks basic configuration."""
+            return {"status": "ready"}
+
+    if enable_ollama_probe:
+
+        @app.get("/health/ollama", summary="Ollama connectivity healthcheck")
+        @ttl_cache(seconds=10.0, error_seconds=2.0)
+        async def health_ollama():
+            """Check that Ollama is reachable from the API process."""
+            try:
+                await asyncio.to_thread(ollama_health, timeout=2.0)
+            except Exception as e:  # noqa: BLE001
+                return ORJSONResponse(
+                    {"ok": False, "base": ollama_base(), "error": str(e)},
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                )
+            return {"ok": True, "base": ollama_base()}
+
+    # Starlette matches routes in registration order; the /api routers go after the
+    # probes so frequent health checks don't scan every API route first
+    routers = [translation_router, text_tools_router, image_router]
+    if enable_doc_extraction:
+        routers.append(document_extraction_router)
+    for router in routers:
+        app.include_router(router)
+
+    _check_unique_routes(app)
     return app
 
 
 app = create_app()
 
 
+def _prefer(module: str, implementation: str) -> str:
+    """Pick a uvicorn implementation if its package is installed, else let uvicorn decide."""
+    return implementation if importlib.util.find_spec(module) is not None else "auto"
+
+
 def main() -> None:
     """CLI entrypoint for running the LlumDocs API server."""
     host = os.getenv("LLUMDOCS_HOST", "0.0.0.0")
     port = int(os.getenv("LLUMDOCS_PORT", "8000"))
     reload = os.getenv("LLUMDOCS_RELOAD", "false").lower() in ("true", "1", "yes")
+    # uvicorn only supports a single worker process together with --reload
+    workers = 1 if reload else int(os.getenv("LLUMDOCS_WORKERS", "1"))
+    access_log = os.getenv("LLUMDOCS_ACCESS_LOG", "false").lower() in ("true", "1", "yes")
 
     uvicorn.run(
         "llumdocs.api.app:app",
         host=host,
         port=port,
         reload=reload,
+        workers=workers,
+        # uvloop and httptools ship with uvicorn[standard] (not available on Windows)
+        loop=_prefer("uvloop", "uvloop"),
+        http=_prefer("httptools", "httptools"),
+        log_level=os.getenv("LLUMDOCS_LOG_LEVEL", "info").lower(),
+        access_log=access_log,
     )
 
 
@@ -0,0 +1,70 @@
+"""
+In-process response caching for cheap, frequently polled endpoints.
+
+Liveness/readiness probes hit the API many times per second. Caching their
+serialized bodies for a few seconds avoids re-running the handler (and, for
+``/health/ollama``, an outbound HTTP probe) on every poll.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from fastapi import Response, status
+
+# Cached entries: key -> (timestamp, body, status_code, ttl)
+_CACHE: dict[str, tuple[float, bytes, int, float]] = {}
+
+
+def clear_ttl_cache() -> None:
+    """Drop every cached response (used by tests and on app creation)."""
+    _CACHE.clear()
+
+
+def _render(result: Any) -> tuple[bytes, int]:
+    if isinstance(result, Response):
+        return bytes(result.body), result.status_code
+    return json.dumps(result, separators=(",", ":")).encode("utf-8"), status.HTTP_200_OK
+
+
+def ttl_cache(
+    seconds: float, *, error_seconds: float | None = None
+) -> Callable[[Callable[[], Awaitable[Any]]], Callable[[], Awaitable[Response]]]:
+    """Cache the JSON response of an argument-less async endpoint.
+
+    Args:
+        seconds: How long a successful (status < 400) response is reused.
+        error_seconds: How long an error response is reused. Defaults to
+            ``seconds``. A short negative cache keeps a failing dependency from
+            turning every poll into a slow, blocking probe.
+    """
+    negative_ttl = seconds if error_seconds is None else error_seconds
+
+    def decorator(func: Callable[[], Awaitable[Any]]) -> Callable[[], Awaitable[Response]]:
+        key = f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        async def wrapper() -> Response:
+            now = time.monotonic()
+            cached = _CACHE.get(key)
+            if cached is None or now - cached[0] >= cached[3]:
+                body, status_code = _render(await func())
+                ttl = seconds if status_code < 400 else negative_ttl
+                cached = (now, body, status_code, ttl)
+                _CACHE[key] = cached
+
+            _, body, status_code, ttl = cached
+            return Response(
+                content=body,
+                status_code=status_code,
+                media_type="application/json",
+                headers={"Cache-Control": f"public, max-age={int(ttl)}"},
+            )
+
+        return wrapper
+
+    return decorator
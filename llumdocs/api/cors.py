@@ -0,0 +1,135 @@
+"""
+Pure ASGI CORS middleware for the LlumDocs API.
+
+Starlette's ``CORSMiddleware`` builds ``Request``/``Response`` objects for every
+request. This implementation works directly on the ASGI ``scope`` and ``send``
+messages and pre-encodes every header it may emit at construction time, so the
+per-request cost is a single scan of the request headers.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+ALL_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+
+_ALLOW_ORIGIN = b"access-control-allow-origin"
+_ALLOW_METHODS = b"access-control-allow-methods"
+_ALLOW_HEADERS = b"access-control-allow-headers"
+_MAX_AGE = b"access-control-max-age"
+_VARY_ORIGIN = (b"vary", b"Origin")
+_WILDCARD_ORIGIN = (_ALLOW_ORIGIN, b"*")
+
+
+class ASGICors:
+    """Add CORS headers to HTTP responses and answer preflight requests.
+
+    Credentials are never allowed, matching the previous ``CORSMiddleware``
+    configuration of the API.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Iterable[str] = ("*",),
+        allow_methods: Iterable[str] = ("*",),
+        allow_headers: Iterable[str] = ("*",),
+        max_age: int = 600,
+    ) -> None:
+        self.app = app
+
+        origins = tuple(allow_origins)
+        methods = tuple(allow_methods)
+        headers = tuple(allow_headers)
+
+        self.allow_all_origins = "*" in origins
+        self.allow_origins = frozenset(origin.encode("latin-1") for origin in origins)
+        if "*" in methods:
+            methods = ALL_METHODS
+        self.allow_methods = frozenset(method.encode("latin-1") for method in methods)
+        self.allow_all_headers = "*" in headers
+
+        preflight_headers = [
+            (_ALLOW_METHODS, ", ".join(methods).encode("latin-1")),
+            (_MAX_AGE, str(max_age).encode("latin-1")),
+        ]
+        if not self.allow_all_headers:
+            preflight_headers.append(
+                (_ALLOW_HEADERS, ", ".join(h.lower() for h in headers).encode("latin-1"))
+            )
+        self.preflight_headers = preflight_headers
+        self.allow_headers = frozenset(h.lower() for h in headers)
+
+    def _origin_headers(self, origin: bytes) -> list[tuple[bytes, bytes]]:
+        if self.allow_all_origins:
+            return [_WILDCARD_ORIGIN]
+        return [(_ALLOW_ORIGIN, origin), _VARY_ORIGIN]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(origin, request_method, request_headers, send)
+            return
+
+        if not (self.allow_all_origins or origin in self.allow_origins):
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = self._origin_headers(origin)
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *cors_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight(
+        self,
+        origin: bytes,
+        request_method: bytes,
+        request_headers: bytes | None,
+        send: Send,
+    ) -> None:
+        origin_allowed = self.allow_all_origins or origin in self.allow_origins
+        method_allowed = request_method in self.allow_methods
+        headers_allowed = self.allow_all_headers or request_headers is None
+        if not headers_allowed:
+            requested = {h.strip().lower() for h in request_headers.decode("latin-1").split(",")}
+            headers_allowed = requested <= self.allow_headers
+
+        if origin_allowed and method_allowed and headers_allowed:
+            status = 200
+            body = b"OK"
+            headers = [*self._origin_headers(origin), *self.preflight_headers]
+            if self.allow_all_headers and request_headers is not None:
+                headers.append((_ALLOW_HEADERS, request_headers))
+        else:
+            status = 400
+            body = b"Disallowed CORS request"
+            headers = []
+
+        headers.append((b"content-type", b"text/plain; charset=utf-8"))
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
@@ -3,32 +3,36 @@
 from __future__ import annotations
 
 import base64
-import json
+import os
 import tempfile
 from pathlib import Path
 from typing import Annotated
 
 from fastapi import APIRouter, File, Form, HTTPException, UploadFile, status
-from fastapi.responses import Response
+from fastapi.responses import ORJSONResponse, Response
 
 from llumdocs.api.error_handling import handle_service_error
-from llumdocs.services.document_extraction_service import (
-    DocumentExtractionError,
-    extract_document_data,
-)
+from llumdocs.api.uploads import UploadTooLargeError, copy_upload, ensure_upload_size
+
+ALLOWED_EXTENSIONS = frozenset({".pdf", ".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".tif"})
+_ALLOWED_EXTENSIONS_LABEL = ", ".join(sorted(ALLOWED_EXTENSIONS))
+
+# Upload size limit (default 50MB), read once at import
+MAX_DOCUMENT_SIZE_BYTES = int(os.getenv("LLUMDOCS_MAX_DOCUMENT_SIZE_BYTES", str(50 * 1024 * 1024)))
 
 router = APIRouter(prefix="/api", tags=["document-extraction"])
 
 
 @router.post(
     "/documents/extract",
+    response_class=ORJSONResponse,
     summary="Extract structured data from documents",
     description=(
         "Extract structured data from PDF or image documents. "
         "Returns JSON with extracted data and an annotated PDF showing OCR bounding boxes."
     ),
 )
-async def extract_document(
+def extract_document(
     file: Annotated[UploadFile, File(description="PDF or image file to extract data from")],
     doc_type: str = Form(
         ...,
@@ -71,50 +75,60 @@ async def extract_document(
       -F 'doc_type=deliverynote' \
       -F 'model='
     ```
+
+    Declared as a plain ``def`` so FastAPI runs it in the worker threadpool;
+    the blocking OCR/LLM work never stalls the event loop.
     """
     # Validate file type
-    allowed_extensions = {".pdf", ".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".tif"}
-    file_ext = Path(file.filename or "").suffix.lower()
-    if file_ext not in allowed_extensions:
+    # splitext, unlike slicing at the last dot, gives dot-files such as ".pdf" no extension
+    file_ext = os.path.splitext((file.filename or "").lower())[1]
+    if file_ext not in ALLOWED_EXTENSIONS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Unsupported file type. Allowed: {', '.join(allowed_extensions)}",
+            detail=f"Unsupported file type. Allowed: {_ALLOWED_EXTENSIONS_LABEL}",
         )
 
+    # Imported on first use: the extraction service pulls in the OCR and PDF stack
+    from llumdocs.services.document_extraction_service import (
+        DocumentExtractionError,
+        extract_document_data,
+    )
+
+    tmp_path: Path | None = None
     try:
-        # Save uploaded file to temporary location
+        ensure_upload_size(file, MAX_DOCUMENT_SIZE_BYTES)
+
+        # Stream uploaded file to a temporary location without buffering it in memory
         with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as tmp_file:
-            content = await file.read()
-            tmp_file.write(content)
             tmp_path = Path(tmp_file.name)
+            copy_upload(file.file, tmp_file, MAX_DOCUMENT_SIZE_BYTES)
+
+        # Extract data and create annotated PDF (OCR + LLM)
+        extracted_data, annotated_pdf_bytes = extract_document_data(
+            doc_type=doc_type,
+            file_path=tmp_path,
+            model_hint=model if model else None,
+            ocr_engine=ocr_engine,
+        )
+
+        # Return JSON response with base64-encoded PDF
+        pdf_base64 = base64.b64encode(annotated_pdf_bytes).decode("ascii")
 
-        try:
-            # Extract data and create annotated PDF
-            extracted_data, annotated_pdf_bytes = extract_document_data(
-                doc_type=doc_type,
-                file_path=tmp_path,
-                model_hint=model if model else None,
-                ocr_engine=ocr_engine,
-            )
-
-            # Return JSON response with base64-encoded PDF
-            pdf_base64 = base64.b64encode(annotated_pdf_bytes).decode("utf-8")
-
-            response_data = {
-                "extracted_data": extracted_data,
-                "annotated_pdf": pdf_base64,
-            }
-
-            return Response(
-                content=json.dumps(response_data),
-                media_type="application/json",
-                status_code=status.HTTP_200_OK,
-            )
-
-        finally:
-            # Clean up temporary file
-            if tmp_path.exists():
-                tmp_path.unlink()
+        response_data = {
+            "extracted_data": extracted_data,
+            "annotated_pdf": pdf_base64,
+        }
 
+        return ORJSONResponse(response_data, status_code=status.HTTP_200_OK)
+
+    except UploadTooLargeError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File exceeds maximum size of {exc.max_bytes / (1024 * 1024):.1f}MB.",
+        ) from exc
     except DocumentExtractionError as exc:
         raise handle_service_error(exc) from exc
+    finally:
+        # Clean up temporary file (single unlink, no separate existence check)
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
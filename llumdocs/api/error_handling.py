@@ -9,28 +9,36 @@ This module provides utilities to map service errors to appropriate HTTP status
 
 from __future__ import annotations
 
-from fastapi import HTTPException, status
+from fastapi import HTTPException, Request, status
+from fastapi.responses import ORJSONResponse
 
-from llumdocs.llm import LLMConfigurationError
-from llumdocs.services.document_extraction_service import DocumentExtractionError
-from llumdocs.services.image_description_service import ImageDescriptionError
-from llumdocs.services.text_transform_service import TextTransformError
-from llumdocs.services.translation_service import TranslationError
+from llumdocs.services.errors import (
+    DocumentExtractionError,
+    ImageDescriptionError,
+    TextTransformError,
+    TranslationError,
+)
+
+# Exception chains are short in practice; the bound also guards against cycles
+_MAX_CHAIN_DEPTH = 16
 
 
 def is_configuration_error(exc: Exception) -> bool:
     """
     Check if an exception is a configuration error by examining the exception chain.
 
-    Returns True if LLMConfigurationError appears anywhere in the exception chain.
+    Returns True if LLMConfigurationError appears within the first
+    `_MAX_CHAIN_DEPTH` links of the exception chain.
     """
-    current = exc
-    seen = set()
-    while current is not None and id(current) not in seen:
-        seen.add(id(current))
+    from llumdocs.llm import LLMConfigurationError
+
+    current: BaseException | None = exc
+    for _ in range(_MAX_CHAIN_DEPTH):
+        if current is None:
+            return False
         if isinstance(current, LLMConfigurationError):
             return True
-        current = getattr(current, "__cause__", None) or getattr(current, "__context__", None)
+        current = current.__cause__ or current.__context__
     return False
 
 
@@ -41,14 +49,11 @@ def has_backend_error_cause(exc: Exception) -> bool:
     Returns True if the exception has a __cause__ that is not a configuration error.
     This indicates a backend/runtime failure rather than a validation issue.
     """
-    cause = getattr(exc, "__cause__", None)
-    if cause is None:
-        return False
-    # If it's a configuration error, it's handled separately
-    if isinstance(cause, LLMConfigurationError):
-        return False
-    # If there's any other exception as cause, it's a backend error
-    return isinstance(cause, Exception)
+    from llumdocs.llm import LLMConfigurationError
+
+    cause = exc.__cause__
+    # Configuration errors are handled separately; any other exception is a backend error
+    return isinstance(cause, Exception) and not isinstance(cause, LLMConfigurationError)
 
 
 def handle_service_error(exc: Exception, default_message: str = "Service error") -> HTTPException:
@@ -84,3 +89,14 @@ def handle_service_error(exc: Exception, default_message: str = "Service error")
 
     # Default to 500 for unknown errors
     return HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=message)
+
+
+async def service_error_handler(request: Request, exc: Exception) -> ORJSONResponse:
+    """
+    App-wide exception handler for service errors raised by endpoints.
+
+    Applies the `handle_service_error` mapping, so endpoints can call services
+    without wrapping each call in ``try``/``except``.
+    """
+    http_exc = handle_service_error(exc)
+    return ORJSONResponse({"detail": http_exc.detail}, status_code=http_exc.status_code)
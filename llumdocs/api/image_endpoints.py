@@ -6,13 +6,11 @@ import os
 from typing import Annotated
 
 from fastapi import APIRouter, File, Form, HTTPException, UploadFile, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from llumdocs.api.error_handling import handle_service_error
-from llumdocs.services.image_description_service import (
-    ImageDescriptionError,
-    describe_image,
-)
+from llumdocs.api.uploads import UploadTooLargeError, ensure_upload_size, read_upload
 
 
 class ImageDescriptionResponse(BaseModel):
@@ -21,14 +19,20 @@ class ImageDescriptionResponse(BaseModel):
 
 router = APIRouter(prefix="/api", tags=["images"])
 
+_IMAGE_CONTENT_TYPE_PREFIX = "image/"
+
+# Upload size limit (default 10MB), read once at import
+MAX_IMAGE_SIZE_BYTES = int(os.getenv("LLUMDOCS_MAX_IMAGE_SIZE_BYTES", str(10 * 1024 * 1024)))
+
 
 @router.post(
     "/images/describe",
-    response_model=ImageDescriptionResponse,
+    # Documented for OpenAPI only; the handler builds the JSON body directly
+    responses={status.HTTP_200_OK: {"model": ImageDescriptionResponse}},
     status_code=status.HTTP_200_OK,
     summary="Describe an image",
 )
-async def describe(
+def describe(
     image: Annotated[UploadFile, File(description="Image file to describe")],
     detail_level: Annotated[
         str,
@@ -54,7 +58,7 @@ async def describe(
             examples=[None, "o4-mini", "ollama/qwen3-vl:8b"],
         ),
     ] = None,
-) -> ImageDescriptionResponse:
+) -> ORJSONResponse:
     """
     Generate a textual description of an uploaded image.
 
@@ -70,6 +74,9 @@ async def describe(
       -F 'max_size=512' \
       -F 'model='
     ```
+
+    Declared as a plain ``def`` so FastAPI runs it in the worker threadpool;
+    the blocking vision call never stalls the event loop.
     """
     # Validate max_size
     if max_size < 1 or max_size > 2048:
@@ -79,31 +86,36 @@ async def describe(
         )
 
     # Validate file type
-    if not image.content_type or not image.content_type.startswith("image/"):
+    content_type = image.content_type
+    if not content_type or not content_type.startswith(_IMAGE_CONTENT_TYPE_PREFIX):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="File must be an image (JPEG, PNG, GIF, or WebP).",
         )
 
+    # Check file size limit before reading the body
+    try:
+        ensure_upload_size(image, MAX_IMAGE_SIZE_BYTES)
+        image_bytes = read_upload(image.file, MAX_IMAGE_SIZE_BYTES)
+    except UploadTooLargeError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Image file exceeds maximum size of {exc.max_bytes / (1024 * 1024):.1f}MB.",
+        ) from exc
+
+    if not image_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Image file is empty.",
+        )
+
+    # Imported on first use to keep API cold start light
+    from llumdocs.services.image_description_service import (
+        ImageDescriptionError,
+        describe_image,
+    )
+
     try:
-        # Read image bytes
-        image_bytes = await image.read()
-
-        if not image_bytes:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Image file is empty.",
-            )
-
-        # Check file size limit (default 10MB, configurable via env)
-        max_file_size = int(os.getenv("LLUMDOCS_MAX_IMAGE_SIZE_BYTES", str(10 * 1024 * 1024)))
-        if len(image_bytes) > max_file_size:
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail=f"Image file exceeds maximum size of {max_file_size / (1024 * 1024):.1f}MB.",
-            )
-
-        # Generate description
         description = describe_image(
             image_bytes,
             detail_level=detail_level,  # type: ignore[arg-type]
@@ -111,7 +123,7 @@ async def describe(
             model_hint=model,
         )
 
-        return ImageDescriptionResponse(description=description)
+        return ORJSONResponse({"description": description})
 
     except ImageDescriptionError as exc:
         raise handle_service_error(exc) from exc
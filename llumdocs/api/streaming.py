@@ -0,0 +1,45 @@
+"""Server-sent event helpers for streaming LLM output from API endpoints."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+import orjson
+from fastapi.responses import StreamingResponse
+
+_DONE_EVENT = b"data: [DONE]\n\n"
+
+
+async def start_stream(chunks: AsyncIterator[str]) -> tuple[str, AsyncIterator[str]]:
+    """
+    Pull the first chunk so validation and backend errors raise before any bytes are sent.
+
+    Returns:
+        The first chunk (empty if the stream produced nothing) and the remaining iterator.
+    """
+    try:
+        first = await anext(chunks)
+    except StopAsyncIteration:
+        first = ""
+    return first, chunks
+
+
+async def _events(first: str, rest: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    if first:
+        yield b"data: " + orjson.dumps({"delta": first}) + b"\n\n"
+    try:
+        async for delta in rest:
+            yield b"data: " + orjson.dumps({"delta": delta}) + b"\n\n"
+    except Exception as exc:  # noqa: BLE001 - headers are already sent, report in-band
+        yield b"event: error\ndata: " + orjson.dumps({"detail": str(exc)}) + b"\n\n"
+        return
+    yield _DONE_EVENT
+
+
+def event_stream_response(first: str, rest: AsyncIterator[str]) -> StreamingResponse:
+    """Wrap a started stream as ``text/event-stream``, one ``{"delta": ...}`` event per chunk."""
+    return StreamingResponse(
+        _events(first, rest),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
@@ -3,16 +3,15 @@
 from __future__ import annotations
 
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field
 
-from llumdocs.api.error_handling import handle_service_error
-from llumdocs.services.text_transform_service import (
-    TextTransformError,
-    extract_keywords,
-    make_text_more_technical,
-    simplify_text,
-    summarize_document,
-)
+from llumdocs.api.streaming import event_stream_response, start_stream
+from llumdocs.services.batching import MAX_BATCH_SIZE
+from llumdocs.services.types import SummaryType
+
+# Service functions are imported inside the handlers: the services pull in LiteLLM,
+# which would otherwise add seconds to API cold start for every worker
 
 
 class KeywordsRequest(BaseModel):
@@ -20,14 +19,12 @@ class KeywordsRequest(BaseModel):
         ...,
         min_length=1,
         description="Text to analyze",
-        examples=["Machine learning is a subset of artificial intelligence"],
     )
     max_keywords: int = Field(
         default=10,
         ge=1,
         le=50,
         description="Maximum number of keywords to return (1-50)",
-        examples=[10, 5, 20],
     )
     model: str | None = Field(
         default=None,
@@ -36,17 +33,19 @@ class KeywordsRequest(BaseModel):
             "(e.g., 'gpt-4o-mini', 'ollama/llama3.1:8b'). "
             "Set to null or omit to use default."
         ),
-        examples=[None, "gpt-4o-mini", "ollama/llama3.1:8b"],
     )
 
     model_config = ConfigDict(
+        extra="forbid",
+        str_strip_whitespace=True,
+        frozen=True,
         json_schema_extra={
             "example": {
                 "text": "Machine learning is a subset of artificial intelligence",
                 "max_keywords": 10,
                 "model": None,
             }
-        }
+        },
     )
 
 
@@ -54,13 +53,51 @@ class KeywordsResponse(BaseModel):
     keywords: list[str]
 
 
+class KeywordsBatchRequest(BaseModel):
+    items: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+        description=f"Texts to analyze (1-{MAX_BATCH_SIZE}), answered with a single LLM call",
+    )
+    max_keywords: int = Field(
+        default=10,
+        ge=1,
+        le=50,
+        description="Maximum number of keywords to return per text (1-50)",
+    )
+    model: str | None = Field(
+        default=None,
+        description=(
+            "Optional LiteLLM model identifier override "
+            "(e.g., 'gpt-4o-mini', 'ollama/llama3.1:8b'). "
+            "Set to null or omit to use default."
+        ),
+    )
+
+    model_config = ConfigDict(
+        extra="forbid",
+        str_strip_whitespace=True,
+        frozen=True,
+        json_schema_extra={
+            "example": {
+                "items": ["First document text", "Second document text"],
+                "max_keywords": 10,
+                "model": None,
+            }
+        },
+    )
+
+
+class KeywordsBatchResponse(BaseModel):
+    results: list[list[str]]
+
+
 class SummaryRequest(BaseModel):
-    text: str = Field(..., min_length=1, examples=["Your long document text here..."])
-    summary_type: str = Field(
+    text: str = Field(..., min_length=1)
+    summary_type: SummaryType = Field(
         default="short",
-        pattern="^(short|detailed|executive)$",
         description="Summary style. Accepted values: 'short', 'detailed', 'executive'",
-        examples=["short", "detailed", "executive"],
     )
     model: str | None = Field(
         default=None,
@@ -69,17 +106,19 @@ class SummaryRequest(BaseModel):
             "(e.g., 'gpt-4o-mini', 'ollama/llama3.1:8b'). "
             "Set to null or omit to use default."
         ),
-        examples=[None, "gpt-4o-mini"],
     )
 
     model_config = ConfigDict(
+        extra="forbid",
+        str_strip_whitespace=True,
+        frozen=True,
         json_schema_extra={
             "example": {
                 "text": "Your long document text here...",
                 "summary_type": "short",
                 "model": None,
             }
-        }
+        },
     )
 
 
@@ -87,17 +126,53 @@ class SummaryResponse(BaseModel):
     summary: str
 
 
+class SummaryBatchRequest(BaseModel):
+    items: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+        description=f"Texts to summarize (1-{MAX_BATCH_SIZE}), answered with a single LLM call",
+    )
+    summary_type: SummaryType = Field(
+        default="short",
+        description="Summary style. Accepted values: 'short', 'detailed', 'executive'",
+    )
+    model: str | None = Field(
+        default=None,
+        description=(
+            "Optional LiteLLM model identifier override "
+            "(e.g., 'gpt-4o-mini', 'ollama/llama3.1:8b'). "
+            "Set to null or omit to use default."
+        ),
+    )
+
+    model_config = ConfigDict(
+        extra="forbid",
+        str_strip_whitespace=True,
+        frozen=True,
+        json_schema_extra={
+            "example": {
+                "items": ["First document text", "Second document text"],
+                "summary_type": "short",
+                "model": None,
+            }
+        },
+    )
+
+
+class SummaryBatchResponse(BaseModel):
+    summaries: list[str]
+
+
 class TechnicalRequest(BaseModel):
-    text: str = Field(..., min_length=1, examples=["Make this more technical"])
+    text: str = Field(..., min_length=1)
     domain: str | None = Field(
         default=None,
         description="Domain focus (e.g., 'tech', 'legal', 'medical'). Optional.",
-        examples=[None, "tech", "legal", "medical"],
     )
     target_level: str | None = Field(
         default=None,
         description="Expertise level (e.g., 'expert', 'intermediate'). Optional.",
-        examples=[None, "expert", "intermediate"],
     )
     model: str | None = Field(
         default=None,
@@ -106,10 +181,12 @@ class TechnicalRequest(BaseModel):
             "(e.g., 'gpt-4o-mini', 'ollama/llama3.1:8b'). "
             "Set to null or omit to use default."
         ),
-        examples=[None, "gpt-4o-mini"],
     )
 
     model_config = ConfigDict(
+        extra="forbid",
+        str_strip_whitespace=True,
+        frozen=True,
         json_schema_extra={
             "example": {
                 "text": "Make this more technical",
@@ -117,7 +194,7 @@ class TechnicalRequest(BaseModel):
                 "target_level": None,
                 "model": None,
             }
-        }
+        },
     )
 
 
@@ -126,14 +203,13 @@ class TechnicalResponse(BaseModel):
 
 
 class PlainLanguageRequest(BaseModel):
-    text: str = Field(..., min_length=1, examples=["Complex technical jargon here"])
+    text: str = Field(..., min_length=1)
     target_reading_level: str | None = Field(
         default=None,
         description=(
             "Target audience reading level. "
             "Examples: 'child', 'teen', 'adult_general'. Optional."
         ),
-        examples=[None, "child", "teen", "adult_general"],
     )
     model: str | None = Field(
         default=None,
@@ -142,17 +218,19 @@ class PlainLanguageRequest(BaseModel):
             "(e.g., 'gpt-4o-mini', 'ollama/llama3.1:8b'). "
             "Set to null or omit to use default."
         ),
-        examples=[None, "gpt-4o-mini"],
     )
 
     model_config = ConfigDict(
+        extra="forbid",
+        str_strip_whitespace=True,
+        frozen=True,
         json_schema_extra={
             "example": {
                 "text": "Complex technical jargon here",
                 "target_reading_level": None,
                 "model": None,
             }
-        }
+        },
     )
 
 
@@ -185,17 +263,48 @@ async def keywords(payload: KeywordsRequest) -> KeywordsResponse:
       }'
     ```
     """
-    try:
-        result = extract_keywords(
-            payload.text,
-            max_keywords=payload.max_keywords,
-            model_hint=payload.model,
-        )
-    except TextTransformError as exc:
-        raise handle_service_error(exc) from exc
+    from llumdocs.services.text_transform_service import aextract_keywords
+
+    result = await aextract_keywords(
+        payload.text,
+        max_keywords=payload.max_keywords,
+        model_hint=payload.model,
+    )
     return KeywordsResponse(keywords=result)
 
 
+@router.post(
+    "/text/keywords/batch",
+    response_model=KeywordsBatchResponse,
+    summary="Extract keywords from several texts",
+)
+async def keywords_batch(payload: KeywordsBatchRequest) -> KeywordsBatchResponse:
+    """
+    Extract keywords from up to 16 texts with a single LLM call.
+
+    **Example curl command:**
+    ```bash
+    curl -X 'POST' \
+      'http://localhost:8000/api/text/keywords/batch' \
+      -H 'accept: application/json' \
+      -H 'Content-Type: application/json' \
+      -d '{
+        "items": ["First document text", "Second document text"],
+        "max_keywords": 10,
+        "model": null
+      }'
+    ```
+    """
+    from llumdocs.services.text_transform_service import aextract_keywords_batch
+
+    results = await aextract_keywords_batch(
+        payload.items,
+        max_keywords=payload.max_keywords,
+        model_hint=payload.model,
+    )
+    return KeywordsBatchResponse(results=results)
+
+
 @router.post(
     "/documents/summarize",
     response_model=SummaryResponse,
@@ -218,15 +327,81 @@ async def summarize(payload: SummaryRequest) -> SummaryResponse:
       }'
     ```
     """
-    try:
-        summary_text = summarize_document(
+    from llumdocs.services.text_transform_service import asummarize_document
+
+    summary_text = await asummarize_document(
+        payload.text,
+        summary_type=payload.summary_type,
+        model_hint=payload.model,
+    )
+    return SummaryResponse(summary=summary_text)
+
+
+@router.post(
+    "/documents/summarize/stream",
+    response_class=StreamingResponse,
+    summary="Summarize a document, streaming the summary as it is generated",
+)
+async def summarize_stream(payload: SummaryRequest) -> StreamingResponse:
+    """
+    Summarize a document and stream the result as server-sent events.
+
+    Each event carries ``{"delta": "..."}``; the stream ends with ``data: [DONE]``.
+
+    **Example curl command:**
+    ```bash
+    curl -N -X 'POST' \
+      'http://localhost:8000/api/documents/summarize/stream' \
+      -H 'Content-Type: application/json' \
+      -d '{
+        "text": "Your long document text here...",
+        "summary_type": "short",
+        "model": null
+      }'
+    ```
+    """
+    from llumdocs.services.text_transform_service import astream_summary
+
+    first, rest = await start_stream(
+        astream_summary(
             payload.text,
-            summary_type=payload.summary_type,  # type: ignore[arg-type]
+            summary_type=payload.summary_type,
             model_hint=payload.model,
         )
-    except TextTransformError as exc:
-        raise handle_service_error(exc) from exc
-    return SummaryResponse(summary=summary_text)
+    )
+    return event_stream_response(first, rest)
+
+
+@router.post(
+    "/documents/summarize/batch",
+    response_model=SummaryBatchResponse,
+    summary="Summarize several documents",
+)
+async def summarize_batch(payload: SummaryBatchRequest) -> SummaryBatchResponse:
+    """
+    Summarize up to 16 documents with a single LLM call.
+
+    **Example curl command:**
+    ```bash
+    curl -X 'POST' \
+      'http://localhost:8000/api/documents/summarize/batch' \
+      -H 'accept: application/json' \
+      -H 'Content-Type: application/json' \
+      -d '{
+        "items": ["First document text", "Second document text"],
+        "summary_type": "short",
+        "model": null
+      }'
+    ```
+    """
+    from llumdocs.services.text_transform_service import asummarize_documents
+
+    summaries = await asummarize_documents(
+        payload.items,
+        summary_type=payload.summary_type,
+        model_hint=payload.model,
+    )
+    return SummaryBatchResponse(summaries=summaries)
 
 
 @router.post(
@@ -252,15 +427,14 @@ async def make_technical(payload: TechnicalRequest) -> TechnicalResponse:
       }'
     ```
     """
-    try:
-        technical_text = make_text_more_technical(
-            payload.text,
-            domain=payload.domain,
-            target_level=payload.target_level,
-            model_hint=payload.model,
-        )
-    except TextTransformError as exc:
-        raise handle_service_error(exc) from exc
+    from llumdocs.services.text_transform_service import amake_text_more_technical
+
+    technical_text = await amake_text_more_technical(
+        payload.text,
+        domain=payload.domain,
+        target_level=payload.target_level,
+        model_hint=payload.model,
+    )
     return TechnicalResponse(technical_text=technical_text)
 
 
@@ -286,12 +460,11 @@ async def simplify(payload: PlainLanguageRequest) -> PlainLanguageResponse:
       }'
     ```
     """
-    try:
-        plain_text = simplify_text(
-            payload.text,
-            target_reading_level=payload.target_reading_level,
-            model_hint=payload.model,
-        )
-    except TextTransformError as exc:
-        raise handle_service_error(exc) from exc
+    from llumdocs.services.text_transform_service import asimplify_text
+
+    plain_text = await asimplify_text(
+        payload.text,
+        target_reading_level=payload.target_reading_level,
+        model_hint=payload.model,
+    )
     return PlainLanguageResponse(plain_text=plain_text)
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field
 
-from llumdocs.api.error_handling import handle_service_error
-from llumdocs.services.translation_service import TranslationError, translate_text
+from llumdocs.api.streaming import event_stream_response, start_stream
+from llumdocs.services.batching import MAX_BATCH_SIZE
+from llumdocs.services.types import SourceLanguage, TargetLanguage
+
+# Service functions are imported inside the handlers: the services pull in LiteLLM,
+# which would otherwise add seconds to API cold start for every worker
 
 
 class TranslationRequest(BaseModel):
@@ -14,25 +19,20 @@ class TranslationRequest(BaseModel):
         ...,
         min_length=1,
         description="Text to translate",
-        examples=["Hello, how are you?", "Bon dia, com estàs?"],
     )
-    source_lang: str = Field(
+    source_lang: SourceLanguage = Field(
         "auto",
-        pattern="^(auto|ca|es|en)$",
         description=(
             "Source language code. Accepted values: "
             "'auto' (auto-detect), 'ca' (Catalan), 'es' (Spanish), 'en' (English)"
         ),
-        examples=["auto", "ca", "es", "en"],
     )
-    target_lang: str = Field(
+    target_lang: TargetLanguage = Field(
         "ca",
-        pattern="^(ca|es|en)$",
         description=(
             "Target language code. Accepted values: "
             "'ca' (Catalan), 'es' (Spanish), 'en' (English)"
         ),
-        examples=["ca", "es", "en"],
     )
     model: str | None = Field(
         default=None,
@@ -41,10 +41,12 @@ class TranslationRequest(BaseModel):
             "(e.g., 'gpt-4o-mini', 'ollama/llama3.1:8b'). "
             "Set to null or omit to use default."
         ),
-        examples=[None, "gpt-4o-mini", "ollama/llama3.1:8b"],
     )
 
     model_config = ConfigDict(
+        extra="forbid",
+        str_strip_whitespace=True,
+        frozen=True,
         json_schema_extra={
             "example": {
                 "text": "Hello, how are you?",
@@ -52,7 +54,7 @@ class TranslationRequest(BaseModel):
                 "target_lang": "ca",
                 "model": None,
             }
-        }
+        },
     )
 
 
@@ -60,6 +62,49 @@ class TranslationResponse(BaseModel):
     translated_text: str
 
 
+class TranslationBatchRequest(BaseModel):
+    items: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+        description=f"Texts to translate (1-{MAX_BATCH_SIZE}), answered with a single LLM call",
+    )
+    source_lang: SourceLanguage = Field(
+        "auto",
+        description="Source language code: 'auto', 'ca', 'es' or 'en'",
+    )
+    target_lang: TargetLanguage = Field(
+        "ca",
+        description="Target language code: 'ca', 'es' or 'en'",
+    )
+    model: str | None = Field(
+        default=None,
+        description=(
+            "Optional LiteLLM model identifier override "
+            "(e.g., 'gpt-4o-mini', 'ollama/llama3.1:8b'). "
+            "Set to null or omit to use default."
+        ),
+    )
+
+    model_config = ConfigDict(
+        extra="forbid",
+        str_strip_whitespace=True,
+        frozen=True,
+        json_schema_extra={
+            "example": {
+                "items": ["Hello, how are you?", "Good morning"],
+                "source_lang": "en",
+                "target_lang": "ca",
+                "model": None,
+            }
+        },
+    )
+
+
+class TranslationBatchResponse(BaseModel):
+    translated_texts: list[str]
+
+
 router = APIRouter(prefix="/api", tags=["translation"])
 
 
@@ -87,15 +132,87 @@ async def translate(payload: TranslationRequest) -> TranslationResponse:
       }'
     ```
     """
+    from llumdocs.services.translation_service import atranslate_text
+
+    translated = await atranslate_text(
+        payload.text,
+        source_lang=payload.source_lang,
+        target_lang=payload.target_lang,
+        model_hint=payload.model,
+    )
+
+    return TranslationResponse(translated_text=translated)
+
+
+@router.post(
+    "/translate/stream",
+    response_class=StreamingResponse,
+    summary="Translate text, streaming the translation as it is generated",
+)
+async def translate_stream(payload: TranslationRequest) -> StreamingResponse:
+    """
+    Translate text and stream the result as server-sent events.
 
-    try:
-        translated = translate_text(
+    Each event carries ``{"delta": "..."}``; the stream ends with ``data: [DONE]``.
+
+    **Example curl command:**
+    ```bash
+    curl -N -X 'POST' \
+      'http://localhost:8000/api/translate/stream' \
+      -H 'Content-Type: application/json' \
+      -d '{
+        "text": "Hello, how are you?",
+        "source_lang": "auto",
+        "target_lang": "ca",
+        "model": null
+      }'
+    ```
+    """
+    from llumdocs.services.translation_service import astream_translation
+
+    first, rest = await start_stream(
+        astream_translation(
             payload.text,
             source_lang=payload.source_lang,
             target_lang=payload.target_lang,
             model_hint=payload.model,
         )
-    except TranslationError as exc:
-        raise handle_service_error(exc) from exc
+    )
 
-    return TranslationResponse(translated_text=translated)
+    return event_stream_response(first, rest)
+
+
+@router.post(
+    "/translate/batch",
+    response_model=TranslationBatchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Translate several texts in one request",
+)
+async def translate_batch(payload: TranslationBatchRequest) -> TranslationBatchResponse:
+    """
+    Translate up to 16 texts with a single LLM call.
+
+    **Example curl command:**
+    ```bash
+    curl -X 'POST' \
+      'http://localhost:8000/api/translate/batch' \
+      -H 'accept: application/json' \
+      -H 'Content-Type: application/json' \
+      -d '{
+        "items": ["Hello, how are you?", "Good morning"],
+        "source_lang": "en",
+        "target_lang": "ca",
+        "model": null
+      }'
+    ```
+    """
+    from llumdocs.services.translation_service import atranslate_texts
+
+    translated = await atranslate_texts(
+        payload.items,
+        source_lang=payload.source_lang,
+        target_lang=payload.target_lang,
+        model_hint=payload.model,
+    )
+
+    return TranslationBatchResponse(translated_texts=translated)
@@ -0,0 +1,114 @@
+"""Helpers for handling uploaded files in API endpoints."""
+
+from __future__ import annotations
+
+import errno
+import io
+import os
+import tempfile
+from typing import BinaryIO
+
+from fastapi import UploadFile
+
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# copy_file_range errors meaning "not supported here" rather than an I/O failure
+_COPY_FILE_RANGE_UNSUPPORTED = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF}
+)
+
+
+class UploadTooLargeError(Exception):
+    """Raised when an upload exceeds the configured size limit."""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"Upload exceeds maximum size of {max_bytes} bytes.")
+        self.max_bytes = max_bytes
+
+
+def _disk_fileno(f: BinaryIO) -> int | None:
+    """Return the OS file descriptor backing `f`, or None if it is not on disk."""
+    # fileno() on an in-memory SpooledTemporaryFile would force it to roll over to disk
+    if isinstance(f, tempfile.SpooledTemporaryFile) and not f._rolled:
+        return None
+    try:
+        return f.fileno()
+    except (AttributeError, OSError):
+        return None
+
+
+def _copy_file_range(src: BinaryIO, src_fd: int, dst: BinaryIO, dst_fd: int, max_bytes: int) -> int:
+    # Explicit offsets leave both file positions untouched, so a failure on the
+    # first call can fall back to the buffered copy from the same starting point.
+    src_offset = src.tell()
+    dst.flush()
+    dst_offset = dst.tell()
+    total = 0
+    while copied := os.copy_file_range(
+        src_fd, dst_fd, COPY_CHUNK_SIZE, src_offset + total, dst_offset + total
+    ):
+        total += copied
+        if total > max_bytes:
+            raise UploadTooLargeError(max_bytes)
+    src.seek(src_offset + total)
+    dst.seek(dst_offset + total)
+    return total
+
+
+def copy_upload(src: BinaryIO, dst: BinaryIO, max_bytes: int) -> int:
+    """Copy an uploaded file to `dst` in fixed-size chunks.
+
+    The size limit is enforced while copying, so an oversized upload is
+    rejected as soon as it crosses `max_bytes` instead of after it has been
+    fully buffered in memory. When both files live on disk (large uploads
+    spool to a temporary file), the copy is done in-kernel with
+    ``os.copy_file_range`` where the platform supports it.
+
+    Args:
+        src: Readable binary file object (e.g. ``UploadFile.file``).
+        dst: Writable binary file object.
+        max_bytes: Maximum number of bytes accepted.
+
+    Returns:
+        Number of bytes copied.
+
+    Raises:
+        UploadTooLargeError: If the upload is larger than `max_bytes`.
+    """
+    src_fd = _disk_fileno(src)
+    dst_fd = _disk_fileno(dst) if src_fd is not None else None
+    if dst_fd is not None and hasattr(os, "copy_file_range"):
+        try:
+            return _copy_file_range(src, src_fd, dst, dst_fd, max_bytes)
+        except OSError as exc:
+            if exc.errno not in _COPY_FILE_RANGE_UNSUPPORTED:
+                raise
+
+    total = 0
+    while chunk := src.read(COPY_CHUNK_SIZE):
+        total += len(chunk)
+        if total > max_bytes:
+            raise UploadTooLargeError(max_bytes)
+        dst.write(chunk)
+    return total
+
+
+def ensure_upload_size(upload: UploadFile, max_bytes: int) -> None:
+    """Reject an upload whose declared size already exceeds `max_bytes`.
+
+    Raises:
+        UploadTooLargeError: If the upload size is known and too large.
+    """
+    if upload.size is not None and upload.size > max_bytes:
+        raise UploadTooLargeError(max_bytes)
+
+
+def read_upload(src: BinaryIO, max_bytes: int) -> bytes:
+    """Read an uploaded file into memory, enforcing `max_bytes` while reading.
+
+    Raises:
+        UploadTooLargeError: If the upload is larger than `max_bytes`.
+    """
+    buffer = io.BytesIO()
+    copy_upload(src, buffer, max_bytes)
+    return buffer.getvalue()
@@ -1,8 +1,25 @@
 """Document extraction pipeline with LLM.
 
 Components: core (framework), deliverynote/bank/payroll (models), document_config (configuration).
+
+``extract_document`` is resolved lazily on first access, so importing a submodule
+(e.g. from a page-rendering worker process) does not pull in LiteLLM.
 """
 
-from .unified_extractor import extract_document
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .unified_extractor import extract_document
 
 __all__ = ["extract_document"]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "extract_document":
+        from .unified_extractor import extract_document
+
+        globals()[name] = extract_document
+        return extract_document
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,10 +4,61 @@ This module provides reusable components for any document extraction pipeline:
 - LLM-based structured data extraction
 - OCR extraction from PDFs and images
 - PDF/image visualization and annotation
+
+Exports are resolved lazily on first access, so importing the visualizer alone
+does not pull in LiteLLM or the OCR engines.
 """
 
-from .extractor import extract_structured_data
-from .ocr import extract_ocr
-from .visualizer import annotate_pdf
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .extractor import (
+        ExtractionPlan,
+        aextract_structured_data,
+        arun_plan,
+        build_plan,
+        extract_batch_async,
+        extract_structured_data,
+        extract_structured_data_batch,
+        run_plan,
+    )
+    from .ocr import extract_ocr
+    from .visualizer import annotate_pdf
+
+_EXPORTS = {
+    "extract_structured_data": ".extractor",
+    "extract_structured_data_batch": ".extractor",
+    "aextract_structured_data": ".extractor",
+    "extract_batch_async": ".extractor",
+    "ExtractionPlan": ".extractor",
+    "build_plan": ".extractor",
+    "run_plan": ".extractor",
+    "arun_plan": ".extractor",
+    "extract_ocr": ".ocr",
+    "annotate_pdf": ".visualizer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-__all__ = ["extract_structured_data", "extract_ocr", "annotate_pdf"]
+__all__ = [
+    "extract_structured_data",
+    "extract_structured_data_batch",
+    "aextract_structured_data",
+    "extract_batch_async",
+    "ExtractionPlan",
+    "build_plan",
+    "run_plan",
+    "arun_plan",
+    "extract_ocr",
+    "annotate_pdf",
+]
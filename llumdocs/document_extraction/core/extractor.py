@@ -2,30 +2,84 @@
 
 from __future__ import annotations
 
-import copy
+import asyncio
+import functools
+import hashlib
 import json
 import logging
+import pickle
 import re
+import string
+import tempfile
 import time
+from collections.abc import Callable
 from pathlib import Path
-from typing import TypeVar
+from typing import Any, Generic, TypeVar
 
-from litellm import completion
+import orjson
+from litellm import acompletion, completion
 from litellm.exceptions import APIError, BadRequestError
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, ConfigDict, ValidationError, create_model
 
 from ...llm import resolve_model
-from ..settings import SETTINGS
+from ..settings import get_settings
 
 T = TypeVar("T", bound=BaseModel)
 
+# Markdown code fences that models sometimes wrap JSON answers in
+_JSON_FENCE_RE = re.compile(r"```json\s*\n?")
+_FENCE_RE = re.compile(r"```\s*\n?")
+_JSON_DECODER = json.JSONDecoder()
 
-def transform_schema(schema: dict) -> dict:
+# Upper bound on documents per batched call; past this, answers degrade faster than calls are saved
+MAX_EXTRACTION_BATCH_SIZE = 8
+
+_BATCH_INSTRUCTIONS = (
+    "\n\nYou will receive several independent documents, each introduced by a marker "
+    "like <<DOCUMENT 1>>. Extract each document separately. Return a JSON object whose "
+    '"items" array has exactly one element per document, in order, where element i is '
+    "the extraction for <<DOCUMENT i>>."
+)
+
+
+def _fast_deepcopy(obj):
+    """Deep-copy JSON-native data via a pickle round-trip (C code, unlike ``copy.deepcopy``)."""
+    return pickle.loads(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _inline_refs(schema: dict, defs: dict) -> dict:
+    """Replace ``#/$defs/...`` references with copies of their definitions, in place.
+
+    Walks the schema with an explicit worklist of (container, key) slots, so deep
+    schemas cost no recursion and untouched nodes are not rebuilt.
+    """
+    root = [schema]
+    stack: list[tuple[dict | list, Any]] = [(root, 0)]
+    while stack:
+        container, key = stack.pop()
+        node = container[key]
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str) and ref.startswith("#/$defs/"):
+                def_name = ref.split("/")[-1]
+                if def_name in defs:
+                    # Each use gets its own copy: later passes mutate the inlined schema
+                    container[key] = _fast_deepcopy(defs[def_name])
+                    stack.append((container, key))
+                    continue
+            stack.extend((node, child) for child in node)
+        elif isinstance(node, list):
+            stack.extend((node, index) for index in range(len(node)))
+    return root[0]
+
+
+def transform_schema(schema: dict, *, in_place: bool = False) -> dict:
     """Transform Pydantic JSON schema for OpenAI strict mode.
 
     Inlines $defs, marks all properties as required, makes optional fields nullable.
+    The input is copied first unless `in_place` is set by a caller that owns it.
     """
-    transformed = copy.deepcopy(schema)
+    transformed = schema if in_place else _fast_deepcopy(schema)
 
     def normalize_anyof_to_nullable(prop_schema: dict) -> None:
         """Convert anyOf to nullable type format."""
@@ -47,7 +101,7 @@ def transform_schema(schema: dict) -> dict:
             prop_schema.pop("anyOf", None)
 
     def make_property_nullable(prop_schema: dict, is_optional: bool) -> None:
-        """Make optional property nullable."""
+        """Make optional property nullable, then apply the same rules to array items."""
         # First normalize anyOf structures
         normalize_anyof_to_nullable(prop_schema)
 
@@ -60,93 +114,64 @@ def transform_schema(schema: dict) -> dict:
             elif isinstance(prop_type, list) and is_optional and "null" not in prop_type:
                 prop_schema["type"].append("null")
 
+        # Handle array items
+        prop_type = prop_schema.get("type")
+        is_array = prop_type == "array" or (isinstance(prop_type, list) and "array" in prop_type)
+        items = prop_schema.get("items")
+        if is_array and isinstance(items, dict) and "properties" in items:
+            make_object_strict(items)
+
+    def make_object_strict(object_schema: dict) -> None:
+        """Make all properties required (OpenAI strict requirement).
+
+        Fields that were optional or have defaults become nullable instead.
+        """
+        original_required = object_schema.get("required", [])
+        properties = object_schema["properties"]
+        object_schema["required"] = list(properties)
+        for prop_name, prop_schema in properties.items():
+            is_optional = prop_name not in original_required or "default" in prop_schema
+            make_property_nullable(prop_schema, is_optional)
+
     # Inline $defs
     if "$defs" in transformed:
         defs = transformed.pop("$defs")
+        transformed = _inline_refs(transformed, defs)
 
-        def inline_refs(obj, defs_dict):
-            if isinstance(obj, dict):
-                if "$ref" in obj:
-                    ref_path = obj["$ref"]
-                    if ref_path.startswith("#/$defs/"):
-                        def_name = ref_path.split("/")[-1]
-                        if def_name in defs_dict:
-                            return inline_refs(copy.deepcopy(defs_dict[def_name]), defs_dict)
-                return {k: inline_refs(v, defs_dict) for k, v in obj.items()}
-            if isinstance(obj, list):
-                return [inline_refs(item, defs_dict) for item in obj]
-            return obj
-
-        transformed = inline_refs(transformed, defs)
-
-    # Make all properties required (OpenAI strict requirement)
-    # But handle fields with defaults - they can be null and will use default
     if "properties" in transformed:
-        all_props = list(transformed["properties"].keys())
-        transformed["required"] = all_props
-
-        # Make optional fields nullable (including those with defaults)
-        original_required = schema.get("required", [])
-        for prop_name, prop_schema in transformed["properties"].items():
-            # Fields not in required OR fields with default values should be nullable
-            has_default = "default" in prop_schema
-            is_optional = prop_name not in original_required or has_default
-            make_property_nullable(prop_schema, is_optional)
-
-        # Handle array items
-        for prop_schema in transformed["properties"].values():
-            prop_type = prop_schema.get("type")
-            is_array = prop_type == "array" or (
-                isinstance(prop_type, list) and "array" in prop_type
-            )
-            if is_array and "items" in prop_schema:
-                items = prop_schema["items"]
-                if isinstance(items, dict) and "properties" in items:
-                    # Get original required fields from the inlined schema if available
-                    # We need to check the original schema to see which fields were required
-                    items_original_required = items.get("required", [])
-                    all_item_props = list(items["properties"].keys())
-                    items["required"] = all_item_props
-
-                    # Make optional array item properties nullable
-                    # Iterate over keys to ensure we modify the actual dict
-                    for item_prop_name in list(items["properties"].keys()):
-                        item_prop = items["properties"][item_prop_name]
-
-                        # First normalize anyOf structures to type format
-                        if "anyOf" in item_prop:
-                            types = []
-                            for anyof_item in item_prop["anyOf"]:
-                                if isinstance(anyof_item, dict) and "type" in anyof_item:
-                                    item_type = anyof_item["type"]
-                                    if item_type != "null":
-                                        types.append(item_type)
-                            if types:
-                                item_prop["type"] = (
-                                    [types[0], "null"] if len(types) == 1 else types + ["null"]
-                                )
-                            else:
-                                item_prop["type"] = ["null"]
-                            item_prop.pop("anyOf", None)
-
-                        # Then make nullable if optional
-                        has_default = "default" in item_prop
-                        is_optional = item_prop_name not in items_original_required or has_default
-                        if "type" in item_prop:
-                            prop_type = item_prop["type"]
-                            if isinstance(prop_type, str):
-                                if is_optional and prop_type != "null":
-                                    item_prop["type"] = [prop_type, "null"]
-                            elif (
-                                isinstance(prop_type, list)
-                                and is_optional
-                                and "null" not in prop_type
-                            ):
-                                item_prop["type"].append("null")
+        make_object_strict(transformed)
 
     return transformed
 
 
+@functools.lru_cache(maxsize=128)
+def _openai_schema(model_class: type[BaseModel]) -> dict:
+    """Strict-mode schema for `model_class`, built once per class.
+
+    Callers must not mutate the shared result; hand out a copy instead.
+    """
+    # model_json_schema() returns a fresh dict, so there is nothing to protect by copying
+    return transform_schema(model_class.model_json_schema(), in_place=True)
+
+
+@functools.lru_cache(maxsize=128)
+def _fields_with_defaults(model_class: type[BaseModel]) -> frozenset[str]:
+    """Fields whose default is neither ``...`` nor None, computed once per class."""
+    return frozenset(
+        name
+        for name, field_info in model_class.model_fields.items()
+        if field_info.default is not ... and field_info.default is not None
+    )
+
+
+def _drop_null_defaults(data: Any, model_class: type[BaseModel]) -> Any:
+    """Drop ``null`` values for fields with defaults so Pydantic applies the default."""
+    if not isinstance(data, dict):
+        return data
+    skip = _fields_with_defaults(model_class)
+    return {key: value for key, value in data.items() if not (value is None and key in skip)}
+
+
 def parse_json(content: str, model_class: type[T]) -> tuple[T | None, Exception | None]:
     """Parse and validate JSON against Pydantic model.
 
@@ -156,6 +181,16 @@ def parse_json(content: str, model_class: type[T]) -> tuple[T | None, Exception
     if not content:
         return None, None
 
+    # Fast path: a well-formed answer is parsed and validated in a single pass. Only models
+    # that forbid extra keys reject a {"wrapper": {...}} answer here instead of validating
+    # it as an all-default instance, so other models always take the cleanup path.
+    if model_class.model_config.get("extra") == "forbid":
+        try:
+            return model_class.model_validate_json(content), None
+        except ValidationError:
+            # Wrapped, fenced or null-for-default answers need the cleanup below
+            pass
+
     try:
         data = json.loads(content)
         # Unwrap nested structures
@@ -163,154 +198,447 @@ def parse_json(content: str, model_class: type[T]) -> tuple[T | None, Exception
             data = list(data.values())[0]
 
         # Remove null values for fields that have defaults - let Pydantic use defaults
-        if isinstance(data, dict):
-            model_fields = model_class.model_fields
-            cleaned_data = {}
-            for key, value in data.items():
-                if value is None and key in model_fields:
-                    field_info = model_fields[key]
-                    # Skip null if field has a default (not ... and not None)
-                    if field_info.default is not ... and field_info.default is not None:
-                        continue
-                cleaned_data[key] = value
-            data = cleaned_data
+        data = _drop_null_defaults(data, model_class)
 
         validated = model_class.model_validate(data)
         return validated, None
     except json.JSONDecodeError:
         # Extract JSON from markdown
-        cleaned = re.sub(r"```json\s*\n?", "", content)
-        cleaned = re.sub(r"```\s*\n?", "", cleaned)
+        cleaned = _JSON_FENCE_RE.sub("", content)
+        cleaned = _FENCE_RE.sub("", cleaned)
         start = cleaned.find("{")
         if start >= 0:
-            depth = 0
-            for i in range(start, len(cleaned)):
-                if cleaned[i] == "{":
-                    depth += 1
-                elif cleaned[i] == "}":
-                    depth -= 1
-                    if depth == 0:
-                        try:
-                            data = json.loads(cleaned[start : i + 1])
-                            if isinstance(data, dict) and len(data) == 1:
-                                data = list(data.values())[0]
-
-                            # Remove null values for fields with defaults
-                            if isinstance(data, dict):
-                                model_fields = model_class.model_fields
-                                cleaned_data = {}
-                                for key, value in data.items():
-                                    if value is None and key in model_fields:
-                                        field_info = model_fields[key]
-                                        if (
-                                            field_info.default is not ...
-                                            and field_info.default is not None
-                                        ):
-                                            continue
-                                    cleaned_data[key] = value
-                                data = cleaned_data
-
-                            return model_class.model_validate(data), None
-                        except (json.JSONDecodeError, ValidationError) as e:
-                            return None, e
+            try:
+                # Decodes the first complete JSON value and ignores trailing prose
+                data, _end = _JSON_DECODER.raw_decode(cleaned, start)
+                if isinstance(data, dict) and len(data) == 1:
+                    data = list(data.values())[0]
+
+                # Remove null values for fields with defaults
+                data = _drop_null_defaults(data, model_class)
+
+                return model_class.model_validate(data), None
+            except (json.JSONDecodeError, ValidationError) as e:
+                return None, e
     except ValidationError as e:
         return None, e
 
     return None, None
 
 
+def _response_cache_path(
+    model_id: str, model_class: type[BaseModel], system_prompt: str, user_prompt: str
+) -> Path | None:
+    """Content-addressed cache file for an extraction request, if the cache is enabled."""
+    cache_dir = get_settings().response_cache_dir
+    if not cache_dir:
+        return None
+    payload = "\x1f".join((model_id, model_class.__qualname__, system_prompt, user_prompt))
+    key = hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+    return Path(cache_dir) / f"{key}.json"
+
+
+def _read_cached_response(
+    cache_path: Path | None, parse: Callable[[str], tuple[T | None, Exception | None]]
+) -> T | None:
+    if cache_path is None:
+        return None
+    try:
+        content = cache_path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    parsed, _error = parse(content)
+    return parsed
+
+
+def _write_cached_response(cache_path: Path | None, content: str) -> None:
+    if cache_path is None:
+        return
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write a uniquely named file then rename it, so concurrent writers of the same key
+        # never share a temp file and readers never see a partial one
+        tmp = tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=cache_path.parent, suffix=".tmp", delete=False
+        )
+        try:
+            with tmp:
+                tmp.write(content)
+            Path(tmp.name).replace(cache_path)
+        except OSError:
+            Path(tmp.name).unlink(missing_ok=True)
+            raise
+    except OSError as exc:
+        logging.warning("Could not write extraction cache %s: %s", cache_path, exc)
+
+
 def _is_openai_model(model_id: str) -> bool:
     """Check if model is an OpenAI model (not Ollama)."""
     return not model_id.startswith("ollama/")
 
 
-def extract_structured_data(
-    text: str,
-    model_class: type[T],
-    system_prompt: str,
-    user_prompt_template: str,
-    model: str | None = None,
-    debug_dir: Path | None = None,
-) -> T:
-    """Extract structured data from text using LLM with schema validation."""
-    model_name = model or SETTINGS.model
-    model_config = resolve_model(model_name)
-    is_openai = _is_openai_model(model_config.model_id)
+def _compile_prompt_template(template: str) -> list[str] | None:
+    """Literal segments around each ``{text}`` field, so ``text.join(segments)`` renders it.
 
-    json_schema = model_class.model_json_schema()
-    openai_schema = transform_schema(json_schema) if is_openai else None
+    Returns None when the template uses anything else (other fields, format specs or
+    conversions) and has to go through ``str.format``.
+    """
+    segments = [""]
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        segments[-1] += literal
+        if field is None:
+            continue
+        if field != "text" or spec or conversion:
+            return None
+        segments.append("")
+    return segments
+
+
+class ExtractionPlan(Generic[T]):
+    """Per-(model, schema, prompts) state, resolved once and reused for every text.
+
+    Build one with `build_plan` and run it with `run_plan` / `arun_plan` when many
+    texts share the same document type, instead of re-resolving the model and
+    re-parsing the prompt template on each call.
+    """
+
+    def __init__(
+        self,
+        model_class: type[T],
+        system_prompt: str,
+        user_prompt_template: str,
+        model: str | None = None,
+    ) -> None:
+        self.model_class = model_class
+        self.system_prompt = system_prompt
+        self.user_prompt_template = user_prompt_template
+        self.model_config = resolve_model(model or get_settings().model)
+        self.is_openai = _is_openai_model(self.model_config.model_id)
+        self._prompt_segments = _compile_prompt_template(user_prompt_template)
+
+    @property
+    def uses_strict_schema(self) -> bool:
+        return get_settings().json_strict and self.is_openai
+
+    def user_prompt(self, text: str) -> str:
+        if self._prompt_segments is None:
+            return self.user_prompt_template.format(text=text)
+        return text.join(self._prompt_segments)
+
+    def messages(self, user_prompt: str) -> list[dict[str, str]]:
+        return [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
+
+    def cache_path(self, user_prompt: str) -> Path | None:
+        return _response_cache_path(
+            self.model_config.model_id, self.model_class, self.system_prompt, user_prompt
+        )
 
-    messages = [
-        {"role": "system", "content": system_prompt},
-        {"role": "user", "content": user_prompt_template.format(text=text)},
-    ]
+    def strict_format(self) -> dict:
+        # Copied per call: the request payload may be mutated downstream by LiteLLM
+        return {
+            "type": "json_schema",
+            "json_schema": {
+                "name": self.model_class.__name__,
+                "schema": _fast_deepcopy(_openai_schema(self.model_class)),
+                "strict": True,
+            },
+        }
 
-    def _call(response_format: dict):
+    def kwargs(self, messages: list[dict[str, str]], response_format: dict) -> dict:
+        settings = get_settings()
         kwargs = {
-            "model": model_config.model_id,
+            "model": self.model_config.model_id,
             "messages": messages,
-            "temperature": SETTINGS.temperature,
-            "max_tokens": SETTINGS.max_output_tokens,
+            "temperature": settings.temperature,
+            "max_tokens": settings.max_output_tokens,
             "response_format": response_format,
-            **model_config.kwargs,
+            **self.model_config.kwargs,
         }
-        if SETTINGS.seed is not None and is_openai:
-            kwargs["seed"] = SETTINGS.seed
-        return completion(**kwargs)
+        if settings.seed is not None and self.is_openai:
+            kwargs["seed"] = settings.seed
+        return kwargs
+
+    def parse_content(self, content: str) -> tuple[T | None, Exception | None]:
+        """Parse and validate an answer (fresh or cached), as `parse_json` does."""
+        return parse_json(content, self.model_class)
+
+    def parse(self, response: Any, raw_responses: list[str], cache_path: Path | None) -> T:
+        """Validate a completion; raise so the caller's retry loop tries again."""
+        content = response.choices[0].message.content or ""
+        raw_responses.append(content)
+
+        if not content:
+            raise RuntimeError("Empty response")
+
+        parsed, error = self.parse_content(content)
+        if parsed:
+            _write_cached_response(cache_path, content)
+            return parsed
+        if error:
+            raise error
+        raise ValidationError("Failed to parse", [])
+
+
+def _extraction_failure(
+    raw_responses: list[str], last_exc: Exception | None, debug_dir: Path | None
+) -> RuntimeError:
+    # Save debug info
+    if debug_dir:
+        debug_dir.mkdir(parents=True, exist_ok=True)
+        (debug_dir / "llm_responses.json").write_bytes(
+            orjson.dumps(raw_responses, option=orjson.OPT_INDENT_2)
+        )
+
+    error_msg = f"Failed after {len(raw_responses)} attempts: {last_exc}"
+    if raw_responses:
+        error_msg += f"\nLast response: {raw_responses[-1][:300]}"
+    return RuntimeError(error_msg)
+
+
+def _is_strict_rejection(exc: Exception) -> bool:
+    return "400" in str(exc) or "strict" in str(exc).lower()
+
 
-    raw_responses = []
+def build_plan(
+    model_class: type[T],
+    system_prompt: str,
+    user_prompt_template: str,
+    model: str | None = None,
+) -> ExtractionPlan[T]:
+    """Resolve the model and prompt template once for repeated extractions."""
+    return ExtractionPlan(model_class, system_prompt, user_prompt_template, model)
+
+
+def run_plan(plan: ExtractionPlan[T], text: str, debug_dir: Path | None = None) -> T:
+    """Extract structured data from `text` with a prepared plan."""
+    user_prompt = plan.user_prompt(text)
+    cache_path = plan.cache_path(user_prompt)
+    cached = _read_cached_response(cache_path, plan.parse_content)
+    if cached is not None:
+        return cached
+
+    messages = plan.messages(user_prompt)
+    raw_responses: list[str] = []
     last_exc = None
 
     for attempt in range(3):
         try:
-            if SETTINGS.json_strict and is_openai and openai_schema:
+            if plan.uses_strict_schema:
                 try:
-                    response = _call(
-                        {
-                            "type": "json_schema",
-                            "json_schema": {
-                                "name": model_class.__name__,
-                                "schema": openai_schema,
-                                "strict": True,
-                            },
-                        }
-                    )
+                    response = completion(**plan.kwargs(messages, plan.strict_format()))
                 except (BadRequestError, APIError) as e:
-                    if "400" in str(e) or "strict" in str(e).lower():
-                        logging.warning("Strict mode failed, using json_object mode")
-                        response = _call({"type": "json_object"})
-                    else:
+                    if not _is_strict_rejection(e):
                         raise
+                    logging.warning("Strict mode failed, using json_object mode")
+                    response = completion(**plan.kwargs(messages, {"type": "json_object"}))
             else:
                 # Use json_object mode for Ollama or when strict mode is disabled
-                response = _call({"type": "json_object"})
+                response = completion(**plan.kwargs(messages, {"type": "json_object"}))
+            return plan.parse(response, raw_responses, cache_path)
+
+        except (ValidationError, APIError, BadRequestError, RuntimeError) as e:
+            last_exc = e
+            if attempt < 2:
+                time.sleep(0.6 * (attempt + 1))
 
-            content = response.choices[0].message.content or ""
-            raw_responses.append(content)
+    raise _extraction_failure(raw_responses, last_exc, debug_dir)
 
-            if not content:
-                raise RuntimeError("Empty response")
 
-            parsed, error = parse_json(content, model_class)
-            if parsed:
-                return parsed
-            if error:
-                raise error
-            raise ValidationError("Failed to parse", [])
+async def arun_plan(plan: ExtractionPlan[T], text: str, debug_dir: Path | None = None) -> T:
+    """Async variant of `run_plan`; backoff sleeps do not block the loop."""
+    user_prompt = plan.user_prompt(text)
+    cache_path = plan.cache_path(user_prompt)
+    cached = _read_cached_response(cache_path, plan.parse_content)
+    if cached is not None:
+        return cached
+
+    messages = plan.messages(user_prompt)
+    raw_responses: list[str] = []
+    last_exc = None
+
+    for attempt in range(3):
+        try:
+            if plan.uses_strict_schema:
+                try:
+                    response = await acompletion(**plan.kwargs(messages, plan.strict_format()))
+                except (BadRequestError, APIError) as e:
+                    if not _is_strict_rejection(e):
+                        raise
+                    logging.warning("Strict mode failed, using json_object mode")
+                    response = await acompletion(**plan.kwargs(messages, {"type": "json_object"}))
+            else:
+                response = await acompletion(**plan.kwargs(messages, {"type": "json_object"}))
+            return plan.parse(response, raw_responses, cache_path)
 
         except (ValidationError, APIError, BadRequestError, RuntimeError) as e:
             last_exc = e
             if attempt < 2:
-                time.sleep(0.6 * (attempt + 1))
+                await asyncio.sleep(0.6 * (attempt + 1))
 
-    # Save debug info
-    if debug_dir:
-        debug_dir.mkdir(parents=True, exist_ok=True)
-        (debug_dir / "llm_responses.json").write_text(
-            json.dumps(raw_responses, indent=2, ensure_ascii=False), encoding="utf-8"
+    raise _extraction_failure(raw_responses, last_exc, debug_dir)
+
+
+def extract_structured_data(
+    text: str,
+    model_class: type[T],
+    system_prompt: str,
+    user_prompt_template: str,
+    model: str | None = None,
+    debug_dir: Path | None = None,
+) -> T:
+    """Extract structured data from text using LLM with schema validation."""
+    plan = build_plan(model_class, system_prompt, user_prompt_template, model)
+    return run_plan(plan, text, debug_dir)
+
+
+async def aextract_structured_data(
+    text: str,
+    model_class: type[T],
+    system_prompt: str,
+    user_prompt_template: str,
+    model: str | None = None,
+    debug_dir: Path | None = None,
+) -> T:
+    """Async variant of `extract_structured_data`; backoff sleeps do not block the loop."""
+    plan = build_plan(model_class, system_prompt, user_prompt_template, model)
+    return await arun_plan(plan, text, debug_dir)
+
+
+class _RequestPacer:
+    """Spaces request starts at least ``60 / rpm`` seconds apart."""
+
+    def __init__(self, rpm: float) -> None:
+        self._interval = 60.0 / rpm
+        self._next_start = 0.0
+
+    async def wait(self) -> None:
+        # Reserve the next slot before sleeping so concurrent waiters queue up behind it
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        self._next_start = start + self._interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+async def extract_batch_async(
+    texts: list[str],
+    model_class: type[T],
+    system_prompt: str,
+    user_prompt_template: str,
+    model: str | None = None,
+    concurrency: int = 16,
+    rpm: float | None = None,
+    debug_dir: Path | None = None,
+) -> list[T]:
+    """Extract every text concurrently, one LLM request per text.
+
+    At most `concurrency` requests are in flight, and when `rpm` is set request
+    starts are paced to stay under that many per minute. Returns one result per
+    text, in order; the first failure is raised.
+    """
+    plan = build_plan(model_class, system_prompt, user_prompt_template, model)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    pacer = _RequestPacer(rpm) if rpm else None
+
+    async def extract_one(text: str) -> T:
+        async with semaphore:
+            if pacer is not None:
+                await pacer.wait()
+            return await arun_plan(plan, text, debug_dir)
+
+    return list(await asyncio.gather(*(extract_one(text) for text in texts)))
+
+
+@functools.lru_cache(maxsize=128)
+def _batch_model(model_class: type[BaseModel]) -> type[BaseModel]:
+    """Wrapper model ``{"items": [model_class, ...]}``, built once per class."""
+    return create_model(
+        f"{model_class.__name__}Batch",
+        __config__=ConfigDict(extra="forbid"),
+        items=(list[model_class], ...),
+    )
+
+
+class _BatchExtractionPlan(ExtractionPlan):
+    """Plan for ``{"items": [...]}`` answers covering several documents at once."""
+
+    def __init__(
+        self,
+        item_class: type[BaseModel],
+        system_prompt: str,
+        user_prompt_template: str,
+        model: str | None = None,
+    ) -> None:
+        super().__init__(
+            _batch_model(item_class),
+            system_prompt + _BATCH_INSTRUCTIONS,
+            user_prompt_template,
+            model,
         )
+        self.item_class = item_class
 
-    error_msg = f"Failed after {len(raw_responses)} attempts: {last_exc}"
-    if raw_responses:
-        error_msg += f"\nLast response: {raw_responses[-1][:300]}"
-    raise RuntimeError(error_msg)
+    def parse_content(self, content: str) -> tuple[BaseModel | None, Exception | None]:
+        """Validate ``items``, dropping each item's nulls for fields with defaults.
+
+        `parse_json` only does that for the top-level object, and its single-key
+        unwrap would turn ``{"items": [...]}`` into a bare list.
+        """
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError:
+            # Fenced or prose-wrapped answers
+            return parse_json(content, self.model_class)
+        items = data.get("items") if isinstance(data, dict) else None
+        if not isinstance(items, list):
+            return parse_json(content, self.model_class)
+        try:
+            batch = {"items": [_drop_null_defaults(item, self.item_class) for item in items]}
+            return self.model_class.model_validate(batch), None
+        except ValidationError as exc:
+            return None, exc
+
+
+def extract_structured_data_batch(
+    texts: list[str],
+    model_class: type[T],
+    system_prompt: str,
+    user_prompt_template: str,
+    model: str | None = None,
+    batch_size: int = MAX_EXTRACTION_BATCH_SIZE,
+    debug_dir: Path | None = None,
+) -> list[T]:
+    """Extract structured data from several short texts, several documents per LLM call.
+
+    Texts are sent in groups of `batch_size` (capped at ``MAX_EXTRACTION_BATCH_SIZE``)
+    with a list-shaped schema. A group whose answer fails validation or has the wrong
+    number of items falls back to one `extract_structured_data` call per text.
+    Returns one result per text, in order.
+    """
+    batch_size = max(1, min(batch_size, MAX_EXTRACTION_BATCH_SIZE))
+    single_plan = build_plan(model_class, system_prompt, user_prompt_template, model)
+    batch_plan = _BatchExtractionPlan(model_class, system_prompt, user_prompt_template, model)
+    results: list[T] = []
+    for start in range(0, len(texts), batch_size):
+        group = texts[start : start + batch_size]
+        if len(group) > 1:
+            body = "\n\n".join(
+                f"<<DOCUMENT {index}>>\n{text}" for index, text in enumerate(group, 1)
+            )
+            try:
+                batch = run_plan(batch_plan, body, debug_dir)
+            except RuntimeError as exc:
+                logging.warning("Batched extraction failed, extracting one by one: %s", exc)
+            else:
+                if len(batch.items) == len(group):
+                    results.extend(batch.items)
+                    continue
+                logging.warning(
+                    "Batched extraction returned %d items for %d documents, extracting one by one",
+                    len(batch.items),
+                    len(group),
+                )
+        results.extend(run_plan(single_plan, text, debug_dir) for text in group)
+    return results
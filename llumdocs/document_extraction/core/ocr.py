@@ -2,15 +2,100 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import os
+import queue
 import re
+import threading
 import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from PIL import Image
 
-from ..ocr import build_ocr_engine
-from ..settings import SETTINGS
+from ..ocr import OcrEngine, OcrPage, build_ocr_engine
+from ..settings import get_settings
+
+# "Field: Value" runs, e.g. "Numero Delivery Note: ALB-54288 Fecha: 2025-11-27"
+_FIELD_RE = re.compile(r"[A-Za-zÁÉÍÓÚáéíóúÑñ\s/]+:\s*[^\s:]+(?:\s+[^\s:]+)*")
+_PIPE_RE = re.compile(r"\|")
+_MULTISPACE_RE = re.compile(r"\s{2,}")
+_BBOX_KEYS = ("l", "t", "r", "b")
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_ocr_langs(raw: str) -> tuple[str, ...]:
+    """Split the comma-separated ``ocr_langs`` setting, once per distinct value."""
+    return tuple(lang.strip() for lang in raw.split(",") if lang.strip())
+
+
+def _iter_pdf_pages(file_path: Path, page_count: int, dpi: int = 300) -> Iterator[Image.Image]:
+    """Rasterize a PDF one page at a time instead of holding every page in memory."""
+    from pdf2image import convert_from_path
+
+    for page_no in range(1, page_count + 1):
+        yield from convert_from_path(str(file_path), dpi=dpi, first_page=page_no, last_page=page_no)
+
+
+def _recognize_pages(
+    ocr_engine: OcrEngine,
+    images: Iterable[Image.Image],
+    page_count: int,
+    make_engine: Callable[[], OcrEngine],
+) -> list[OcrPage]:
+    """OCR `images` in page order, several pages at a time on multi-page documents.
+
+    `images` is consumed lazily: the next page is rasterized while earlier pages
+    are being recognized, and at most one page per worker (plus one) is held in
+    memory at a time.
+
+    Engines are not assumed to be thread-safe: each worker borrows one from a
+    small pool seeded with `ocr_engine`, so at most one extra engine is built
+    per additional worker.
+    """
+    workers = min(get_settings().ocr_workers or os.cpu_count() or 1, page_count)
+    if workers <= 1:
+        return [ocr_engine.recognize_page(img, page_idx) for page_idx, img in enumerate(images)]
+
+    idle: queue.SimpleQueue[OcrEngine] = queue.SimpleQueue()
+    idle.put(ocr_engine)
+
+    def recognize(page_idx: int, img: Image.Image) -> OcrPage:
+        try:
+            engine = idle.get_nowait()
+        except queue.Empty:
+            engine = make_engine()
+        try:
+            return engine.recognize_page(img, page_idx)
+        finally:
+            idle.put(engine)
+
+    in_flight = threading.BoundedSemaphore(workers + 1)
+    futures = []
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr") as pool:
+        for page_idx, img in enumerate(images):
+            in_flight.acquire()
+            future = pool.submit(recognize, page_idx, img)
+            future.add_done_callback(lambda _: in_flight.release())
+            futures.append(future)
+        return [future.result() for future in futures]
+
+
+def _engine_options(ocr_engine_name: str, page_count: int) -> dict[str, Any]:
+    """Extra engine options for a document of `page_count` pages.
+
+    Tesseract can OCR tall pages as concurrent strips; that only pays off when
+    pages are not already recognized in parallel (single-page documents or
+    ``ocr_workers=1``), otherwise the cores are busy anyway.
+    """
+    if ocr_engine_name != "tesseract":
+        return {}
+    if min(get_settings().ocr_workers or os.cpu_count() or 1, page_count) > 1:
+        return {}
+    return {"strips": min(os.cpu_count() or 1, 4)}
 
 
 def _extract_with_engine(file_path: Path, ocr_engine_name: str = "rapidocr") -> dict[str, Any]:
@@ -23,33 +108,38 @@ def _extract_with_engine(file_path: Path, ocr_engine_name: str = "rapidocr") ->
     Returns:
         Dictionary with OCR results in the expected format.
     """
-    from pdf2image import convert_from_path
-
-    # Parse languages from settings
-    ocr_langs = [lang.strip() for lang in SETTINGS.ocr_langs.split(",") if lang.strip()]
-    if not ocr_langs:
-        ocr_langs = ["eng"]
-
     # Use Docling for "docling" engine, otherwise use factory
     if ocr_engine_name == "docling":
         return _extract_with_docling(file_path)
 
-    # Build OCR engine
-    ocr_engine = build_ocr_engine(name=ocr_engine_name, langs=ocr_langs)
-
-    t0 = time.perf_counter()
-    pages = []
+    ocr_langs = list(_parse_ocr_langs(get_settings().ocr_langs)) or ["eng"]
 
     # Determine file type
     file_ext = file_path.suffix.lower()
     is_pdf = file_ext == ".pdf"
 
     if is_pdf:
-        # Convert PDF pages to images
-        pdf_images = convert_from_path(str(file_path), dpi=300)
-        for page_idx, img in enumerate(pdf_images):
-            page = ocr_engine.recognize_page(img, page_idx)
-            pages.append(page)
+        from pdf2image import pdfinfo_from_path
+
+        page_count = pdfinfo_from_path(str(file_path))["Pages"]
+    else:
+        page_count = 1
+
+    # Build OCR engine
+    engine_options = _engine_options(ocr_engine_name, page_count)
+    ocr_engine = build_ocr_engine(name=ocr_engine_name, langs=ocr_langs, **engine_options)
+
+    t0 = time.perf_counter()
+    pages = []
+
+    if is_pdf:
+        # Rasterize pages lazily so OCR overlaps with conversion and memory stays bounded
+        pages = _recognize_pages(
+            ocr_engine,
+            _iter_pdf_pages(file_path, page_count),
+            page_count,
+            lambda: build_ocr_engine(name=ocr_engine_name, langs=ocr_langs, **engine_options),
+        )
     else:
         # Process single image
         img = Image.open(file_path).convert("RGB")
@@ -71,26 +161,16 @@ def _extract_with_engine(file_path: Path, ocr_engine_name: str = "rapidocr") ->
     # Convert pages to result format
     full_text = "\n\n".join(p.text for p in pages)
 
-    # Convert words to ocr_items format
-    ocr_items = []
-    for page in pages:
-        for word in page.words:
-            ocr_items.append(
-                {
-                    "page_no": page.page_index + 1,  # Convert to 1-indexed
-                    "text": word.text,
-                    "bbox": {
-                        "l": word.bbox[0],
-                        "t": word.bbox[1],
-                        "r": word.bbox[2],
-                        "b": word.bbox[3],
-                        "x0": word.bbox[0],
-                        "y0": word.bbox[1],
-                        "x1": word.bbox[2],
-                        "y1": word.bbox[3],
-                    },
-                }
-            )
+    # Convert words to ocr_items format; l/t/r/b matches the keys Docling items use
+    ocr_items = [
+        {
+            "page_no": page.page_index + 1,  # Convert to 1-indexed
+            "text": word.text,
+            "bbox": dict(zip(_BBOX_KEYS, word.bbox, strict=True)),
+        }
+        for page in pages
+        for word in page.words
+    ]
 
     # Generate markdown (simple conversion from text)
     markdown = full_text.replace("\n\n", "\n\n")
@@ -118,15 +198,10 @@ def _extract_with_engine(file_path: Path, ocr_engine_name: str = "rapidocr") ->
     }
 
 
-def _extract_with_docling(file_path: Path) -> dict[str, Any]:
-    """Extract OCR using Docling (original implementation).
-
-    Args:
-        file_path: Path to the document file.
-
-    Returns:
-        Dictionary with OCR results in the expected format.
-    """
+def _build_docling_converter(
+    langs: tuple[str, ...], images_scale: float, max_pages: int | None, gpu: bool
+):
+    """Build a Docling converter for one configuration."""
     from docling.datamodel.base_models import InputFormat
     from docling.datamodel.pipeline_options import (
         AcceleratorDevice,
@@ -139,76 +214,107 @@ def _extract_with_docling(file_path: Path) -> dict[str, Any]:
     opts = PdfPipelineOptions()
     opts.do_ocr = True
     opts.do_table_structure = False
-    opts.images_scale = SETTINGS.images_scale
-    if SETTINGS.max_pages is not None:
-        opts.max_pages = SETTINGS.max_pages
+    opts.images_scale = images_scale
+    if max_pages is not None:
+        opts.max_pages = max_pages
 
     ocr_opts = OcrAutoOptions()
-    ocr_langs = [lang.strip() for lang in SETTINGS.ocr_langs.split(",") if lang.strip()]
-    if ocr_langs:
-        ocr_opts.lang = ocr_langs
+    if langs:
+        ocr_opts.lang = list(langs)
     opts.ocr_options = ocr_opts
 
-    accel = AcceleratorOptions(
-        device=AcceleratorDevice.GPU if SETTINGS.docling_gpu else AcceleratorDevice.CPU
-    )
+    accel = AcceleratorOptions(device=AcceleratorDevice.GPU if gpu else AcceleratorDevice.CPU)
 
-    converter = DocumentConverter(
+    return DocumentConverter(
         format_options={
             InputFormat.PDF: PdfFormatOption(pipeline_options=opts, accelerator_options=accel)
         }
     )
 
-    t0 = time.perf_counter()
-    result = converter.convert(str(file_path))
+
+@functools.lru_cache(maxsize=4)
+def _idle_docling_converters(
+    langs: tuple[str, ...], images_scale: float, max_pages: int | None, gpu: bool
+) -> queue.SimpleQueue:
+    """Converters of one configuration not currently converting a document."""
+    return queue.SimpleQueue()
+
+
+@contextlib.contextmanager
+def _borrow_docling_converter(
+    langs: tuple[str, ...], images_scale: float, max_pages: int | None, gpu: bool
+) -> Iterator[Any]:
+    """Lend a Docling converter for one configuration, reusing idle ones.
+
+    Building one loads the layout/OCR models and initializes the accelerator,
+    which takes seconds, so converters are reused across documents. Converters
+    are not assumed to be thread-safe: concurrent extractions each borrow their
+    own, and a new one is only built when every existing one is in use.
+    """
+    idle = _idle_docling_converters(langs, images_scale, max_pages, gpu)
+    try:
+        converter = idle.get_nowait()
+    except queue.Empty:
+        converter = _build_docling_converter(langs, images_scale, max_pages, gpu)
+    try:
+        yield converter
+    finally:
+        idle.put(converter)
+
+
+def _extract_with_docling(file_path: Path) -> dict[str, Any]:
+    """Extract OCR using Docling (original implementation).
+
+    Args:
+        file_path: Path to the document file.
+
+    Returns:
+        Dictionary with OCR results in the expected format.
+    """
+    settings = get_settings()
+    ocr_langs = _parse_ocr_langs(settings.ocr_langs)
+    with _borrow_docling_converter(
+        ocr_langs, settings.images_scale, settings.max_pages, settings.docling_gpu
+    ) as converter:
+        t0 = time.perf_counter()
+        result = converter.convert(str(file_path))
     doc = result.document
     total_runtime = time.perf_counter() - t0
 
     # Extract OCR items
     ocr_items = []
-    doc_dict = doc.export_to_dict()
 
     # Track page dimensions from bboxes if available
     page_dims: dict[int, tuple[int, int]] = {}
 
-    for text_item in doc_dict.get("texts", []):
-        if not isinstance(text_item, dict):
-            continue
-        text_content = text_item.get("text") or text_item.get("orig") or ""
+    # Walk Docling's item objects directly: export_to_dict() would serialize the whole tree
+    for text_item in doc.texts:
+        text_content = text_item.text or text_item.orig or ""
         if not text_content:
             continue
-        for prov in text_item.get("prov", []):
-            if isinstance(prov, dict) and prov.get("page_no") is not None:
-                page_no = int(prov["page_no"])
-                bbox = prov.get("bbox", {})
-
-                # Try to extract page dimensions from bbox if available
-                # Docling coordinates are in PDF points, so we can estimate page size
-                if bbox and page_no - 1 not in page_dims:
-                    # Use bbox coordinates to estimate page dimensions
-                    # This is approximate - Docling bboxes are in PDF points
-                    right = bbox.get("r") or bbox.get("x1", 0.0)
-                    bottom = bbox.get("b") or bbox.get("y1", 0.0)
-                    # Estimate page size (most PDFs are standard sizes)
-                    # We'll use a default if we can't determine from bboxes
-                    if right > 0 and bottom > 0:
-                        # Estimate based on largest bbox coordinates seen
-                        page_dims[page_no - 1] = (int(right * 1.1), int(bottom * 1.1))
-
-                item = {
-                    "page_no": page_no,
-                    "text": text_content.strip(),
-                    "bbox": bbox,
-                }
-                # Split large items into smaller ones for better visualization
-                split_items = _split_large_ocr_item(item)
-                ocr_items.extend(split_items)
+        for prov in text_item.prov:
+            page_no = prov.page_no
+            box = prov.bbox
+
+            # Try to extract page dimensions from bbox if available
+            # Docling coordinates are in PDF points, so we can estimate page size
+            if page_no - 1 not in page_dims and box.r > 0 and box.b > 0:
+                # Estimate based on the first bbox seen on the page (approximate)
+                page_dims[page_no - 1] = (int(box.r * 1.1), int(box.b * 1.1))
+
+            item = {
+                "page_no": page_no,
+                "text": text_content.strip(),
+                # Same plain-dict shape export_to_dict() produced, for this box only
+                "bbox": box.model_dump(mode="json", by_alias=True, exclude_none=True),
+            }
+            # Split large items into smaller ones for better visualization
+            ocr_items.extend(_split_large_ocr_item(item))
 
     # Build metadata (Docling uses PDF points, not pixels, so dimensions are approximate)
-    ocr_langs = [lang.strip() for lang in SETTINGS.ocr_langs.split(",") if lang.strip()]
     engine_config = {
-        "langs": ocr_langs,
-        "images_scale": SETTINGS.images_scale,
+        "langs": list(ocr_langs),
+        "images_scale": settings.images_scale,
     }
 
     return {
@@ -238,42 +344,61 @@ def _extract_with_docling(file_path: Path) -> dict[str, Any]:
     }
 
 
+def _stripped_span(text: str, start: int, end: int) -> tuple[str, int, int]:
+    """Return ``text[start:end]`` without surrounding whitespace, with adjusted offsets."""
+    segment = text[start:end]
+    stripped = segment.strip()
+    if not stripped:
+        return "", start, start
+    start += len(segment) - len(segment.lstrip())
+    return stripped, start, start + len(stripped)
+
+
+def _split_spans(separator: re.Pattern[str], text: str) -> list[tuple[str, int, int]]:
+    """Like ``separator.split(text)`` but keeping each stripped part's offsets."""
+    spans = []
+    start = 0
+    for match in separator.finditer(text):
+        spans.append(_stripped_span(text, start, match.start()))
+        start = match.end()
+    spans.append(_stripped_span(text, start, len(text)))
+    return spans
+
+
 def _split_large_ocr_item(item: dict[str, Any]) -> list[dict[str, Any]]:
     """Split large OCR items containing multiple fields into separate items."""
     text = item.get("text", "").strip()
-    bbox = item.get("bbox", {})
-    page_no = item.get("page_no", 1)
 
     # Don't split if text is short
     if len(text) < 30:
         return [item]
 
-    # Check if text contains multiple fields (colons, pipes, or common patterns)
-    colon_count = text.count(":")
-    pipe_count = text.count("|")
+    # Need at least 2 colons or 1 pipe to consider splitting; find() stops at the
+    # first hit, so plain text is rejected without counting every separator
+    has_pipe = "|" in text
+    if not has_pipe:
+        first_colon = text.find(":")
+        if first_colon < 0 or text.find(":", first_colon + 1) < 0:
+            return [item]
 
-    # Need at least 2 colons or 1 pipe to consider splitting
-    if colon_count < 2 and pipe_count == 0:
-        return [item]
+    bbox = item.get("bbox", {})
+    page_no = item.get("page_no", 1)
 
-    # Split by common separators
-    parts = []
+    # Split by common separators into (part, start, end) spans of the original text,
+    # so each part's position is known without searching for it again
+    parts: list[tuple[str, int, int]] = []
 
     # First, try splitting by "|" if present (e.g., "Field|Value Field|Value")
-    if pipe_count > 0:
-        parts = [p.strip() for p in text.split("|") if p.strip()]
-    elif colon_count >= 2:
+    if has_pipe:
+        parts = [span for span in _split_spans(_PIPE_RE, text) if span[0]]
+    else:
         # Split by field-value patterns: "Field: Value" followed by space and next field
-        # Pattern matches: "FieldName: Value" (where Value can contain spaces)
-        # Look for patterns like "Numero Delivery Note: ALB-54288 Fecha: 2025-11-27"
-        pattern = r"([A-Za-zÁÉÍÓÚáéíóúÑñ\s/]+:\s*[^\s:]+(?:\s+[^\s:]+)*)"
-        matches = re.findall(pattern, text)
+        matches = [_stripped_span(text, m.start(), m.end()) for m in _FIELD_RE.finditer(text)]
         if len(matches) > 1:
-            parts = [m.strip() for m in matches if m.strip()]
+            parts = [span for span in matches if span[0]]
         else:
             # Fallback: split by multiple consecutive spaces (likely field separators)
-            parts = re.split(r"\s{2,}", text)
-            parts = [p.strip() for p in parts if p.strip() and len(p.strip()) > 3]
+            parts = [span for span in _split_spans(_MULTISPACE_RE, text) if len(span[0]) > 3]
 
     # If we couldn't split meaningfully, return original
     if len(parts) <= 1:
@@ -290,24 +415,16 @@ def _split_large_ocr_item(item: dict[str, Any]) -> list[dict[str, Any]]:
 
     # Create split items with proportional bounding boxes
     split_items = []
-    current_pos = 0
-
-    for part in parts:
-        if not part.strip():
-            continue
-
-        # Find position of this part in the original text
-        part_start = text.find(part, current_pos)
-        if part_start == -1:
-            part_start = current_pos
-        part_end = part_start + len(part)
-        current_pos = max(part_end, current_pos + 1)  # Avoid infinite loops
-
+    total_length = len(text)
+    num_parts = len(parts)
+    # If we have many parts, they might be on different lines
+    multi_line = num_parts > 3 and bbox_height > bbox_width * 0.5
+    if multi_line:
+        lines_estimate = min(num_parts, max(1, int(bbox_height / (bbox_width * 0.1))))
+        line_height = bbox_height / lines_estimate
+
+    for part_index, (part, part_start, part_end) in enumerate(parts):
         # Calculate proportional bounding box based on text position
-        total_length = len(text)
-        if total_length == 0:
-            continue
-
         part_start_ratio = part_start / total_length
         part_end_ratio = part_end / total_length
 
@@ -315,14 +432,8 @@ def _split_large_ocr_item(item: dict[str, Any]) -> list[dict[str, Any]]:
         part_left = left + (bbox_width * part_start_ratio)
         part_right = left + (bbox_width * part_end_ratio)
 
-        # For vertical positioning, estimate based on number of parts
-        # If we have many parts, they might be on different lines
-        num_parts = len(parts)
-        if num_parts > 3 and bbox_height > bbox_width * 0.5:
+        if multi_line:
             # Likely multi-line: distribute vertically
-            part_index = parts.index(part)
-            lines_estimate = min(num_parts, max(1, int(bbox_height / (bbox_width * 0.1))))
-            line_height = bbox_height / lines_estimate
             line_num = min(part_index, lines_estimate - 1)
             part_top = top + (line_num * line_height)
             part_bottom = part_top + line_height
@@ -334,7 +445,7 @@ def _split_large_ocr_item(item: dict[str, Any]) -> list[dict[str, Any]]:
         split_items.append(
             {
                 "page_no": page_no,
-                "text": part.strip(),
+                "text": part,
                 "bbox": {
                     "l": part_left,
                     "t": part_top,
@@ -25,6 +25,8 @@ from .common import (
 from .image import annotate_image_as_pdf
 from .pdf import annotate_pdf as _annotate_pdf_pure
 
+IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".tif"})
+
 
 def annotate_pdf(
     input_pdf: Path,
@@ -36,6 +38,7 @@ def annotate_pdf(
     redact: bool = False,
     report: Any | None = None,
     ocr_metadata: dict[str, Any] | None = None,
+    render_dpi: int | None = None,
 ) -> Path:
     """Annotate a PDF or image with OCR bounding boxes and optional legend panel.
 
@@ -56,6 +59,7 @@ def annotate_pdf(
         redact: Whether to apply redaction to legend (requires redact_fn).
         report: Optional Pydantic model with extracted fields to tag on bounding boxes.
         ocr_metadata: Optional OCR metadata with page dimensions for accurate coordinate scaling.
+        render_dpi: Optional lower resolution to render PDF pages at (ignored for images).
 
     Returns:
         Path to the created output PDF file.
@@ -67,8 +71,7 @@ def annotate_pdf(
         >>> annotate_pdf("input.pdf", ocr_items, "output.pdf")
     """
     # Check if input is an image file
-    image_extensions = {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".tif"}
-    is_image = input_pdf.suffix.lower() in image_extensions
+    is_image = input_pdf.suffix.lower() in IMAGE_EXTENSIONS
 
     # Create field mapping if report is provided
     field_mapping = None
@@ -99,6 +102,7 @@ def annotate_pdf(
         redact=redact,
         field_mapping=field_mapping,
         ocr_metadata=ocr_metadata,
+        render_dpi=render_dpi,
     )
 
 
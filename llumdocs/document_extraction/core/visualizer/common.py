@@ -2,11 +2,42 @@
 
 from __future__ import annotations
 
+import bisect
+import functools
+import itertools
+import logging
 import re
+from collections.abc import Callable
 from typing import Any
 
+import PIL
 from PIL import Image, ImageDraw, ImageFont
 
+# One pass over the text: emails, then IBANs (2 letters + 2 digits + 11-30 alphanumeric),
+# then Spanish tax IDs (NIF/CIF); the first alternative that matches at a position wins
+_REDACT_RE = re.compile(
+    r"(?P<email>\b[\w\.-]{1,64}@[\w\.-]{1,252}\.\w{2,}\b)"
+    r"|(?P<iban>\b[A-Z]{2}\d{2}[A-Z0-9]{11,30}\b)"
+    r"|(?P<taxid>\b(?:\d{8}[A-Z]|[A-Z]\d{8})\b)",
+    re.I,
+)
+_REDACT_LABELS = {
+    "email": "••REDACTED-EMAIL••",
+    "iban": "••REDACTED-IBAN••",
+    "taxid": "••REDACTED-TAXID••",
+}
+
+# Below this many fields, pairwise substring checks beat building an Aho-Corasick automaton
+_AHOCORASICK_MIN_FIELDS = 24
+
+# Pillow-SIMD replaces Pillow in place (same PIL package, ".postN" versions), so drawing,
+# pasting and JPEG encoding speed up without code changes; record which build is in use
+logging.getLogger(__name__).debug(
+    "Visualizer using Pillow %s%s",
+    PIL.__version__,
+    " (Pillow-SIMD)" if ".post" in PIL.__version__ else "",
+)
+
 
 def normalize_text(text: str) -> str:
     """Normalize text for matching (lowercase, remove extra whitespace).
@@ -20,12 +51,15 @@ def normalize_text(text: str) -> str:
     if not text:
         return ""
     # Convert to lowercase, remove extra whitespace
-    return re.sub(r"\s+", " ", str(text).strip().lower())
+    return " ".join(str(text).lower().split())
 
 
+@functools.lru_cache(maxsize=32)
 def get_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
     """Get a font with the specified size, falling back to default if unavailable.
 
+    Fonts are loaded once per size and shared; drawing does not mutate them.
+
     Args:
         size: Font size in points.
 
@@ -38,31 +72,45 @@ def get_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
         return ImageFont.load_default()
 
 
+@functools.lru_cache(maxsize=4096)
+def _text_bbox(
+    font: ImageFont.FreeTypeFont | ImageFont.ImageFont, text: str
+) -> tuple[int, int, int, int]:
+    """``font.getbbox(text)``, memoized: OCR boxes repeat the same labels and tokens."""
+    return font.getbbox(text)
+
+
+@functools.cache
+def _legend_fonts() -> tuple[ImageFont.FreeTypeFont | ImageFont.ImageFont, ...]:
+    """Title and body fonts of the legend panel, resolved once."""
+    return get_font(20), get_font(14)
+
+
 def overlay_legend(
     img: Image.Image, lines: list[str], title: str = "Extracted Fields"
 ) -> Image.Image:
     """Overlay a semi-transparent legend panel on the right side of an image.
 
+    The panel is blended into `img` in place, without an RGBA copy of the page.
+
     Args:
-        img: PIL Image to overlay the legend on.
+        img: RGB PIL Image to overlay the legend on.
         lines: List of text lines to display in the legend.
         title: Title text for the legend panel.
 
     Returns:
-        New Image with legend overlay applied.
+        The same Image, with legend overlay applied.
     """
-    img = img.convert("RGBA")
-    draw = ImageDraw.Draw(img)
     width, height = img.size
 
     panel_width = int(width * 0.4)
     panel_x = width - panel_width
 
-    overlay = Image.new("RGBA", (panel_width, height), (0, 0, 0, 180))
-    img.paste(overlay, (panel_x, 0), overlay)
+    # Black at alpha 180: the constant mask blends the panel exactly as an RGBA paste would
+    img.paste((0, 0, 0), (panel_x, 0, width, height), Image.new("L", (panel_width, height), 180))
+    draw = ImageDraw.Draw(img)
 
-    font_title = get_font(20)
-    font_body = get_font(14)
+    font_title, font_body = _legend_fonts()
 
     x, y = panel_x + 15, 15
     draw.text((x, y), title, fill=(255, 255, 255), font=font_title)
@@ -120,12 +168,7 @@ def redact_sensitive_info(text: str) -> str:
     Returns:
         Text with sensitive information replaced by redaction markers.
     """
-    # Redact emails
-    text = re.sub(r"\b[\w\.-]+@[\w\.-]+\.\w{2,}\b", "••REDACTED-EMAIL••", text)
-    # Redact IBAN (2 letters + 2 digits + 11-30 alphanumeric)
-    text = re.sub(r"\b[A-Z]{2}\d{2}[A-Z0-9]{11,30}\b", "••REDACTED-IBAN••", text, flags=re.I)
-    # Redact Spanish tax IDs
-    return re.sub(r"\b(\d{8}[A-Z]|[A-Z]\d{8})\b", "••REDACTED-TAXID••", text, flags=re.I)
+    return _REDACT_RE.sub(lambda match: _REDACT_LABELS[match.lastgroup], text)
 
 
 def map_fields_to_ocr_items(report: Any, ocr_items: list[dict[str, Any]]) -> dict[int, str]:
@@ -162,31 +205,104 @@ def map_fields_to_ocr_items(report: Any, ocr_items: list[dict[str, Any]]) -> dic
         if normalized_value:
             normalized_fields[field_name] = normalized_value
 
-    # Match OCR items to field values
+    # Match OCR items to field values. Each field tags at most one item, so matched
+    # fields leave the candidate set and the scan stops once every field is placed.
+    pending_fields = normalized_fields
+    match_field = _field_matcher(normalized_fields)
     for idx, ocr_item in enumerate(ocr_items):
+        if not pending_fields:
+            break
         ocr_text = ocr_item.get("text", "").strip()
         if not ocr_text:
             continue
 
         normalized_ocr = normalize_text(ocr_text)
 
-        # Try to match against field values
-        for field_name, normalized_value in normalized_fields.items():
-            # Check if OCR text contains the field value or vice versa
-            # Use a threshold to handle partial matches
+        if match_field is not None:
+            field_name = match_field(normalized_ocr, pending_fields)
+            if field_name is not None:
+                field_mapping[idx] = field_name
+                del pending_fields[field_name]
+            continue
+
+        # Check if OCR text contains the field value or vice versa (covers exact matches)
+        for field_name, normalized_value in pending_fields.items():
             if normalized_value in normalized_ocr or normalized_ocr in normalized_value:
-                # Prefer longer matches or exact matches
-                if field_name not in field_mapping.values():
-                    field_mapping[idx] = field_name
-                    break
-            # Also check for exact match after normalization
-            elif normalized_ocr == normalized_value:
                 field_mapping[idx] = field_name
+                del pending_fields[field_name]
                 break
 
     return field_mapping
 
 
+@functools.cache
+def _ahocorasick():
+    """Import pyahocorasick once, or return None if it is not installed."""
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    return ahocorasick
+
+
+def _field_matcher(
+    normalized_fields: dict[str, str],
+) -> Callable[[str, dict[str, str]], str | None] | None:
+    """Build a matcher finding the first pending field an OCR text matches, in one scan.
+
+    Field values found inside the OCR text come from an Aho-Corasick automaton over all
+    values; OCR texts found inside a field value come from a search of the joined values.
+    Ties go to the earliest field, as in the pairwise loop of `map_fields_to_ocr_items`.
+
+    Returns:
+        The matcher, or None when there are too few fields to pay for building it or
+        pyahocorasick is not installed.
+    """
+    ahocorasick = _ahocorasick()
+    if len(normalized_fields) < _AHOCORASICK_MIN_FIELDS or ahocorasick is None:
+        return None
+
+    order = {field_name: rank for rank, field_name in enumerate(normalized_fields)}
+    automaton = ahocorasick.Automaton()
+    for field_name, normalized_value in normalized_fields.items():
+        names = automaton.get(normalized_value, None)
+        if names is None:
+            automaton.add_word(normalized_value, [field_name])
+        else:
+            names.append(field_name)
+    automaton.make_automaton()
+
+    # Values are joined by NUL, so a NUL-free OCR text only matches within a single value
+    joined = "\0".join(normalized_fields.values())
+    starts = list(itertools.accumulate((len(v) + 1 for v in normalized_fields.values()), initial=0))
+    names_by_position = list(normalized_fields)
+
+    def match(normalized_ocr: str, pending_fields: dict[str, str]) -> str | None:
+        if "\0" in normalized_ocr:
+            # Could match across values in `joined`: check this text pairwise instead
+            candidates = (
+                field_name
+                for field_name, normalized_value in pending_fields.items()
+                if normalized_value in normalized_ocr or normalized_ocr in normalized_value
+            )
+        else:
+            candidates = [
+                field_name
+                for _end, names in automaton.iter(normalized_ocr)
+                for field_name in names
+                if field_name in pending_fields
+            ]
+            position = joined.find(normalized_ocr)
+            while position != -1:
+                field_name = names_by_position[bisect.bisect_right(starts, position) - 1]
+                if field_name in pending_fields:
+                    candidates.append(field_name)
+                position = joined.find(normalized_ocr, position + 1)
+        return min(candidates, key=order.__getitem__, default=None)
+
+    return match
+
+
 def extract_ocr_dimensions(
     ocr_metadata: dict[str, Any] | None,
 ) -> dict[int, tuple[int, int]]:
@@ -296,12 +412,12 @@ def draw_bbox_with_annotations(
         tag_font = get_font(8)
 
     # Draw bounding box
-    draw.rectangle([l_px, t_px, r_px, b_px], outline=(0, 200, 0), width=2)
+    draw.rectangle((l_px, t_px, r_px, b_px), outline=(0, 200, 0), width=2)
 
     # Draw field tag if provided
     if field_name:
         tag_text = field_name
-        tag_bbox = tag_font.getbbox(tag_text)
+        tag_bbox = _text_bbox(tag_font, tag_text)
         tag_width = tag_bbox[2] - tag_bbox[0]
         tag_height = tag_bbox[3] - tag_bbox[1]
 
@@ -310,12 +426,12 @@ def draw_bbox_with_annotations(
         tag_y = max(0, t_px - tag_height - 4)
 
         # Draw tag background
-        tag_bg = [
+        tag_bg = (
             tag_x - 2,
             tag_y - 2,
             tag_x + tag_width + 4,
             tag_y + tag_height + 2,
-        ]
+        )
         draw.rectangle(tag_bg, fill=(255, 200, 0))  # Yellow/orange background
         draw.rectangle(tag_bg, outline=(200, 150, 0), width=1)
 
@@ -323,12 +439,13 @@ def draw_bbox_with_annotations(
         draw.text((tag_x, tag_y), tag_text, fill=(0, 0, 0), font=tag_font)
 
     # Draw OCR text inside bounding box
-    text_bbox = font.getbbox(ocr_text[:30])
-    text_bg = [
+    label = ocr_text[:30]
+    text_bbox = _text_bbox(font, label)
+    text_bg = (
         l_px + 2,
         t_px + 2,
         l_px + text_bbox[2] + 4,
         t_px + text_bbox[3] + 4,
-    ]
+    )
     draw.rectangle(text_bg, fill=(255, 255, 255))
-    draw.text((l_px + 3, t_px + 3), ocr_text[:30], fill=(0, 0, 0), font=font)
+    draw.text((l_px + 3, t_px + 3), label, fill=(0, 0, 0), font=font)
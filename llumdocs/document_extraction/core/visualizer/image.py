@@ -12,7 +12,7 @@ from typing import Any
 
 from PIL import Image, ImageDraw
 
-from ...settings import SETTINGS
+from ...settings import get_settings
 from .common import (
     clip_bbox,
     draw_bbox_with_annotations,
@@ -58,7 +58,7 @@ def annotate_image_as_pdf(
 
     # For images, use Docling's OCR DPI to match coordinate space
     # Docling uses 72 * images_scale DPI for OCR
-    docling_dpi = int(round(72.0 * SETTINGS.images_scale))
+    docling_dpi = int(round(72.0 * get_settings().images_scale))
     dpi = dpi or docling_dpi
 
     # Load image
@@ -70,16 +70,25 @@ def annotate_image_as_pdf(
     ocr_page_dims = extract_ocr_dimensions(ocr_metadata)
     ocr_w, ocr_h = ocr_page_dims.get(0, (None, None))
 
-    # Get OCR items for page 1 (images are single page) and add indices
-    page_items = []
-    for item_index, item in enumerate(ocr_items):
-        if item.get("page_no", 1) == 1:
-            item["_index"] = item_index
-            page_items.append(item)
+    # Get OCR items for page 1 (images are single page) with their indices
+    page_items = [
+        (item_index, item)
+        for item_index, item in enumerate(ocr_items)
+        if item.get("page_no", 1) == 1
+    ]
+
+    # The coordinate space is a property of the page: decide it once, not per item.
+    # The origin stays per item, since split OCR items may carry one the others lack.
+    if ocr_w and ocr_h and (ocr_w != img_width or ocr_h != img_height):
+        # Bboxes are in OCR pixel coordinates (ocr_w x ocr_h)
+        # Scale to image coordinates (img_width x img_height)
+        scale = (img_width / float(ocr_w), img_height / float(ocr_h))
+    else:
+        scale = None
 
     font = get_font(9)
     tag_font = get_font(8)
-    for item in page_items:
+    for item_idx, item in page_items:
         ocr_text = item.get("text", "").strip()
         if not ocr_text:
             continue
@@ -91,24 +100,18 @@ def annotate_image_as_pdf(
         # Extract coordinates
         left, top, right, bottom = extract_bbox_coordinates(bbox)
 
-        # If OCR dimensions are available and differ from image size, scale bboxes
-        if ocr_w and ocr_h and (ocr_w != img_width or ocr_h != img_height):
-            # Bboxes are in OCR pixel coordinates (ocr_w x ocr_h)
-            # Scale to image coordinates (img_width x img_height)
-            sx = img_width / float(ocr_w)
-            sy = img_height / float(ocr_h)
+        if scale is not None:
+            sx, sy = scale
             left = left * sx
             top = top * sy
             right = right * sx
             bottom = bottom * sy
-        else:
+        elif bbox.get("coord_origin") == "BOTTOMLEFT":
             # Bboxes are already in image pixel space
-            # Convert BOTTOMLEFT to TOPLEFT if needed
-            if bbox.get("coord_origin") == "BOTTOMLEFT":
-                # In BOTTOMLEFT: y increases upward, so flip Y
-                top, bottom = img_height - top, img_height - bottom
-                # After flip, ensure top <= bottom (top should have smaller y than bottom)
-                top, bottom = min(top, bottom), max(top, bottom)
+            # In BOTTOMLEFT: y increases upward, so flip Y
+            top, bottom = img_height - top, img_height - bottom
+            # After flip, ensure top <= bottom (top should have smaller y than bottom)
+            top, bottom = min(top, bottom), max(top, bottom)
 
         # Clip and validate bbox
         bbox_px = clip_bbox(left, top, right, bottom, img_width, img_height)
@@ -118,10 +121,7 @@ def annotate_image_as_pdf(
         l_px, t_px, r_px, b_px = bbox_px
 
         # Get field name if mapping exists
-        item_idx = item.get("_index")
-        field_name = None
-        if field_mapping and item_idx is not None:
-            field_name = field_mapping.get(item_idx)
+        field_name = field_mapping.get(item_idx) if field_mapping else None
 
         # Draw bbox with annotations
         draw_bbox_with_annotations(
@@ -135,7 +135,7 @@ def annotate_image_as_pdf(
         img = overlay_legend(img, lines)
 
     # Save as PDF
-    annotated_pages = [img.convert("RGB")]
+    annotated_pages = [img]
     if annotated_pages:
         annotated_pages[0].save(
             output_pdf,
@@ -143,6 +143,9 @@ def annotate_image_as_pdf(
             save_all=True,
             append_images=annotated_pages[1:],
             resolution=dpi,
+            # RGB pages are embedded as JPEG: optimized tables shrink them losslessly
+            quality=get_settings().jpeg_quality,
+            optimize=True,
         )
 
     return Path(output_pdf)
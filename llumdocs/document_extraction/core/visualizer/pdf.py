@@ -6,16 +6,22 @@ boxes and optional legend panels showing extracted information.
 
 from __future__ import annotations
 
+import functools
+import io
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import ExitStack
+from multiprocessing import get_context
 from pathlib import Path
 from typing import Any
 
 import fitz  # PyMuPDF
-from PIL import Image
+import numpy as np
+from PIL import Image, ImageDraw
 
-from ...settings import SETTINGS
+from ...settings import get_settings
 from .common import (
-    clip_bbox,
     draw_bbox_with_annotations,
     extract_bbox_coordinates,
     extract_ocr_dimensions,
@@ -24,6 +30,167 @@ from .common import (
 )
 
 
+def _write_page(out_doc: fitz.Document, jpeg: bytes, size: tuple[int, int], dpi: float) -> None:
+    """Append a JPEG page sized ``pixels * 72 / dpi``, as PIL's PDF writer does."""
+    width, height = size
+    page = out_doc.new_page(width=width * 72.0 / dpi, height=height * 72.0 / dpi)
+    page.insert_image(page.rect, stream=jpeg)
+
+
+def _page_boxes_px(
+    bboxes: list[dict[str, Any]],
+    ocr_size: tuple[int, int] | None,
+    pix_size: tuple[int, int],
+    page_size: tuple[float, float],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Map one page's OCR bboxes to clipped pixel boxes, all boxes at once.
+
+    Args:
+        bboxes: Bounding box dictionaries of the page's OCR items.
+        ocr_size: OCR (width, height) in pixels, if known from metadata.
+        pix_size: Rendered page (width, height) in pixels.
+        page_size: PDF page (width, height) in points.
+
+    Returns:
+        (N, 4) integer (left, top, right, bottom) pixel boxes, and a mask of the boxes
+        that are still non-empty after clipping to the rendered page.
+    """
+    coords = np.array([extract_bbox_coordinates(bbox) for bbox in bboxes], dtype=np.float64)
+    coords = coords.reshape(-1, 4)
+    pix_w, pix_h = pix_size
+    page_w_pt, page_h_pt = page_size
+
+    if ocr_size is not None:
+        # Bboxes are in OCR pixel coordinates: scale to the rendered image, unless the
+        # page was rendered at exactly the OCR size (the usual case)
+        if tuple(ocr_size) != tuple(pix_size):
+            sx = pix_w / float(ocr_size[0])
+            sy = pix_h / float(ocr_size[1])
+            coords *= (sx, sy, sx, sy)
+    else:
+        # Fallback to heuristic detection (for Docling or other engines)
+        # Check if bbox coordinates are in pixel space (from RapidOCR/Tesseract)
+        # vs PDF points (from Docling)
+        left, top, right, bottom = coords.T
+        max_coord = np.maximum.reduce([right, bottom, np.abs(left), np.abs(top)])
+        avg_coord = (np.abs(left) + np.abs(top) + right + bottom) / 4.0
+        max_page_dim = max(page_w_pt, page_h_pt)
+        in_pixels = (max_coord > max_page_dim * 1.2) | (avg_coord > max_page_dim * 1.1)
+        # Assume 300 DPI pixels and convert them to PDF points (72 / 300)
+        coords[in_pixels] *= 72.0 / 300.0
+
+        # Handle coordinate system conversion (BOTTOMLEFT to TOPLEFT)
+        if page_h_pt > 0:
+            flip = np.array([bbox.get("coord_origin") == "BOTTOMLEFT" for bbox in bboxes])
+            if flip.any():
+                coords[np.ix_(flip, [1, 3])] = page_h_pt - coords[np.ix_(flip, [1, 3])]
+
+        # Convert PDF points to pixels
+        scale_x = pix_w / page_w_pt
+        scale_y = pix_h / page_h_pt
+        coords *= (scale_x, scale_y, scale_x, scale_y)
+
+    # Same clipping and validation as clip_bbox, for every box at once
+    np.clip(coords[:, 0::2], 0, pix_w - 1, out=coords[:, 0::2])
+    np.clip(coords[:, 1::2], 0, pix_h - 1, out=coords[:, 1::2])
+    valid = (coords[:, 2] > coords[:, 0]) & (coords[:, 3] > coords[:, 1])
+    return np.rint(coords).astype(np.int64), valid
+
+
+@functools.lru_cache(maxsize=1)
+def _render_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the page-rendering pool shared by all calls, started on first use.
+
+    Workers are spawned rather than forked, so they cannot inherit locks held by
+    other threads of a server process; each one only imports this module's
+    dependencies, once, and then serves pages for every later request.
+    """
+    return ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"))
+
+
+def _render_page(
+    input_pdf: str,
+    page_idx: int,
+    page_items: list[tuple[dict[str, Any], str, str | None]],
+    ocr_size: tuple[int, int] | None,
+    dpi: int,
+    render_scale: float,
+    legend_lines: list[str] | None,
+) -> tuple[bytes, tuple[int, int]]:
+    """Render and annotate one PDF page.
+
+    Runs in a worker process, so it only takes picklable arguments and reopens the PDF.
+
+    Args:
+        input_pdf: Path to the input PDF file.
+        page_idx: 0-based index of the page to render.
+        page_items: (bbox, text, field name or None) for each OCR item drawn on the page.
+        ocr_size: OCR (width, height) in pixels of this page, if known from metadata.
+        dpi: Resolution for rendering when the OCR size is unknown.
+        render_scale: Factor (at most 1) applied to the rendering resolution.
+        legend_lines: Legend text lines to overlay on the page, if any.
+
+    Returns:
+        The annotated page as JPEG bytes, and its (width, height) in pixels.
+    """
+    with fitz.open(input_pdf) as doc:
+        page = doc[page_idx]
+        page_w_pt = float(page.rect.width)
+        page_h_pt = float(page.rect.height)
+
+        # If we have OCR dimensions, render at that exact resolution
+        # Otherwise use the specified DPI
+        if ocr_size:
+            # Calculate zoom to match OCR dimensions exactly
+            zoom_x = ocr_size[0] / page_w_pt
+            zoom_y = ocr_size[1] / page_h_pt
+            # Use average zoom for uniform scaling, but ensure we get close to target dimensions
+            zoom = (zoom_x + zoom_y) / 2.0
+            # If the rendered size doesn't match OCR dimensions exactly, we'll scale bboxes
+        else:
+            zoom = dpi / 72.0
+        # Boxes are mapped from the rendered pixmap size, so they follow a reduced zoom
+        zoom *= render_scale
+        pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+
+    # Read the pixmap's memory directly: ``pix.samples`` would first copy it into a bytes object
+    img = Image.frombuffer(
+        "RGB", (pix.width, pix.height), pix.samples_mv, "raw", "RGB", pix.stride, 1
+    )
+    draw = ImageDraw.Draw(img)
+
+    # Map every box of the page to pixels in one pass
+    boxes_px, valid = _page_boxes_px(
+        [bbox for bbox, _text, _field in page_items],
+        ocr_size,
+        (pix.width, pix.height),
+        (page_w_pt, page_h_pt),
+    )
+
+    font = get_font(9)
+    tag_font = get_font(8)
+    for (_bbox, ocr_text, field_name), bbox_px, is_valid in zip(
+        page_items, boxes_px.tolist(), valid.tolist(), strict=True
+    ):
+        if not is_valid:
+            continue
+
+        l_px, t_px, r_px, b_px = bbox_px
+
+        # Draw bbox with annotations
+        draw_bbox_with_annotations(
+            draw, l_px, t_px, r_px, b_px, ocr_text, field_name, font, tag_font
+        )
+
+    if legend_lines is not None:
+        img = overlay_legend(img, legend_lines)
+
+    buffer = io.BytesIO()
+    # Optimized Huffman tables make pages ~20% smaller without changing a pixel
+    img.save(buffer, "JPEG", quality=get_settings().jpeg_quality, optimize=True)
+    return buffer.getvalue(), img.size
+
+
 def annotate_pdf(
     input_pdf: Path,
     ocr_items: list[dict[str, Any]],
@@ -34,11 +201,13 @@ def annotate_pdf(
     redact: bool = False,
     field_mapping: dict[int, str] | None = None,
     ocr_metadata: dict[str, Any] | None = None,
+    render_dpi: int | None = None,
 ) -> Path:
     """Annotate a PDF with OCR bounding boxes and optional legend panel.
 
     This function:
-    - Renders each page of the PDF as an image
+    - Renders each page of the PDF as an image, several pages at a time in worker processes
+      (pages with nothing to draw are copied unchanged)
     - Draws green bounding boxes around OCR-detected text
     - Optionally displays field tags above bounding boxes for LLM-detected fields
     - Optionally adds a legend panel on the first page
@@ -54,6 +223,8 @@ def annotate_pdf(
         redact: Whether to apply redaction to legend (requires redact_fn).
         field_mapping: Optional mapping from OCR item index to field name for tagging.
         ocr_metadata: Optional OCR metadata with page dimensions for accurate coordinate scaling.
+        render_dpi: Optional lower resolution to render pages at, e.g. 150 for on-screen
+            viewing; pages keep their size but have fewer pixels to draw and encode.
 
     Returns:
         Path to the created output PDF file.
@@ -64,143 +235,75 @@ def annotate_pdf(
         ... ]
         >>> annotate_pdf("input.pdf", ocr_items, "output.pdf")
     """
-    dpi = dpi or SETTINGS.dpi
+    dpi = dpi or get_settings().dpi
+    # Rendering below `dpi` shrinks the pixmaps, never the pages they are written to
+    render_scale = min(render_dpi, dpi) / dpi if render_dpi else 1.0
+    page_dpi = dpi * render_scale
     output_pdf.parent.mkdir(parents=True, exist_ok=True)
 
-    by_page: dict[int, list[dict[str, Any]]] = {}
+    # Items keep their index in `ocr_items` for the field mapping lookup
+    by_page: dict[int, list[tuple[int, dict[str, Any]]]] = {}
     for item_index, item in enumerate(ocr_items):
         page_no = int(item.get("page_no", 1))
-        by_page.setdefault(page_no, []).append(item)
-        # Store index in item for field mapping lookup
-        item["_index"] = item_index
+        by_page.setdefault(page_no, []).append((item_index, item))
 
-    doc = fitz.open(input_pdf)
-    annotated_pages: list[Image.Image] = []
+    # Extract OCR dimensions from metadata if available
+    ocr_page_dims = extract_ocr_dimensions(ocr_metadata)
 
-    try:
-        # Extract OCR dimensions from metadata if available
-        ocr_page_dims = extract_ocr_dimensions(ocr_metadata)
+    # The legend is resolved here: the callbacks may be closures that cannot be pickled
+    legend_lines = None
+    if legend_lines_fn:
+        legend_lines = legend_lines_fn()
+        if redact and redact_fn:
+            legend_lines = redact_fn(legend_lines)
 
+    with fitz.open(input_pdf) as doc, ExitStack() as stack:
+        jobs = []
         for page_idx in range(len(doc)):
-            page = doc[page_idx]
-
-            # Get OCR dimensions for this page if available
-            ocr_w, ocr_h = ocr_page_dims.get(page_idx, (None, None))
-
-            # If we have OCR dimensions, render at that exact resolution
-            # Otherwise use the specified DPI
-            if ocr_w and ocr_h:
-                # Calculate zoom to match OCR dimensions exactly
-                page_w_pt = float(page.rect.width)
-                page_h_pt = float(page.rect.height)
-                zoom_x = ocr_w / page_w_pt
-                zoom_y = ocr_h / page_h_pt
-                # Use average zoom for uniform scaling, but ensure we get close to target dimensions
-                zoom = (zoom_x + zoom_y) / 2.0
-                pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
-                # If the rendered size doesn't match OCR dimensions exactly, we'll scale bboxes
-            else:
-                zoom = dpi / 72.0
-                pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
-
-            img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
-            from PIL import ImageDraw
-
-            draw = ImageDraw.Draw(img)
-
-            page_items = by_page.get(page_idx + 1, [])
-            page_h_pt = float(page.rect.height)
-            page_w_pt = float(page.rect.width)
-            scale_x = pix.width / page_w_pt
-            scale_y = pix.height / page_h_pt
-
-            font = get_font(9)
-            tag_font = get_font(8)
-            for item in page_items:
+            # Only items with text and a bbox are drawn, each with its field tag if any
+            page_items = []
+            for item_idx, item in by_page.get(page_idx + 1, []):
                 ocr_text = item.get("text", "").strip()
-                if not ocr_text:
-                    continue
-
-                bbox = item.get("bbox", {})
-                if not bbox:
-                    continue
-
-                # Extract coordinates
-                left, top, right, bottom = extract_bbox_coordinates(bbox)
-
-                # Convert coordinates based on whether we have OCR dimensions
-                if ocr_w and ocr_h:
-                    # Bboxes are in OCR pixel coordinates (ocr_w x ocr_h)
-                    # Scale to rendered image coordinates (pix.width x pix.height)
-                    sx = pix.width / float(ocr_w)
-                    sy = pix.height / float(ocr_h)
-                    left = left * sx
-                    top = top * sy
-                    right = right * sx
-                    bottom = bottom * sy
-                else:
-                    # Fallback to heuristic detection (for Docling or other engines)
-                    # Check if bbox coordinates are in pixel space (from RapidOCR/Tesseract)
-                    # vs PDF points (from Docling)
-                    max_coord = max(right, bottom, abs(left), abs(top))
-                    max_page_dim = max(page_w_pt, page_h_pt)
-                    avg_coord = (abs(left) + abs(top) + right + bottom) / 4.0
-
-                    if max_coord > max_page_dim * 1.2 or avg_coord > max_page_dim * 1.1:
-                        # Assume 300 DPI conversion: 300 DPI / 72 DPI = 4.167
-                        # Convert from 300 DPI pixels to PDF points
-                        ocr_dpi = 300.0
-                        points_per_pixel = 72.0 / ocr_dpi
-                        left = left * points_per_pixel
-                        top = top * points_per_pixel
-                        right = right * points_per_pixel
-                        bottom = bottom * points_per_pixel
-
-                    # Handle coordinate system conversion (BOTTOMLEFT to TOPLEFT)
-                    if bbox.get("coord_origin") == "BOTTOMLEFT" and page_h_pt > 0:
-                        top, bottom = page_h_pt - top, page_h_pt - bottom
-
-                    # Convert PDF points to pixels
-                    left = left * scale_x
-                    top = top * scale_y
-                    right = right * scale_x
-                    bottom = bottom * scale_y
-
-                # Clip and validate bbox
-                bbox_px = clip_bbox(left, top, right, bottom, pix.width, pix.height)
-                if bbox_px is None:
-                    continue
-
-                l_px, t_px, r_px, b_px = bbox_px
-
-                # Get field name if mapping exists
-                item_idx = item.get("_index")
-                field_name = None
-                if field_mapping and item_idx is not None:
-                    field_name = field_mapping.get(item_idx)
-
-                # Draw bbox with annotations
-                draw_bbox_with_annotations(
-                    draw, l_px, t_px, r_px, b_px, ocr_text, field_name, font, tag_font
+                if ocr_text and item.get("bbox"):
+                    field_name = field_mapping.get(item_idx) if field_mapping else None
+                    page_items.append((item["bbox"], ocr_text, field_name))
+            page_legend = legend_lines if page_idx == 0 else None
+            # Pages with nothing to draw are copied from the source instead
+            if page_items or page_legend is not None:
+                jobs.append(
+                    (
+                        str(input_pdf),
+                        page_idx,
+                        page_items,
+                        ocr_page_dims.get(page_idx),
+                        dpi,
+                        render_scale,
+                        page_legend,
+                    )
                 )
 
-            if page_idx == 0 and legend_lines_fn:
-                lines = legend_lines_fn()
-                if redact and redact_fn:
-                    lines = redact_fn(lines)
-                img = overlay_legend(img, lines)
-
-            annotated_pages.append(img.convert("RGB"))
-    finally:
-        doc.close()
-
-    if annotated_pages:
-        annotated_pages[0].save(
-            output_pdf,
-            "PDF",
-            save_all=True,
-            append_images=annotated_pages[1:],
-            resolution=dpi,
-        )
+        # Serial unless configured; a single page is not worth a round trip to the pool
+        workers = get_settings().render_workers or 1
+        if workers <= 1 or len(jobs) <= 1:
+            rendered = (_render_page(*job) for job in jobs)
+        else:
+            try:
+                rendered = _render_pool(workers).map(_render_page, *zip(*jobs, strict=True))
+            except BrokenProcessPool:
+                # A worker died (e.g. killed for memory): start a fresh pool once
+                _render_pool.cache_clear()
+                rendered = _render_pool(workers).map(_render_page, *zip(*jobs, strict=True))
+
+        # Pages are written as soon as they are rendered, in page order
+        out_doc = stack.enter_context(fitz.open())
+        rendered_pages = {job[1] for job in jobs}
+        for page_idx in range(len(doc)):
+            if page_idx in rendered_pages:
+                _write_page(out_doc, *next(rendered), page_dpi)
+            else:
+                out_doc.insert_pdf(doc, from_page=page_idx, to_page=page_idx)
+
+        if out_doc.page_count:
+            out_doc.save(output_pdf, deflate=True)
 
     return Path(output_pdf)
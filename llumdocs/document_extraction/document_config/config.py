@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass
 
 from pydantic import BaseModel
 
@@ -16,26 +17,22 @@ from .redaction.default import default_redact
 from .redaction.payroll import redact_payroll
 
 
+@dataclass(frozen=True, slots=True)
 class DocumentConfig:
     """Configuration for a document type (model, prompts, text limit, legend, redaction)."""
 
-    def __init__(
-        self,
-        model_class: type[BaseModel],
-        system_prompt: str,
-        user_prompt_template: str,
-        text_limit: int | None = None,
-        make_legend_lines: Callable[[BaseModel], list[str]] | None = None,
-        redact_lines: Callable[[list[str]], list[str]] | None = None,
-    ):
-        self.model_class = model_class
-        self.system_prompt = system_prompt
-        self.user_prompt_template = user_prompt_template
-        self.text_limit = text_limit
-        self.make_legend_lines = make_legend_lines
-        self.redact_lines = redact_lines
+    model_class: type[BaseModel]
+    system_prompt: str
+    user_prompt_template: str
+    text_limit: int | None = None
+    make_legend_lines: Callable[[BaseModel], list[str]] | None = None
+    redact_lines: Callable[[list[str]], list[str]] | None = None
 
 
+# Instructions shared by the Spanish-language prompts
+_ES_JSON_ONLY = "Devuelve SOLO JSON válido para el esquema."
+_ES_NULL_IF_MISSING = "Si un campo no está, pon null."
+
 # Document type configurations
 DOCUMENT_CONFIGS: dict[str, DocumentConfig] = {
     "deliverynote": DocumentConfig(
@@ -55,16 +52,13 @@ DOCUMENT_CONFIGS: dict[str, DocumentConfig] = {
     ),
     "bank": DocumentConfig(
         model_class=BankStatement,
-        system_prompt=(
-            "Extraes campos de un extracto bancario español. "
-            "Devuelve SOLO JSON válido para el esquema."
-        ),
+        system_prompt="Extraes campos de un extracto bancario español. " + _ES_JSON_ONLY,
         user_prompt_template=(
             "Extrae información de este extracto bancario:\n\n{text}\n\n"
             "Devuelve campos: banco, titular, iban, periodo_desde, periodo_hasta, "
             "moneda, lineas (lista de transacciones con fecha, concepto, importe "
             "(negativo para gastos, positivo para ingresos), saldo opcional), "
-            "saldo_inicial, saldo_final. Si un campo no está, pon null."
+            "saldo_inicial, saldo_final. " + _ES_NULL_IF_MISSING
         ),
         text_limit=40000,
         make_legend_lines=make_bank_legend,
@@ -72,15 +66,12 @@ DOCUMENT_CONFIGS: dict[str, DocumentConfig] = {
     ),
     "payroll": DocumentConfig(
         model_class=PayrollReport,
-        system_prompt=(
-            "Extraes campos de una nómina española. Devuelve SOLO JSON válido para el esquema."
-        ),
+        system_prompt="Extraes campos de una nómina española. " + _ES_JSON_ONLY,
         user_prompt_template=(
             "Extrae información de esta nómina:\n\n{text}\n\n"
             "Devuelve campos: empresa_nif, empleado_dni, periodo (YYYY-MM), categoria, "
             "iban, devengos (lista con concepto e importe), deducciones (lista con "
-            "concepto e importe), bruto, total_deducciones, neto. "
-            "Si un campo no está, pon null."
+            "concepto e importe), bruto, total_deducciones, neto. " + _ES_NULL_IF_MISSING
         ),
         text_limit=40000,
         make_legend_lines=make_payroll_legend,
@@ -91,8 +82,9 @@ DOCUMENT_CONFIGS: dict[str, DocumentConfig] = {
 
 def get_config(doc_type: str) -> DocumentConfig:
     """Get configuration for a document type. Raises ValueError if not found."""
-    if doc_type not in DOCUMENT_CONFIGS:
+    config = DOCUMENT_CONFIGS.get(doc_type)
+    if config is None:
         raise ValueError(
             f"Unknown doc_type: {doc_type}. Available types: {', '.join(DOCUMENT_CONFIGS.keys())}"
         )
-    return DOCUMENT_CONFIGS[doc_type]
+    return config
@@ -2,37 +2,44 @@
 
 from __future__ import annotations
 
-from ...payroll.models import PayrollReport
+from collections.abc import Iterator
 
+from ...payroll.models import Deduccion, Devengo, PayrollReport
 
-def make_payroll_legend(report: PayrollReport) -> list[str]:
-    """Build legend text lines from a PayrollReport."""
-    lines = []
+
+def _item_lines(title: str, items: list[Devengo] | list[Deduccion]) -> Iterator[str]:
+    """Yield a titled block with the first five earning/deduction items."""
+    yield ""
+    yield title
+    for i, d in enumerate(items[:5], 1):
+        yield f"  {i}. {d.concepto}: {d.importe:.2f} EUR"
+
+
+def _payroll_lines(report: PayrollReport) -> Iterator[str]:
+    """Yield legend text lines for a PayrollReport."""
     if report.empresa_nif:
-        lines.append(f"Empresa NIF: {report.empresa_nif}")
+        yield f"Empresa NIF: {report.empresa_nif}"
     if report.empleado_dni:
-        lines.append(f"Empleado DNI: {report.empleado_dni}")
+        yield f"Empleado DNI: {report.empleado_dni}"
     if report.periodo:
-        lines.append(f"Período: {report.periodo}")
+        yield f"Período: {report.periodo}"
     if report.categoria:
-        lines.append(f"Categoría: {report.categoria}")
+        yield f"Categoría: {report.categoria}"
     if report.iban:
-        lines.append(f"IBAN: {report.iban}")
+        yield f"IBAN: {report.iban}"
     if report.devengos:
-        lines.append("")
-        lines.append("Devengos:")
-        for i, d in enumerate(report.devengos[:5], 1):
-            lines.append(f"  {i}. {d.concepto}: {d.importe:.2f} EUR")
+        yield from _item_lines("Devengos:", report.devengos)
     if report.deducciones:
-        lines.append("")
-        lines.append("Deducciones:")
-        for i, d in enumerate(report.deducciones[:5], 1):
-            lines.append(f"  {i}. {d.concepto}: {d.importe:.2f} EUR")
-    lines.append("")
+        yield from _item_lines("Deducciones:", report.deducciones)
+    yield ""
     if report.bruto is not None:
-        lines.append(f"Bruto: {report.bruto:.2f} EUR")
+        yield f"Bruto: {report.bruto:.2f} EUR"
     if report.total_deducciones is not None:
-        lines.append(f"Total deducciones: {report.total_deducciones:.2f} EUR")
+        yield f"Total deducciones: {report.total_deducciones:.2f} EUR"
     if report.neto is not None:
-        lines.append(f"Neto: {report.neto:.2f} EUR")
-    return lines
+        yield f"Neto: {report.neto:.2f} EUR"
+
+
+def make_payroll_legend(report: PayrollReport) -> list[str]:
+    """Build legend text lines from a PayrollReport."""
+    return list(_payroll_lines(report))
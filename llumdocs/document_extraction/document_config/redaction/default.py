@@ -4,6 +4,40 @@ from __future__ import annotations
 
 import re
 
+# (label, pattern) pairs: emails, then IBANs (2 letters + 2 digits + 11-30 alphanumeric),
+# then Spanish tax IDs (NIF/CIF). Each pattern is a named group of one alternation, so the
+# text is scanned once; the first alternative that matches at a position wins. None of them
+# can match across a newline, so legend lines are redacted independently.
+REDACTION_PATTERNS: tuple[tuple[str, str], ...] = (
+    ("EMAIL", r"\b[\w\.-]{1,64}@[\w\.-]{1,252}\.\w{2,}\b"),
+    ("IBAN", r"\b[A-Z]{2}\d{2}[A-Z0-9]{11,30}\b"),
+    ("TAXID", r"\b(?:\d{8}[A-Z]|[A-Z]\d{8})\b"),
+)
+
+
+def compile_redaction(patterns: tuple[tuple[str, str], ...]) -> re.Pattern[str]:
+    """Fuse (label, pattern) pairs into one case-insensitive alternation of named groups."""
+    return re.compile("|".join(f"(?P<{label}>{pattern})" for label, pattern in patterns), re.I)
+
+
+def redaction_marker(match: re.Match[str]) -> str:
+    """Replacement for a match of a `compile_redaction` pattern, e.g. ``••REDACTED-IBAN••``."""
+    return f"••REDACTED-{match.lastgroup}••"
+
+
+# Every redaction pattern needs an "@" or a digit to match; text without either is left as is.
+_TRIGGER_RE = re.compile(r"[@\d]")
+
+
+def apply_redaction(pattern: re.Pattern[str], text: str) -> str:
+    """Substitute `compile_redaction` matches in ``text``, skipping text that cannot match."""
+    if _TRIGGER_RE.search(text) is None:
+        return text
+    return pattern.sub(redaction_marker, text)
+
+
+_REDACT_RE = compile_redaction(REDACTION_PATTERNS)
+
 
 def redact_sensitive_info(text: str) -> str:
     """Redact sensitive information from text.
@@ -19,16 +53,9 @@ def redact_sensitive_info(text: str) -> str:
     Returns:
         Text with sensitive information replaced by redaction markers.
     """
-    # Redact emails
-    text = re.sub(r"\b[\w\.-]+@[\w\.-]+\.\w{2,}\b", "••REDACTED-EMAIL••", text)
-    # Redact IBAN (2 letters + 2 digits + 11-30 alphanumeric)
-    text = re.sub(r"\b[A-Z]{2}\d{2}[A-Z0-9]{11,30}\b", "••REDACTED-IBAN••", text, flags=re.I)
-    # Redact Spanish tax IDs
-    return re.sub(r"\b(\d{8}[A-Z]|[A-Z]\d{8})\b", "••REDACTED-TAXID••", text, flags=re.I)
+    return apply_redaction(_REDACT_RE, text)
 
 
 def default_redact(lines: list[str]) -> list[str]:
-    """Default redaction using redact_sensitive_info."""
-    text = "\n".join(lines)
-    text = redact_sensitive_info(text)
-    return text.splitlines()
+    """Default redaction using redact_sensitive_info, line by line."""
+    return [apply_redaction(_REDACT_RE, line) for line in lines]
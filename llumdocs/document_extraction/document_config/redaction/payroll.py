@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
-import re
+from .default import REDACTION_PATTERNS, apply_redaction, compile_redaction
 
-from .default import redact_sensitive_info
+# Default patterns plus NIEs (which, like all of them, contain digits), in one pass. DNIs
+# (8 digits + letter) need no pattern of their own: the tax ID alternative redacts them.
+_PAYROLL_REDACT_RE = compile_redaction(
+    (*REDACTION_PATTERNS, ("NIE", r"\b[A-Z]\d{7}[A-Z]\b")),
+)
 
 
 def redact_payroll(lines: list[str]) -> list[str]:
-    """Redact sensitive information from payroll legend."""
-    text = "\n".join(lines)
-    text = redact_sensitive_info(text)
-    text = re.sub(r"\b\d{8}[A-Z]\b", "••REDACTED-DNI••", text, flags=re.I)
-    text = re.sub(r"\b[A-Z]\d{7}[A-Z]\b", "••REDACTED-NIE••", text, flags=re.I)
-    return text.splitlines()
+    """Redact sensitive information from payroll legend, line by line."""
+    return [apply_redaction(_PAYROLL_REDACT_RE, line) for line in lines]
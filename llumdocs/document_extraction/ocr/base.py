@@ -6,12 +6,14 @@ This module defines the common interface and data structures for OCR engines.
 from __future__ import annotations
 
 import time
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 
+import numpy as np
 from PIL import Image
 
 
-@dataclass
+@dataclass(slots=True)
 class OcrWord:
     """Represents a single word detected by OCR.
 
@@ -26,14 +28,47 @@ class OcrWord:
     conf: float
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
+class OcrWords(Sequence[OcrWord]):
+    """Words of a page stored column-wise, one array per attribute.
+
+    Reads as a sequence of :class:`OcrWord` built on access, while the columns
+    stay available for vectorized filtering (e.g. ``words.confs > 60``).
+
+    Attributes:
+        texts: Word texts.
+        bboxes: ``(N, 4)`` int32 array of (x0, y0, x1, y1) boxes.
+        confs: ``(N,)`` float64 array of confidence scores.
+    """
+
+    texts: list[str]
+    bboxes: np.ndarray
+    confs: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return OcrWords(self.texts[index], self.bboxes[index], self.confs[index])
+        x0, y0, x1, y1 = self.bboxes[index].tolist()
+        return OcrWord(self.texts[index], (x0, y0, x1, y1), float(self.confs[index]))
+
+    def __iter__(self) -> Iterator[OcrWord]:
+        for text, (x0, y0, x1, y1), conf in zip(
+            self.texts, self.bboxes.tolist(), self.confs.tolist(), strict=True
+        ):
+            yield OcrWord(text, (x0, y0, x1, y1), conf)
+
+
+@dataclass(slots=True)
 class OcrPage:
     """Represents OCR results for a single page.
 
     Attributes:
         page_index: Zero-based page index.
         text: Full text content of the page.
-        words: List of detected words with bounding boxes.
+        words: Detected words with bounding boxes (OcrWords from the built-in engines).
         width: Page width in pixels.
         height: Page height in pixels.
         runtime_sec: Time taken to process this page in seconds.
@@ -41,7 +76,7 @@ class OcrPage:
 
     page_index: int
     text: str
-    words: list[OcrWord]
+    words: Sequence[OcrWord]
     width: int
     height: int
     runtime_sec: float
@@ -143,3 +178,42 @@ def validate_bbox(bbox: tuple[int, int, int, int], width: int, height: int) -> N
 
     if y1 > height:
         raise ValueError(f"bbox y1 ({y1}) must be <= image height ({height}), got {bbox}")
+
+
+def validate_bbox_coords(x0: int, y0: int, x1: int, y1: int, width: int, height: int) -> None:
+    """Validate already-cast integer bbox coordinates on the per-word hot path.
+
+    Checks ordering and bounds in a single expression and only falls back to
+    :func:`validate_bbox` (for its detailed error message) when a check fails.
+
+    Args:
+        x0: Left pixel coordinate.
+        y0: Top pixel coordinate.
+        x1: Right pixel coordinate.
+        y1: Bottom pixel coordinate.
+        width: Image width in pixels.
+        height: Image height in pixels.
+
+    Raises:
+        ValueError: If the coordinates are out of order or out of bounds.
+    """
+    if (x0 | y0) < 0 or x0 > x1 or y0 > y1 or x1 > width or y1 > height:
+        validate_bbox((x0, y0, x1, y1), width, height)
+
+
+def validate_bbox_array(bboxes: np.ndarray, width: int, height: int) -> None:
+    """Validate an ``(N, 4)`` integer array of (x0, y0, x1, y1) boxes at once.
+
+    Args:
+        bboxes: Bounding boxes, one per row.
+        width: Image width in pixels.
+        height: Image height in pixels.
+
+    Raises:
+        ValueError: For the first box out of order or out of bounds, with the
+            message :func:`validate_bbox` gives.
+    """
+    x0, y0, x1, y1 = bboxes.T
+    bad = ((x0 | y0) < 0) | (x0 > x1) | (y0 > y1) | (x1 > width) | (y1 > height)
+    if bad.any():
+        validate_bbox_coords(*bboxes[int(np.argmax(bad))].tolist(), width, height)
@@ -8,7 +8,7 @@ from __future__ import annotations
 import numpy as np
 from PIL import Image
 
-from .base import OcrEngine, OcrPage, OcrWord, now, validate_bbox
+from .base import OcrEngine, OcrPage, OcrWords, now, validate_bbox_array
 
 
 class RapidOCREngine(OcrEngine):
@@ -44,21 +44,23 @@ class RapidOCREngine(OcrEngine):
         self.ocr = RapidOCR(**kwargs)
 
     @staticmethod
-    def _poly_to_bbox(poly: list[list[int]]) -> tuple[int, int, int, int]:
-        """Convert polygon coordinates to axis-aligned bounding box.
+    def _polys_to_bboxes(polys: list[list[list[float]]]) -> np.ndarray:
+        """Convert polygon coordinates to axis-aligned bounding boxes.
 
         RapidOCR returns quadrilateral polygons, but we convert them to
-        axis-aligned boxes for consistency with Tesseract output.
+        axis-aligned boxes for consistency with Tesseract output. All
+        polygons of a page are reduced at once as an ``(N, 4, 2)`` array.
 
         Args:
-            poly: List of 4 points [[x1,y1], [x2,y2], [x3,y3], [x4,y4]].
+            polys: Polygons of 4 points [[x1,y1], [x2,y2], [x3,y3], [x4,y4]].
 
         Returns:
-            Bounding box as (x0, y0, x1, y1).
+            ``(N, 4)`` int64 array of (x0, y0, x1, y1) boxes.
         """
-        xs = [p[0] for p in poly]
-        ys = [p[1] for p in poly]
-        return (int(min(xs)), int(min(ys)), int(max(xs)), int(max(ys)))
+        arr = np.asarray(polys, dtype=np.float64).reshape(-1, 4, 2)
+        boxes = np.concatenate((arr.min(axis=1), arr.max(axis=1)), axis=1)
+        # astype truncates toward zero, like int()
+        return boxes.astype(np.int64)
 
     def recognize_page(self, img: Image.Image, page_index: int) -> OcrPage:
         """Recognize text in an image using RapidOCR.
@@ -73,25 +75,28 @@ class RapidOCREngine(OcrEngine):
         t0 = now()
         width, height = img.size
 
-        # Convert PIL Image to numpy array (RGB)
-        np_img = np.array(img.convert("RGB"))
+        # Convert PIL Image to numpy array (RGB); convert() always copies, so skip it
+        # when the page is already RGB. The array is read-only, RapidOCR doesn't write it.
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        np_img = np.asarray(img)
 
         # RapidOCR returns (result, elapsed_time)
         # result is a list of [polygon, text, score] tuples
         result, _ = self.ocr(np_img)
 
-        words: list[OcrWord] = []
-        texts: list[str] = []
-
-        if result:
-            for poly, txt, score in result:
-                bbox = self._poly_to_bbox(poly)
-                txt_clean = txt.strip()
-                if txt_clean:
-                    # Validate bbox before creating OcrWord
-                    validate_bbox(bbox, width, height)
-                    words.append(OcrWord(text=txt_clean, bbox=bbox, conf=float(score)))
-                    texts.append(txt_clean)
+        # Keep detections with non-empty text
+        detections = [
+            (poly, txt_clean, score)
+            for poly, txt, score in result or ()
+            if (txt_clean := txt.strip())
+        ]
+        texts = [txt for _, txt, _ in detections]
+        bboxes = self._polys_to_bboxes([poly for poly, _, _ in detections])
+        # Validate all bboxes at once before creating the words
+        validate_bbox_array(bboxes, width, height)
+        confs = np.array([score for _, _, score in detections], dtype=np.float64)
+        words = OcrWords(texts, bboxes.astype(np.int32), confs)
 
         # Join texts with newlines (RapidOCR typically returns line-by-line)
         full_text = "\n".join(texts)
@@ -6,12 +6,43 @@ This module provides a Tesseract-based OCR engine using pytesseract.
 from __future__ import annotations
 
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
 
+import numpy as np
 import pytesseract
 from PIL import Image
 from pytesseract import Output
 
-from .base import OcrEngine, OcrPage, OcrWord, now, validate_bbox
+from .base import OcrEngine, OcrPage, OcrWords, now, validate_bbox_array
+
+# Pages shorter than this are always OCR'd in one call
+_STRIP_MIN_HEIGHT = 2000
+
+
+def _strip_bounds(img: Image.Image, strips: int) -> list[int]:
+    """Row offsets splitting ``img`` into ``strips`` horizontal strips.
+
+    Each cut is moved to the lightest row within an eighth of a strip of its
+    even split point, so that it falls between text lines rather than through them.
+
+    Args:
+        img: Page image.
+        strips: Number of strips.
+
+    Returns:
+        ``strips + 1`` increasing row offsets, starting at 0 and ending at the height.
+    """
+    height = img.height
+    brightness = np.asarray(img.convert("L")).mean(axis=1)
+    window = max(1, height // (strips * 8))
+    bounds = [0]
+    for k in range(1, strips):
+        mid = k * height // strips
+        lo = mid - window
+        bounds.append(lo + int(np.argmax(brightness[lo : mid + window])))
+    bounds.append(height)
+    return bounds
 
 
 class TesseractEngine(OcrEngine):
@@ -29,6 +60,7 @@ class TesseractEngine(OcrEngine):
         oem: int = 1,
         psm: int = 6,
         extra_cfg: str = "",
+        strips: int = 1,
         **kwargs,
     ):
         """Initialize Tesseract OCR engine.
@@ -38,6 +70,8 @@ class TesseractEngine(OcrEngine):
             oem: OCR Engine Mode (0-3, default: 1 for LSTM).
             psm: Page Segmentation Mode (0-13, default: 6 for uniform block).
             extra_cfg: Additional Tesseract configuration string.
+            strips: Number of horizontal strips pages taller than 2000 px are split
+                into and OCR'd concurrently (1 disables splitting).
             **kwargs: Additional arguments (ignored).
         """
         super().__init__(langs, **kwargs)
@@ -49,6 +83,7 @@ class TesseractEngine(OcrEngine):
         self.oem = oem
         self.psm = psm
         self.extra_cfg = extra_cfg
+        self.strips = max(1, strips)
 
         # Check if Tesseract is available and warn if languages might not be available
         try:
@@ -81,6 +116,66 @@ class TesseractEngine(OcrEngine):
             cfg += f" {self.extra_cfg}"
         return cfg
 
+    def _image_to_data(self, img: Image.Image) -> dict[str, list]:
+        """Run Tesseract on an image and return its word-level data columns."""
+        return pytesseract.image_to_data(
+            img, lang=self.lang_str, config=self._cfg(), output_type=Output.DICT
+        )
+
+    def _strips_to_data(self, img: Image.Image) -> dict[str, list]:
+        """OCR ``img`` as concurrent horizontal strips and merge their data columns.
+
+        Each strip's ``top`` is shifted back to page coordinates and its block
+        numbers are offset so blocks stay distinct across strips.
+        """
+        bounds = _strip_bounds(img, self.strips)
+        with ThreadPoolExecutor(max_workers=self.strips, thread_name_prefix="tesseract") as pool:
+            parts = list(
+                pool.map(
+                    lambda top, bottom: self._image_to_data(img.crop((0, top, img.width, bottom))),
+                    bounds[:-1],
+                    bounds[1:],
+                )
+            )
+
+        data: dict[str, list] = {}
+        block_base = 0
+        for top, part in zip(bounds[:-1], parts, strict=True):
+            for key, values in part.items():
+                if key == "top":
+                    values = [v + top for v in values]
+                elif key == "block_num":
+                    values = [v + block_base for v in values]
+                data.setdefault(key, []).extend(values)
+            block_base = max(data.get("block_num", ()), default=block_base)
+        return data
+
+    @staticmethod
+    def _layout_text(data: dict[str, list], texts: list[str], keep: list[int]) -> str:
+        """Join recognized words using Tesseract's layout columns.
+
+        Mirrors ``image_to_string`` output: words on a line are separated by
+        spaces, lines by newlines and paragraphs by a blank line.
+
+        Args:
+            data: ``image_to_data`` output (with block/par/line numbers).
+            texts: Stripped word texts, aligned with ``data`` rows.
+            keep: Row indices of non-empty words, in reading order.
+
+        Returns:
+            Full page text.
+        """
+        blocks, pars, lines = data["block_num"], data["par_num"], data["line_num"]
+        paragraphs = []
+        for _, par_rows in groupby(keep, key=lambda i: (blocks[i], pars[i])):
+            paragraphs.append(
+                "\n".join(
+                    " ".join(texts[i] for i in line_rows)
+                    for _, line_rows in groupby(par_rows, key=lines.__getitem__)
+                )
+            )
+        return "\n\n".join(paragraphs)
+
     def recognize_page(self, img: Image.Image, page_index: int) -> OcrPage:
         """Recognize text in an image using Tesseract.
 
@@ -95,40 +190,42 @@ class TesseractEngine(OcrEngine):
         width, height = img.size
 
         # Get word-level data with bounding boxes
-        data = pytesseract.image_to_data(
-            img, lang=self.lang_str, config=self._cfg(), output_type=Output.DICT
+        if self.strips > 1 and height > _STRIP_MIN_HEIGHT:
+            data = self._strips_to_data(img)
+        else:
+            data = self._image_to_data(img)
+
+        # Strip texts once; only this step runs per word in Python
+        texts = [t.strip() for t in data["text"]]
+        n = len(texts)
+        keep = np.flatnonzero(np.fromiter(map(bool, texts), dtype=bool, count=n))
+
+        # Convert to canonical format: (x0, y0, x1, y1) as integers, column-wise
+        x0s = np.asarray(data["left"], dtype=np.int64)[keep]
+        y0s = np.asarray(data["top"], dtype=np.int64)[keep]
+        bboxes = np.stack(
+            (
+                x0s,
+                y0s,
+                x0s + np.asarray(data["width"], dtype=np.int64)[keep],
+                y0s + np.asarray(data["height"], dtype=np.int64)[keep],
+            ),
+            axis=1,
         )
+        # Validate all bboxes at once before creating the words
+        validate_bbox_array(bboxes, width, height)
+
+        # Confidence can be missing, default to 0
+        confs = (
+            np.asarray(data["conf"], dtype=np.float64)[keep]
+            if "conf" in data
+            else np.zeros(len(keep))
+        )
+        keep_rows = keep.tolist()
+        words = OcrWords([texts[i] for i in keep_rows], bboxes.astype(np.int32), confs)
 
-        words: list[OcrWord] = []
-        n = len(data["text"])
-
-        for i in range(n):
-            txt = data["text"][i].strip()
-            if not txt:
-                continue
-
-            x = data["left"][i]
-            y = data["top"][i]
-            w = data["width"][i]
-            h = data["height"][i]
-
-            # Convert to canonical format: (x0, y0, x1, y1) as integers
-            x0 = int(x)
-            y0 = int(y)
-            x1 = int(x + w)
-            y1 = int(y + h)
-            bbox = (x0, y0, x1, y1)
-
-            # Validate bbox before creating OcrWord
-            validate_bbox(bbox, width, height)
-
-            # Confidence can be missing, default to 0
-            conf = float(data.get("conf", [0] * n)[i])
-
-            words.append(OcrWord(text=txt, bbox=bbox, conf=conf))
-
-        # Get full text (more robust than joining words)
-        full_text = pytesseract.image_to_string(img, lang=self.lang_str, config=self._cfg())
+        # Rebuild the full text from the same OCR pass instead of running Tesseract again
+        full_text = self._layout_text(data, texts, keep_rows)
 
         dt = now() - t0
 
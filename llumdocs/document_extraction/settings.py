@@ -2,10 +2,14 @@
 
 This module provides centralized configuration management using Pydantic Settings.
 All settings can be overridden via environment variables with the DOCUMENT_LLM_ prefix.
+Use `get_settings()` (or the `SETTINGS` alias) to get the shared, lazily built instance.
 """
 
 from __future__ import annotations
 
+import functools
+from typing import Any
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -23,13 +27,19 @@ class Settings(BaseSettings):
         max_output_tokens: Maximum tokens in LLM response.
         json_strict: Whether to use OpenAI strict JSON mode (falls back if unavailable).
         seed: Random seed for LLM (for reproducibility).
+        response_cache_dir: Directory for caching raw LLM extraction answers on disk,
+            keyed by model, prompts and text (None disables the cache).
         docling_gpu: Whether to use GPU acceleration for Docling OCR.
         ocr_langs: Comma-separated list of OCR languages (e.g., "spa,eng,cat").
         images_scale: Image scaling factor for OCR (4.17 ≈ 300 DPI).
         max_pages: Maximum number of pages to process (None for all pages).
+        ocr_workers: Number of PDF pages OCR'd in parallel (None for one per CPU core).
         deskew: Whether to apply deskew correction to scanned pages.
         binarize: Whether to apply binarization to scanned pages.
         dpi: DPI for PDF rendering and visualization.
+        render_workers: Number of PDF pages annotated in parallel worker processes
+            (None renders pages serially in the calling thread).
+        jpeg_quality: JPEG quality (1-95) of the pages embedded in annotated PDFs.
         redact_output: Whether to redact sensitive information by default.
         outputs_dir: Default directory for output files.
     """
@@ -42,21 +52,35 @@ class Settings(BaseSettings):
     max_output_tokens: int = 2000
     json_strict: bool = True
     seed: int | None = 7
+    response_cache_dir: str | None = None
 
     # OCR
     docling_gpu: bool = False
     ocr_langs: str = "spa,eng,cat"
     images_scale: float = 4.17  # 4.17 ≈ 300 DPI (72 * 4.17)
     max_pages: int | None = None
+    ocr_workers: int | None = None
     deskew: bool = True
     binarize: bool = True
     dpi: int = 300
 
     # Output
+    render_workers: int | None = None
+    jpeg_quality: int = 75
     redact_output: bool = False
     outputs_dir: str = "outputs"
 
     model_config = SettingsConfigDict(env_prefix="DOCUMENT_LLM_")
 
 
-SETTINGS = Settings()
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the settings from the environment on first use and share them afterwards."""
+    return Settings()
+
+
+def __getattr__(name: str) -> Any:
+    # SETTINGS is built lazily: the environment is read on first access, not on import
+    if name == "SETTINGS":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
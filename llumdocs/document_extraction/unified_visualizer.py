@@ -24,6 +24,7 @@ def annotate_document_pdf(
     dpi: int | None = None,
     redact: bool = False,
     ocr_metadata: dict[str, Any] | None = None,
+    render_dpi: int | None = None,
 ) -> Path:
     """Annotate a PDF with OCR bounding boxes and document-specific legend.
 
@@ -40,6 +41,7 @@ def annotate_document_pdf(
         dpi: Resolution for rendering (defaults to SETTINGS.dpi).
         redact: Whether to redact sensitive information in legend.
         ocr_metadata: Optional OCR metadata with page dimensions for accurate coordinate scaling.
+        render_dpi: Optional lower resolution to render PDF pages at (ignored for images).
 
     Returns:
         Path to the created output PDF file.
@@ -86,4 +88,5 @@ def annotate_document_pdf(
         redact=redact,
         report=report,
         ocr_metadata=ocr_metadata,
+        render_dpi=render_dpi,
     )
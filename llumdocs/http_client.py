@@ -0,0 +1,36 @@
+"""
+Process-wide pooled HTTP client for outbound LLM requests.
+
+The API creates one ``httpx.AsyncClient`` at startup and registers it here, so
+every LiteLLM call reuses pooled keep-alive connections instead of paying a new
+TCP/TLS handshake per request. This module stays import-light on purpose: it
+must not pull in LiteLLM.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+
+import httpx
+
+_async_client: httpx.AsyncClient | None = None
+
+
+def create_async_client(timeout: float = 60.0) -> httpx.AsyncClient:
+    """Build a pooled async client (HTTP/2 when the ``h2`` package is installed)."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=256, max_keepalive_connections=128),
+        http2=importlib.util.find_spec("h2") is not None,
+        timeout=timeout,
+    )
+
+
+def set_async_client(client: httpx.AsyncClient | None) -> None:
+    """Register (or clear, with ``None``) the shared async client."""
+    global _async_client
+    _async_client = client
+
+
+def get_async_client() -> httpx.AsyncClient | None:
+    """Return the shared async client, if one has been registered."""
+    return _async_client
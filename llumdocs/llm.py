@@ -7,19 +7,24 @@ provider-specific kwargs) across services, API endpoints, and Gradio UI.
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import os
 import time
+import weakref
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
-from litellm import completion
+import litellm
+from litellm import acompletion, completion
 from litellm.exceptions import (
     APIError,
     RateLimitError,
     Timeout,
 )
 
+from llumdocs.http_client import get_async_client
 from llumdocs.settings import get_ollama_base
 
 # Configurable timeout for LLM calls (in seconds)
@@ -33,6 +38,13 @@ VISION_LLM_TIMEOUT_SECONDS = float(
     )
 )
 
+# Maximum number of async LLM requests in flight per event loop; excess callers queue
+LLM_CONCURRENCY = int(os.getenv("LLUMDOCS_LLM_CONCURRENCY", "32"))
+
+_SEMAPHORES: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
 
 class LLMConfigurationError(RuntimeError):
     """Raised when no valid LLM backend is available."""
@@ -192,6 +204,35 @@ def available_vision_models() -> List[Tuple[str, str]]:
     return models
 
 
+def _with_prompt_caching(model_id: str, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Mark the leading system prompt as cacheable for providers that need explicit markers.
+
+    Services keep their static instructions in the first (system) message and the
+    user text last, so the shared prefix can be reused across requests. OpenAI and
+    compatible backends cache such prefixes automatically; Claude models (Anthropic,
+    Bedrock, Vertex) only do so when the block carries ``cache_control``.
+    """
+    if "claude" not in model_id.lower() or not messages or messages[0]["role"] != "system":
+        return messages
+
+    system = messages[0]
+    if not isinstance(system["content"], str):
+        return messages
+
+    cached_system = {
+        "role": "system",
+        "content": [
+            {
+                "type": "text",
+                "text": system["content"],
+                "cache_control": {"type": "ephemeral"},
+            }
+        ],
+    }
+    return [cached_system, *messages[1:]]
+
+
 def chat_completion(messages: List[Dict[str, str]], model_hint: Optional[str] = None) -> str:
     """
     Execute a LiteLLM chat completion and return the assistant content.
@@ -200,6 +241,7 @@ def chat_completion(messages: List[Dict[str, str]], model_hint: Optional[str] =
     with exponential backoff.
     """
     config = resolve_model(model_hint)
+    messages = _with_prompt_caching(config.model_id, messages)
 
     max_retries = 3
     base_delay = 1.0
@@ -224,6 +266,87 @@ def chat_completion(messages: List[Dict[str, str]], model_hint: Optional[str] =
             raise
 
 
+def _llm_semaphore() -> asyncio.Semaphore:
+    """Return the concurrency limiter for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = _SEMAPHORES[loop] = asyncio.Semaphore(LLM_CONCURRENCY)
+    return semaphore
+
+
+def _use_shared_async_client() -> None:
+    # Reuse the API's pooled client; cleared again (None) once the API shuts it down
+    client = get_async_client()
+    if litellm.aclient_session is not client:
+        litellm.aclient_session = client
+
+
+async def achat_completion(messages: List[Dict[str, str]], model_hint: Optional[str] = None) -> str:
+    """
+    Async variant of `chat_completion` built on LiteLLM's ``acompletion``.
+
+    Lets API handlers await the LLM round-trip without tying up a worker thread,
+    so many in-flight requests overlap their network I/O on one event loop.
+    """
+    config = resolve_model(model_hint)
+    messages = _with_prompt_caching(config.model_id, messages)
+
+    _use_shared_async_client()
+
+    max_retries = 3
+    base_delay = 1.0
+
+    for attempt in range(max_retries):
+        try:
+            # Bounded fan-out: bursts queue here instead of flooding the provider
+            async with _llm_semaphore():
+                response = await acompletion(
+                    model=config.model_id,
+                    messages=messages,
+                    timeout=VISION_LLM_TIMEOUT_SECONDS,
+                    **config.kwargs,
+                )
+            return response.choices[0].message.content.strip()
+        except (APIError, Timeout, RateLimitError):
+            # Retry on transient errors
+            if attempt < max_retries - 1:
+                # Exponential backoff with jitter (the slot is released while waiting)
+                delay = base_delay * (2**attempt) + (time.time() % 1)
+                await asyncio.sleep(delay)
+                continue
+            # Last attempt failed, re-raise
+            raise
+
+
+async def astream_chat_completion(
+    messages: List[Dict[str, str]], model_hint: Optional[str] = None
+) -> AsyncIterator[str]:
+    """
+    Stream a LiteLLM chat completion, yielding content deltas as they arrive.
+
+    Not retried: once tokens have been handed to the caller the request cannot be
+    replayed transparently.
+    """
+    config = resolve_model(model_hint)
+    messages = _with_prompt_caching(config.model_id, messages)
+    _use_shared_async_client()
+
+    # The slot is held for the whole stream, which occupies the backend until it ends
+    async with _llm_semaphore():
+        response = await acompletion(
+            model=config.model_id,
+            messages=messages,
+            timeout=VISION_LLM_TIMEOUT_SECONDS,
+            stream=True,
+            **config.kwargs,
+        )
+        async for chunk in response:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+
+
 def vision_completion(
     prompt: str,
     image_bytes: bytes,
@@ -3,12 +3,19 @@ Public service layer for LlumDocs.
 
 This package exposes high-level functions used by the API and UI:
 translation and various text transformation utilities.
+
+Exports are resolved lazily on first access so that importing a single
+submodule (e.g. ``llumdocs.services.ollama_client``) does not pull in LiteLLM,
+the OCR stack, or the optional email models.
 """
 
 from __future__ import annotations
 
-# Email intelligence is optional (requires [email] extra with torch/transformers)
-try:
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .document_extraction_service import DocumentExtractionError, extract_document_data
     from .email_intelligence_service import (
         DEFAULT_EMAIL_ROUTING_LABELS,
         EmailIntelligenceError,
@@ -17,41 +24,115 @@ try:
         classify_email,
         detect_phishing,
     )
+    from .text_transform_service import (
+        SummaryType,
+        TextTransformError,
+        aextract_keywords,
+        aextract_keywords_batch,
+        amake_text_more_technical,
+        asimplify_text,
+        astream_summary,
+        asummarize_document,
+        asummarize_documents,
+        extract_keywords,
+        make_text_more_technical,
+        simplify_text,
+        summarize_document,
+    )
+    from .translation_service import (
+        TranslationError,
+        astream_translation,
+        atranslate_text,
+        atranslate_texts,
+        translate_text,
+    )
 
-    EMAIL_INTEL_AVAILABLE = True
-except ImportError:
-    EMAIL_INTEL_AVAILABLE = False
-    # Create dummy exports for type checking and runtime checks
-    DEFAULT_EMAIL_ROUTING_LABELS = []  # type: ignore[assignment]
-    EmailIntelligenceError = RuntimeError  # type: ignore[assignment, misc]
-    EmailIntelligenceService = None  # type: ignore[assignment, misc]
-    analyze_sentiment = None  # type: ignore[assignment, misc]
-    classify_email = None  # type: ignore[assignment, misc]
-    detect_phishing = None  # type: ignore[assignment, misc]
+    EMAIL_INTEL_AVAILABLE: bool
 
-from .document_extraction_service import (
-    DocumentExtractionError,
-    extract_document_data,
-)
-from .text_transform_service import (
-    SummaryType,
-    TextTransformError,
-    extract_keywords,
-    make_text_more_technical,
-    simplify_text,
-    summarize_document,
+_EXPORTS = {
+    "DocumentExtractionError": ".document_extraction_service",
+    "extract_document_data": ".document_extraction_service",
+    "SummaryType": ".text_transform_service",
+    "TextTransformError": ".text_transform_service",
+    "extract_keywords": ".text_transform_service",
+    "make_text_more_technical": ".text_transform_service",
+    "simplify_text": ".text_transform_service",
+    "summarize_document": ".text_transform_service",
+    "aextract_keywords": ".text_transform_service",
+    "amake_text_more_technical": ".text_transform_service",
+    "asimplify_text": ".text_transform_service",
+    "asummarize_document": ".text_transform_service",
+    "aextract_keywords_batch": ".text_transform_service",
+    "asummarize_documents": ".text_transform_service",
+    "astream_summary": ".text_transform_service",
+    "TranslationError": ".translation_service",
+    "translate_text": ".translation_service",
+    "atranslate_text": ".translation_service",
+    "atranslate_texts": ".translation_service",
+    "astream_translation": ".translation_service",
+}
+
+_EMAIL_EXPORTS = (
+    "DEFAULT_EMAIL_ROUTING_LABELS",
+    "EmailIntelligenceError",
+    "EmailIntelligenceService",
+    "analyze_sentiment",
+    "classify_email",
+    "detect_phishing",
 )
-from .translation_service import TranslationError, translate_text
+
+
+def _load_email_exports() -> None:
+    # Email intelligence is optional (requires [email] extra with torch/transformers)
+    try:
+        module = importlib.import_module(".email_intelligence_service", __name__)
+    except ImportError:
+        # Create dummy exports for type checking and runtime checks
+        globals().update(
+            EMAIL_INTEL_AVAILABLE=False,
+            DEFAULT_EMAIL_ROUTING_LABELS=[],
+            EmailIntelligenceError=RuntimeError,
+            EmailIntelligenceService=None,
+            analyze_sentiment=None,
+            classify_email=None,
+            detect_phishing=None,
+        )
+        return
+
+    globals().update({name: getattr(module, name) for name in _EMAIL_EXPORTS})
+    globals()["EMAIL_INTEL_AVAILABLE"] = True
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    if name == "EMAIL_INTEL_AVAILABLE" or name in _EMAIL_EXPORTS:
+        _load_email_exports()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "TranslationError",
     "translate_text",
+    "atranslate_text",
+    "atranslate_texts",
+    "astream_translation",
     "TextTransformError",
     "SummaryType",
     "extract_keywords",
     "make_text_more_technical",
     "simplify_text",
     "summarize_document",
+    "aextract_keywords",
+    "amake_text_more_technical",
+    "asimplify_text",
+    "asummarize_document",
+    "aextract_keywords_batch",
+    "asummarize_documents",
+    "astream_summary",
     "DocumentExtractionError",
     "extract_document_data",
     "EMAIL_INTEL_AVAILABLE",
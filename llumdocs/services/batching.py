@@ -0,0 +1,94 @@
+"""
+Row-marshalled batching: answer several same-task prompts with one LLM call.
+
+Each row is the ``[system, user]`` message pair a service would send for a
+single input. Rows sharing a task are merged into one request whose user
+message lists every input behind a ``<<ROW i>>`` marker, and the model is
+asked for a JSON array with one answer per row. This amortizes prefill and
+counts as a single request against provider rate limits.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from collections.abc import Awaitable, Callable, Sequence
+
+# Upper bound on rows per batched call; larger batches grow latency faster than throughput
+MAX_BATCH_SIZE = 16
+
+# Set LLUMDOCS_LLM_BATCHING=false to send one concurrent call per row instead
+BATCHING_ENABLED = os.getenv("LLUMDOCS_LLM_BATCHING", "true").lower() in ("true", "1", "yes")
+
+_BATCH_INSTRUCTIONS = (
+    "\n\nYou will receive several independent inputs, each introduced by a marker "
+    "like <<ROW 1>>. Apply the instructions above to each input separately. "
+    "Return ONLY a JSON array with one element per input, in order, where element i "
+    "is your complete answer for <<ROW i>>."
+)
+
+Messages = list[dict[str, str]]
+
+
+def build_batch_messages(rows: Sequence[Messages]) -> Messages:
+    """Merge per-row ``[system, user]`` prompts that share a system prompt into one request."""
+    system = rows[0][0]["content"] + _BATCH_INSTRUCTIONS
+    body = "\n\n".join(f"<<ROW {index}>>\n{row[1]['content']}" for index, row in enumerate(rows, 1))
+    body += f"\n\nReturn a JSON array with exactly {len(rows)} elements."
+    return [
+        {"role": "system", "content": system},
+        {"role": "user", "content": body},
+    ]
+
+
+def split_batch_response(raw: str, expected: int) -> list[str] | None:
+    """
+    Split a batched answer into one string per row.
+
+    Returns None when the response is not a JSON array of `expected` items, so
+    the caller can fall back to per-row calls. Non-string items (e.g. keyword
+    arrays) are returned JSON-encoded for the row parser to handle.
+    """
+    start = raw.find("[")
+    end = raw.rfind("]")
+    if start == -1 or end < start:
+        return None
+    try:
+        data = json.loads(raw[start : end + 1])
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(data, list) or len(data) != expected:
+        return None
+    return [item if isinstance(item, str) else json.dumps(item) for item in data]
+
+
+async def run_batched(
+    rows: Sequence[Messages], call_llm: Callable[[Messages], Awaitable[str]]
+) -> list[str]:
+    """
+    Answer every row, using a single LLM call when possible.
+
+    Args:
+        rows: Per-row message lists, all built for the same task and parameters.
+        call_llm: Async function sending one message list and returning the text.
+
+    Returns:
+        One raw model answer per row, in order.
+    """
+    if len(rows) > 1 and BATCHING_ENABLED:
+        answers = split_batch_response(await call_llm(build_batch_messages(rows)), len(rows))
+        if answers is not None:
+            return answers
+
+    # Single row, batching disabled, or malformed batch answer: one concurrent call per row
+    return list(await asyncio.gather(*(call_llm(row) for row in rows)))
+
+
+__all__ = [
+    "BATCHING_ENABLED",
+    "MAX_BATCH_SIZE",
+    "build_batch_messages",
+    "run_batched",
+    "split_batch_response",
+]
@@ -9,10 +9,7 @@ from llumdocs.document_extraction.core.ocr import extract_ocr
 from llumdocs.document_extraction.unified_extractor import extract_document
 from llumdocs.document_extraction.unified_visualizer import annotate_document_pdf
 from llumdocs.llm import LLMConfigurationError
-
-
-class DocumentExtractionError(Exception):
-    """Raised when document extraction cannot be completed."""
+from llumdocs.services.errors import DocumentExtractionError
 
 
 def extract_document_data(
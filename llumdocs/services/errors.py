@@ -0,0 +1,32 @@
+"""
+Service exceptions that the API maps to HTTP responses.
+
+Defined apart from the services themselves so the API can register its
+exception handlers without loading LiteLLM or the PDF/OCR stack.
+"""
+
+from __future__ import annotations
+
+
+class TextTransformError(Exception):
+    """Raised when a text transformation cannot be completed."""
+
+
+class TranslationError(Exception):
+    """Raised when a translation cannot be completed."""
+
+
+class ImageDescriptionError(Exception):
+    """Raised when an image description cannot be completed."""
+
+
+class DocumentExtractionError(Exception):
+    """Raised when document extraction cannot be completed."""
+
+
+__all__ = [
+    "DocumentExtractionError",
+    "ImageDescriptionError",
+    "TextTransformError",
+    "TranslationError",
+]
@@ -10,14 +10,11 @@ from typing import Literal
 from PIL import Image
 
 from llumdocs.llm import LLMConfigurationError, vision_completion
+from llumdocs.services.errors import ImageDescriptionError
 
 DetailLevel = Literal["short", "detailed"]
 
 
-class ImageDescriptionError(Exception):
-    """Raised when an image description cannot be completed."""
-
-
 def _validate_detail_level(detail_level: str) -> DetailLevel:
     """Validate and normalize detail level."""
     if detail_level not in {"short", "detailed"}:
@@ -0,0 +1,110 @@
+"""
+In-process cache for LLM text responses.
+
+Identical requests (same resolved model and the same messages, which already
+encode the task, the text and every parameter) are answered from memory
+instead of re-running the LLM. Entries expire after a TTL and the cache is
+bounded with LRU eviction.
+
+The cache is opt-in: LLM output is sampled, so reusing an answer is only
+appropriate when operators accept that repeated inputs get repeated outputs.
+Set ``LLUMDOCS_LLM_CACHE_TTL_SECONDS`` to a positive value to enable it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+
+from llumdocs.llm import resolve_model
+
+Messages = list[dict[str, str]]
+
+
+class LLMCache:
+    """Thread-safe TTL + LRU cache of LLM responses keyed by a request hash."""
+
+    def __init__(self, maxsize: int = 512, ttl: float = 0.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.maxsize > 0
+
+    def make_key(self, messages: Messages, model_hint: str | None) -> str:
+        """Hash the resolved model id together with the full message list."""
+        model_id = resolve_model(model_hint).model_id
+        payload = json.dumps([model_id, messages], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+LLM_CACHE = LLMCache(
+    maxsize=int(os.getenv("LLUMDOCS_LLM_CACHE_SIZE", "512")),
+    ttl=float(os.getenv("LLUMDOCS_LLM_CACHE_TTL_SECONDS", "0")),
+)
+
+
+def cached_completion(
+    call: Callable[..., str], messages: Messages, *, model_hint: str | None
+) -> str:
+    """Run `call(messages, model_hint=...)` through `LLM_CACHE` when it is enabled."""
+    if not LLM_CACHE.enabled:
+        return call(messages, model_hint=model_hint)
+
+    key = LLM_CACHE.make_key(messages, model_hint)
+    cached = LLM_CACHE.get(key)
+    if cached is not None:
+        return cached
+    response = call(messages, model_hint=model_hint)
+    LLM_CACHE.set(key, response)
+    return response
+
+
+async def acached_completion(
+    call: Callable[..., Awaitable[str]], messages: Messages, *, model_hint: str | None
+) -> str:
+    """Async counterpart of `cached_completion`."""
+    if not LLM_CACHE.enabled:
+        return await call(messages, model_hint=model_hint)
+
+    key = LLM_CACHE.make_key(messages, model_hint)
+    cached = LLM_CACHE.get(key)
+    if cached is not None:
+        return cached
+    response = await call(messages, model_hint=model_hint)
+    LLM_CACHE.set(key, response)
+    return response
+
+
+__all__ = ["LLMCache", "LLM_CACHE", "acached_completion", "cached_completion"]
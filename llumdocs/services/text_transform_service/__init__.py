@@ -7,10 +7,16 @@ file to keep responsibilities focused and maintenance simpler.
 
 from .common import TextTransformError
 from .company_tone import CALM_PROFESSIONAL, SERIOUS_IMPORTANT, apply_company_tone
-from .keywords import extract_keywords
-from .simplify import simplify_text
-from .summary import SummaryType, summarize_document
-from .technical import make_text_more_technical
+from .keywords import aextract_keywords, aextract_keywords_batch, extract_keywords
+from .simplify import asimplify_text, simplify_text
+from .summary import (
+    SummaryType,
+    astream_summary,
+    asummarize_document,
+    asummarize_documents,
+    summarize_document,
+)
+from .technical import amake_text_more_technical, make_text_more_technical
 
 __all__ = [
     "TextTransformError",
@@ -22,4 +28,11 @@ __all__ = [
     "simplify_text",
     "summarize_document",
     "make_text_more_technical",
+    "aextract_keywords",
+    "asimplify_text",
+    "asummarize_document",
+    "amake_text_more_technical",
+    "aextract_keywords_batch",
+    "asummarize_documents",
+    "astream_summary",
 ]
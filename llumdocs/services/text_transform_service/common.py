@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-from llumdocs.llm import LLMConfigurationError, chat_completion
+from collections.abc import AsyncIterator
 
-
-class TextTransformError(Exception):
-    """Raised when a text transformation cannot be completed."""
+from llumdocs.llm import (
+    LLMConfigurationError,
+    achat_completion,
+    astream_chat_completion,
+    chat_completion,
+)
+from llumdocs.services.batching import MAX_BATCH_SIZE
+from llumdocs.services.errors import TextTransformError
+from llumdocs.services.llm_cache import acached_completion, cached_completion
 
 
 def _validate_text(text: str, *, field_name: str = "text") -> str:
@@ -13,13 +19,48 @@ def _validate_text(text: str, *, field_name: str = "text") -> str:
     return text.strip()
 
 
+def _validate_batch(texts: list[str]) -> None:
+    if not texts:
+        raise TextTransformError("items cannot be empty.")
+    if len(texts) > MAX_BATCH_SIZE:
+        raise TextTransformError(f"items cannot contain more than {MAX_BATCH_SIZE} texts.")
+
+
 def _call_llm(messages: list[dict[str, str]], *, model_hint: str | None) -> str:
     try:
-        return chat_completion(messages, model_hint=model_hint)
+        return cached_completion(chat_completion, messages, model_hint=model_hint)
+    except LLMConfigurationError as exc:
+        raise TextTransformError(str(exc)) from exc
+    except Exception as exc:  # noqa: BLE001
+        raise TextTransformError(f"LLM request failed: {exc}") from exc
+
+
+async def _acall_llm(messages: list[dict[str, str]], *, model_hint: str | None) -> str:
+    try:
+        return await acached_completion(achat_completion, messages, model_hint=model_hint)
+    except LLMConfigurationError as exc:
+        raise TextTransformError(str(exc)) from exc
+    except Exception as exc:  # noqa: BLE001
+        raise TextTransformError(f"LLM request failed: {exc}") from exc
+
+
+async def _astream_llm(
+    messages: list[dict[str, str]], *, model_hint: str | None
+) -> AsyncIterator[str]:
+    try:
+        async for delta in astream_chat_completion(messages, model_hint=model_hint):
+            yield delta
     except LLMConfigurationError as exc:
         raise TextTransformError(str(exc)) from exc
     except Exception as exc:  # noqa: BLE001
         raise TextTransformError(f"LLM request failed: {exc}") from exc
 
 
-__all__ = ["TextTransformError", "_call_llm", "_validate_text"]
+__all__ = [
+    "TextTransformError",
+    "_acall_llm",
+    "_astream_llm",
+    "_call_llm",
+    "_validate_batch",
+    "_validate_text",
+]
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import functools
 import json
 import re
 
-from .common import TextTransformError, _call_llm, _validate_text
+from llumdocs.services.batching import run_batched
+
+from .common import TextTransformError, _acall_llm, _call_llm, _validate_batch, _validate_text
 
 
 def _coerce_to_json_array(text: str) -> list[str]:
@@ -87,16 +90,7 @@ def _coerce_to_json_array(text: str) -> list[str]:
     raise ValueError("Could not coerce model output to a JSON array.")
 
 
-def extract_keywords(
-    text: str,
-    *,
-    max_keywords: int = 10,
-    model_hint: str | None = None,
-) -> list[str]:
-    """
-    Return a list of relevant keywords for `text`.
-    """
-
+def _keywords_messages(text: str, max_keywords: int) -> list[dict[str, str]]:
     _validate_text(text)
     if not isinstance(max_keywords, int) or max_keywords <= 0:
         raise TextTransformError("max_keywords must be a positive integer.")
@@ -114,14 +108,13 @@ def extract_keywords(
         "Text:\n"
         f"{text.strip()}"
     )
-    raw_response = _call_llm(
-        [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
-        model_hint=model_hint,
-    )
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt},
+    ]
+
 
+def _parse_keywords(raw_response: str, max_keywords: int) -> list[str]:
     try:
         parsed = _coerce_to_json_array(raw_response)
     except ValueError as exc:
@@ -138,3 +131,49 @@ def extract_keywords(
         raise TextTransformError("No keywords returned by the model.")
 
     return keywords
+
+
+def extract_keywords(
+    text: str,
+    *,
+    max_keywords: int = 10,
+    model_hint: str | None = None,
+) -> list[str]:
+    """
+    Return a list of relevant keywords for `text`.
+    """
+
+    messages = _keywords_messages(text, max_keywords)
+    raw_response = _call_llm(messages, model_hint=model_hint)
+    return _parse_keywords(raw_response, max_keywords)
+
+
+async def aextract_keywords(
+    text: str,
+    *,
+    max_keywords: int = 10,
+    model_hint: str | None = None,
+) -> list[str]:
+    """
+    Async variant of `extract_keywords`.
+    """
+
+    messages = _keywords_messages(text, max_keywords)
+    raw_response = await _acall_llm(messages, model_hint=model_hint)
+    return _parse_keywords(raw_response, max_keywords)
+
+
+async def aextract_keywords_batch(
+    texts: list[str],
+    *,
+    max_keywords: int = 10,
+    model_hint: str | None = None,
+) -> list[list[str]]:
+    """
+    Extract keywords for several texts, row-marshalled into a single LLM call.
+    """
+
+    _validate_batch(texts)
+    rows = [_keywords_messages(text, max_keywords) for text in texts]
+    answers = await run_batched(rows, functools.partial(_acall_llm, model_hint=model_hint))
+    return [_parse_keywords(answer, max_keywords) for answer in answers]
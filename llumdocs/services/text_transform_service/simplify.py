@@ -1,18 +1,9 @@
 from __future__ import annotations
 
-from .common import _call_llm, _validate_text
+from .common import _acall_llm, _call_llm, _validate_text
 
 
-def simplify_text(
-    text: str,
-    *,
-    target_reading_level: str | None = None,
-    model_hint: str | None = None,
-) -> str:
-    """
-    Rewrite `text` into plain language.
-    """
-
+def _simplify_messages(text: str, target_reading_level: str | None) -> list[dict[str, str]]:
     _validate_text(text)
 
     constraints = [
@@ -29,16 +20,39 @@ def simplify_text(
         f"{text.strip()}"
     )
 
-    return _call_llm(
-        [
-            {
-                "role": "system",
-                "content": (
-                    "You simplify texts for broad audiences. Produce only the simplified text "
-                    "without commentary."
-                ),
-            },
-            {"role": "user", "content": user_prompt},
-        ],
-        model_hint=model_hint,
-    )
+    return [
+        {
+            "role": "system",
+            "content": (
+                "You simplify texts for broad audiences. Produce only the simplified text "
+                "without commentary."
+            ),
+        },
+        {"role": "user", "content": user_prompt},
+    ]
+
+
+def simplify_text(
+    text: str,
+    *,
+    target_reading_level: str | None = None,
+    model_hint: str | None = None,
+) -> str:
+    """
+    Rewrite `text` into plain language.
+    """
+
+    return _call_llm(_simplify_messages(text, target_reading_level), model_hint=model_hint)
+
+
+async def asimplify_text(
+    text: str,
+    *,
+    target_reading_level: str | None = None,
+    model_hint: str | None = None,
+) -> str:
+    """
+    Async variant of `simplify_text`.
+    """
+
+    return await _acall_llm(_simplify_messages(text, target_reading_level), model_hint=model_hint)
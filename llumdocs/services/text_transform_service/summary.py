@@ -1,22 +1,22 @@
 from __future__ import annotations
 
-from typing import Literal
+import functools
+from collections.abc import AsyncIterator
 
-from .common import TextTransformError, _call_llm, _validate_text
+from llumdocs.services.batching import run_batched
+from llumdocs.services.types import SummaryType
 
-SummaryType = Literal["short", "detailed", "executive"]
+from .common import (
+    TextTransformError,
+    _acall_llm,
+    _astream_llm,
+    _call_llm,
+    _validate_batch,
+    _validate_text,
+)
 
 
-def summarize_document(
-    text: str,
-    *,
-    summary_type: SummaryType = "short",
-    model_hint: str | None = None,
-) -> str:
-    """
-    Produce a summary of `text` according to `summary_type`.
-    """
-
+def _summary_messages(text: str, summary_type: SummaryType) -> list[dict[str, str]]:
     _validate_text(text)
     if summary_type not in {"short", "detailed", "executive"}:
         raise TextTransformError("summary_type must be short, detailed, or executive.")
@@ -30,7 +30,7 @@ def summarize_document(
         ),
     }
 
-    messages = [
+    return [
         {
             "role": "system",
             "content": (
@@ -49,4 +49,61 @@ def summarize_document(
         },
     ]
 
-    return _call_llm(messages, model_hint=model_hint)
+
+def summarize_document(
+    text: str,
+    *,
+    summary_type: SummaryType = "short",
+    model_hint: str | None = None,
+) -> str:
+    """
+    Produce a summary of `text` according to `summary_type`.
+    """
+
+    return _call_llm(_summary_messages(text, summary_type), model_hint=model_hint)
+
+
+async def asummarize_document(
+    text: str,
+    *,
+    summary_type: SummaryType = "short",
+    model_hint: str | None = None,
+) -> str:
+    """
+    Async variant of `summarize_document`.
+    """
+
+    return await _acall_llm(_summary_messages(text, summary_type), model_hint=model_hint)
+
+
+async def asummarize_documents(
+    texts: list[str],
+    *,
+    summary_type: SummaryType = "short",
+    model_hint: str | None = None,
+) -> list[str]:
+    """
+    Summarize several texts, row-marshalled into a single LLM call.
+    """
+
+    _validate_batch(texts)
+    rows = [_summary_messages(text, summary_type) for text in texts]
+    answers = await run_batched(rows, functools.partial(_acall_llm, model_hint=model_hint))
+    return [answer.strip() for answer in answers]
+
+
+async def astream_summary(
+    text: str,
+    *,
+    summary_type: SummaryType = "short",
+    model_hint: str | None = None,
+) -> AsyncIterator[str]:
+    """
+    Stream a summary of `text` as the model generates it.
+
+    Validation runs when iteration starts, so errors surface on the first chunk.
+    """
+
+    messages = _summary_messages(text, summary_type)
+    async for delta in _astream_llm(messages, model_hint=model_hint):
+        yield delta
@@ -1,19 +1,11 @@
 from __future__ import annotations
 
-from .common import _call_llm, _validate_text
+from .common import _acall_llm, _call_llm, _validate_text
 
 
-def make_text_more_technical(
-    text: str,
-    *,
-    domain: str | None = None,
-    target_level: str | None = None,
-    model_hint: str | None = None,
-) -> str:
-    """
-    Rewrite `text` with a more technical tone.
-    """
-
+def _technical_messages(
+    text: str, domain: str | None, target_level: str | None
+) -> list[dict[str, str]]:
     _validate_text(text)
 
     constraints = [
@@ -32,16 +24,41 @@ def make_text_more_technical(
         f"{text.strip()}"
     )
 
-    return _call_llm(
-        [
-            {
-                "role": "system",
-                "content": (
-                    "You are an expert technical writer. Produce precise and formal prose "
-                    "without explanations outside the rewritten text."
-                ),
-            },
-            {"role": "user", "content": user_prompt},
-        ],
-        model_hint=model_hint,
-    )
+    return [
+        {
+            "role": "system",
+            "content": (
+                "You are an expert technical writer. Produce precise and formal prose "
+                "without explanations outside the rewritten text."
+            ),
+        },
+        {"role": "user", "content": user_prompt},
+    ]
+
+
+def make_text_more_technical(
+    text: str,
+    *,
+    domain: str | None = None,
+    target_level: str | None = None,
+    model_hint: str | None = None,
+) -> str:
+    """
+    Rewrite `text` with a more technical tone.
+    """
+
+    return _call_llm(_technical_messages(text, domain, target_level), model_hint=model_hint)
+
+
+async def amake_text_more_technical(
+    text: str,
+    *,
+    domain: str | None = None,
+    target_level: str | None = None,
+    model_hint: str | None = None,
+) -> str:
+    """
+    Async variant of `make_text_more_technical`.
+    """
+
+    return await _acall_llm(_technical_messages(text, domain, target_level), model_hint=model_hint)
@@ -4,9 +4,19 @@ Translation service implementation using LiteLLM.
 
 from __future__ import annotations
 
-from typing import Literal
-
-from llumdocs.llm import LLMConfigurationError, chat_completion
+import functools
+from collections.abc import AsyncIterator
+
+from llumdocs.llm import (
+    LLMConfigurationError,
+    achat_completion,
+    astream_chat_completion,
+    chat_completion,
+)
+from llumdocs.services.batching import MAX_BATCH_SIZE, run_batched
+from llumdocs.services.errors import TranslationError
+from llumdocs.services.llm_cache import acached_completion, cached_completion
+from llumdocs.services.types import SourceLanguage, TargetLanguage
 
 SUPPORTED_LANGUAGES = {
     "ca": "Catalan",
@@ -14,12 +24,19 @@ SUPPORTED_LANGUAGES = {
     "en": "English",
 }
 
-SourceLanguage = Literal["auto", "ca", "es", "en"]
-TargetLanguage = Literal["ca", "es", "en"]
-
 
-class TranslationError(Exception):
-    """Raised when a translation cannot be completed."""
+# Static instructions go in the system message so providers can cache the prefix
+_SYSTEM_PROMPT = (
+    "You are a professional translator. "
+    "Translate the user's text while preserving the meaning, tone, and formatting. "
+    "If the source language is 'auto-detect', detect Catalan, Spanish, or "
+    "English automatically. "
+    "Return only the translated text with no explanations.\n"
+    "Constraints:\n"
+    "- Maintain punctuation and numeric values.\n"
+    "- Do not add explanations or notes.\n"
+    "- Keep markdown elements if present."
+)
 
 
 def _validate_languages(
@@ -36,12 +53,43 @@ def _validate_languages(
     if target not in SUPPORTED_LANGUAGES:
         raise TranslationError(f"target_lang must be one of ca, es, en (received {target_lang!r}).")
 
-    if source != "auto" and source == target:
-        raise TranslationError("source_lang and target_lang must differ.")
-
     return source, target  # type: ignore[return-value]
 
 
+@functools.cache
+def _language_detector():
+    """Build the local language detector once, or return None if lingua is not installed."""
+    try:
+        from lingua import Language, LanguageDetectorBuilder
+    except ImportError:
+        return None
+    return (
+        LanguageDetectorBuilder.from_languages(Language.CATALAN, Language.SPANISH, Language.ENGLISH)
+        # Answer None instead of guessing when the languages are too close to call
+        .with_minimum_relative_distance(0.25).build()
+    )
+
+
+def _detect_language(text: str) -> str | None:
+    detector = _language_detector()
+    if detector is None:
+        return None
+    language = detector.detect_language_of(text)
+    return None if language is None else language.iso_code_639_1.name.lower()
+
+
+def _is_identity(text: str, source_lang: SourceLanguage, target_lang: TargetLanguage) -> bool:
+    """
+    Return True when `text` is already in `target_lang` and needs no LLM call.
+
+    With ``source_lang="auto"`` this relies on the optional ``lingua`` detector and
+    is always False when it is not installed.
+    """
+    if source_lang == "auto":
+        return _detect_language(text) == target_lang
+    return source_lang == target_lang
+
+
 def _build_prompt(
     text: str, source_lang: SourceLanguage, target_lang: TargetLanguage
 ) -> list[dict[str, str]]:
@@ -51,28 +99,16 @@ def _build_prompt(
     source_label = "auto-detect" if source_lang == "auto" else SUPPORTED_LANGUAGES[source_lang]
     target_label = SUPPORTED_LANGUAGES[target_lang]
 
-    instruction = (
-        "You are a professional translator. "
-        "Translate the user's text while preserving the meaning, tone, and formatting. "
-        "If the source language is 'auto-detect', detect Catalan, Spanish, or "
-        "English automatically. "
-        "Return only the translated text with no explanations."
-    )
-
     user_content = (
         f"Source language: {source_label}\n"
         f"Target language: {target_label}\n"
-        "Constraints:\n"
-        "- Maintain punctuation and numeric values.\n"
-        "- Do not add explanations or notes.\n"
-        "- Keep markdown elements if present.\n"
         "\n"
         "Text to translate:\n"
         f"{text.strip()}"
     )
 
     return [
-        {"role": "system", "content": instruction},
+        {"role": "system", "content": _SYSTEM_PROMPT},
         {"role": "user", "content": user_content},
     ]
 
@@ -87,6 +123,9 @@ def translate_text(
     """
     Translate `text` between Catalan, Spanish, and English using LiteLLM.
 
+    Text that is already in `target_lang` (same explicit source language, or
+    detected locally when ``source_lang="auto"``) is returned without an LLM call.
+
     Args:
         text: Content to translate.
         source_lang: "auto" or ISO-like code (ca/es/en).
@@ -102,9 +141,104 @@ def translate_text(
 
     source, target = _validate_languages(source_lang, target_lang)
     messages = _build_prompt(text, source, target)
+    if _is_identity(text, source, target):
+        return text.strip()
+
+    try:
+        return cached_completion(chat_completion, messages, model_hint=model_hint)
+    except LLMConfigurationError as exc:
+        raise TranslationError(str(exc)) from exc
+    except Exception as exc:  # noqa: BLE001
+        raise TranslationError(f"Translation failed: {exc}") from exc
+
+
+async def _acall_llm(messages: list[dict[str, str]], *, model_hint: str | None) -> str:
+    try:
+        return await acached_completion(achat_completion, messages, model_hint=model_hint)
+    except LLMConfigurationError as exc:
+        raise TranslationError(str(exc)) from exc
+    except Exception as exc:  # noqa: BLE001
+        raise TranslationError(f"Translation failed: {exc}") from exc
+
+
+async def atranslate_text(
+    text: str,
+    source_lang: SourceLanguage = "auto",
+    target_lang: TargetLanguage = "ca",
+    *,
+    model_hint: str | None = None,
+) -> str:
+    """
+    Async variant of `translate_text` that awaits LiteLLM's ``acompletion``.
+
+    Raises:
+        TranslationError: For validation or backend failures.
+    """
+
+    source, target = _validate_languages(source_lang, target_lang)
+    messages = _build_prompt(text, source, target)
+    if _is_identity(text, source, target):
+        return text.strip()
+    return await _acall_llm(messages, model_hint=model_hint)
+
+
+async def atranslate_texts(
+    texts: list[str],
+    source_lang: SourceLanguage = "auto",
+    target_lang: TargetLanguage = "ca",
+    *,
+    model_hint: str | None = None,
+) -> list[str]:
+    """
+    Translate several texts, row-marshalled into a single LLM call.
+
+    Raises:
+        TranslationError: For validation or backend failures.
+    """
+
+    if not texts:
+        raise TranslationError("items cannot be empty.")
+    if len(texts) > MAX_BATCH_SIZE:
+        raise TranslationError(f"items cannot contain more than {MAX_BATCH_SIZE} texts.")
+
+    source, target = _validate_languages(source_lang, target_lang)
+    rows = [_build_prompt(text, source, target) for text in texts]
+    # Texts already in the target language are returned as-is; only the rest hit the LLM
+    results = [text.strip() for text in texts]
+    pending = [index for index, text in enumerate(texts) if not _is_identity(text, source, target)]
+    if pending:
+        answers = await run_batched(
+            [rows[index] for index in pending],
+            functools.partial(_acall_llm, model_hint=model_hint),
+        )
+        for index, answer in zip(pending, answers, strict=True):
+            results[index] = answer.strip()
+    return results
+
+
+async def astream_translation(
+    text: str,
+    source_lang: SourceLanguage = "auto",
+    target_lang: TargetLanguage = "ca",
+    *,
+    model_hint: str | None = None,
+) -> AsyncIterator[str]:
+    """
+    Stream the translation of `text` as the model generates it.
+
+    Raises:
+        TranslationError: For validation or backend failures (on first iteration).
+    """
+
+    source, target = _validate_languages(source_lang, target_lang)
+    messages = _build_prompt(text, source, target)
+    if _is_identity(text, source, target):
+        yield text.strip()
+        return
 
     try:
-        return chat_completion(messages, model_hint=model_hint)
+        async for delta in astream_chat_completion(messages, model_hint=model_hint):
+            yield delta
     except LLMConfigurationError as exc:
         raise TranslationError(str(exc)) from exc
     except Exception as exc:  # noqa: BLE001
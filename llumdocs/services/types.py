@@ -0,0 +1,17 @@
+"""
+Option types shared by the services and the API request models.
+
+Kept free of heavy imports so the API can declare its request models
+without loading LiteLLM.
+"""
+
+from __future__ import annotations
+
+from typing import Literal
+
+SummaryType = Literal["short", "detailed", "executive"]
+
+SourceLanguage = Literal["auto", "ca", "es", "en"]
+TargetLanguage = Literal["ca", "es", "en"]
+
+__all__ = ["SourceLanguage", "SummaryType", "TargetLanguage"]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -20,10 +22,10 @@ def client():
 
 
 def test_keywords_endpoint_success(monkeypatch, client):
-    monkeypatch.setattr(
-        "llumdocs.api.text_tools_endpoints.extract_keywords",
-        lambda *_, **__: ["alpha", "beta"],
-    )
+    async def fake_extract(*_, **__):
+        return ["alpha", "beta"]
+
+    monkeypatch.setattr("llumdocs.services.text_transform_service.aextract_keywords", fake_extract)
 
     response = client.post(
         "/api/text/keywords",
@@ -35,10 +37,10 @@ def test_keywords_endpoint_success(monkeypatch, client):
 
 
 def test_keywords_endpoint_error(monkeypatch, client):
-    def fake_extract(*_, **__):
+    async def fake_extract(*_, **__):
         raise TextTransformError("bad input")
 
-    monkeypatch.setattr("llumdocs.api.text_tools_endpoints.extract_keywords", fake_extract)
+    monkeypatch.setattr("llumdocs.services.text_transform_service.aextract_keywords", fake_extract)
 
     response = client.post("/api/text/keywords", json={"text": "Example"})
 
@@ -46,10 +48,82 @@ def test_keywords_endpoint_error(monkeypatch, client):
     assert response.json()["detail"] == "bad input"
 
 
+def test_batch_endpoints_success(monkeypatch, client):
+    async def fake_keywords_batch(texts, **__):
+        return [["kw"] for _ in texts]
+
+    async def fake_summaries(texts, **__):
+        return [f"summary {i}" for i, _ in enumerate(texts)]
+
+    async def fake_translations(texts, **__):
+        return [text.upper() for text in texts]
+
+    monkeypatch.setattr(
+        "llumdocs.services.text_transform_service.aextract_keywords_batch", fake_keywords_batch
+    )
+    monkeypatch.setattr(
+        "llumdocs.services.text_transform_service.asummarize_documents", fake_summaries
+    )
+    monkeypatch.setattr("llumdocs.services.translation_service.atranslate_texts", fake_translations)
+
+    keywords = client.post("/api/text/keywords/batch", json={"items": ["a", "b"]})
+    summaries = client.post("/api/documents/summarize/batch", json={"items": ["a", "b"]})
+    translations = client.post(
+        "/api/translate/batch",
+        json={"items": ["hola", "adeu"], "source_lang": "ca", "target_lang": "en"},
+    )
+    too_many = client.post("/api/text/keywords/batch", json={"items": ["a"] * 17})
+
+    assert keywords.json() == {"results": [["kw"], ["kw"]]}
+    assert summaries.json() == {"summaries": ["summary 0", "summary 1"]}
+    assert translations.json() == {"translated_texts": ["HOLA", "ADEU"]}
+    assert too_many.status_code == 422
+
+
+def test_streaming_endpoints_emit_sse_deltas(monkeypatch, client):
+    async def fake_stream(*_, **__):
+        for delta in ("Hola", " món"):
+            yield delta
+
+    monkeypatch.setattr("llumdocs.services.text_transform_service.astream_summary", fake_stream)
+    monkeypatch.setattr("llumdocs.services.translation_service.astream_translation", fake_stream)
+
+    summary = client.post("/api/documents/summarize/stream", json={"text": "Long text"})
+    translation = client.post(
+        "/api/translate/stream",
+        json={"text": "Hello world", "source_lang": "en", "target_lang": "ca"},
+    )
+
+    for response in (summary, translation):
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.text == (
+            'data: {"delta":"Hola"}\n\ndata: {"delta":" món"}\n\ndata: [DONE]\n\n'
+        )
+
+
+def test_streaming_endpoint_maps_errors_before_first_chunk(monkeypatch, client):
+    async def failing_stream(*_, **__):
+        raise TranslationError("unsupported language")
+        yield ""  # pragma: no cover - makes this an async generator
+
+    monkeypatch.setattr("llumdocs.services.translation_service.astream_translation", failing_stream)
+
+    response = client.post(
+        "/api/translate/stream",
+        json={"text": "Hello", "source_lang": "en", "target_lang": "ca"},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "unsupported language"
+
+
 def test_summarize_endpoint_success(monkeypatch, client):
+    async def fake_summarize(*_, **__):
+        return "Summary text"
+
     monkeypatch.setattr(
-        "llumdocs.api.text_tools_endpoints.summarize_document",
-        lambda *_, **__: "Summary text",
+        "llumdocs.services.text_transform_service.asummarize_document", fake_summarize
     )
 
     response = client.post(
@@ -62,9 +136,11 @@ def test_summarize_endpoint_success(monkeypatch, client):
 
 
 def test_make_technical_endpoint_success(monkeypatch, client):
+    async def fake_technical(*_, **__):
+        return "Technical version"
+
     monkeypatch.setattr(
-        "llumdocs.api.text_tools_endpoints.make_text_more_technical",
-        lambda *_, **__: "Technical version",
+        "llumdocs.services.text_transform_service.amake_text_more_technical", fake_technical
     )
 
     response = client.post(
@@ -77,10 +153,10 @@ def test_make_technical_endpoint_success(monkeypatch, client):
 
 
 def test_plain_language_endpoint_success(monkeypatch, client):
-    monkeypatch.setattr(
-        "llumdocs.api.text_tools_endpoints.simplify_text",
-        lambda *_, **__: "Simple text",
-    )
+    async def fake_simplify(*_, **__):
+        return "Simple text"
+
+    monkeypatch.setattr("llumdocs.services.text_transform_service.asimplify_text", fake_simplify)
 
     response = client.post(
         "/api/text/plain",
@@ -92,10 +168,10 @@ def test_plain_language_endpoint_success(monkeypatch, client):
 
 
 def test_translation_endpoint_success(monkeypatch, client):
-    monkeypatch.setattr(
-        "llumdocs.api.translation_endpoints.translate_text",
-        lambda *_, **__: "Hola món",
-    )
+    async def fake_translate(*_, **__):
+        return "Hola món"
+
+    monkeypatch.setattr("llumdocs.services.translation_service.atranslate_text", fake_translate)
 
     response = client.post(
         "/api/translate",
@@ -107,10 +183,10 @@ def test_translation_endpoint_success(monkeypatch, client):
 
 
 def test_translation_endpoint_error(monkeypatch, client):
-    def fake_translate(*_, **__):
+    async def fake_translate(*_, **__):
         raise TranslationError("unsupported language")
 
-    monkeypatch.setattr("llumdocs.api.translation_endpoints.translate_text", fake_translate)
+    monkeypatch.setattr("llumdocs.services.translation_service.atranslate_text", fake_translate)
 
     response = client.post(
         "/api/translate",
@@ -121,9 +197,19 @@ def test_translation_endpoint_error(monkeypatch, client):
     assert response.json()["detail"] == "unsupported language"
 
 
+def test_enum_fields_reject_unknown_values(client):
+    summary = client.post("/api/documents/summarize", json={"text": "x", "summary_type": "long"})
+    translation = client.post("/api/translate", json={"text": "x", "target_lang": "fr"})
+    schema = client.get("/openapi.json").json()["components"]["schemas"]
+
+    assert summary.status_code == 422
+    assert translation.status_code == 422
+    assert schema["TranslationRequest"]["properties"]["target_lang"]["enum"] == ["ca", "es", "en"]
+
+
 def test_image_describe_endpoint_success(monkeypatch, client):
     monkeypatch.setattr(
-        "llumdocs.api.image_endpoints.describe_image",
+        "llumdocs.services.image_description_service.describe_image",
         lambda *_, **__: "A beautiful landscape with mountains and trees",
     )
 
@@ -149,7 +235,7 @@ def test_image_describe_endpoint_success(monkeypatch, client):
 
 def test_image_describe_endpoint_detailed(monkeypatch, client):
     monkeypatch.setattr(
-        "llumdocs.api.image_endpoints.describe_image",
+        "llumdocs.services.image_description_service.describe_image",
         lambda *_, **__: "Detailed description of the image",
     )
 
@@ -207,7 +293,7 @@ def test_image_describe_endpoint_error(monkeypatch, client):
     def fake_describe(*_, **__):
         raise ImageDescriptionError("invalid detail level")
 
-    monkeypatch.setattr("llumdocs.api.image_endpoints.describe_image", fake_describe)
+    monkeypatch.setattr("llumdocs.services.image_description_service.describe_image", fake_describe)
 
     from io import BytesIO
 
@@ -260,7 +346,7 @@ def test_image_description_endpoint_calls_full_stack(monkeypatch, client):
 def test_document_extraction_endpoint_success_deliverynote(monkeypatch, client):
     """Test successful document extraction for deliverynote type."""
     monkeypatch.setattr(
-        "llumdocs.api.document_extraction_endpoints.extract_document_data",
+        "llumdocs.services.document_extraction_service.extract_document_data",
         lambda *_, **__: ({"numero_albaran": "123", "fecha_albaran": "2024-01-01"}, b"pdf_bytes"),
     )
 
@@ -277,10 +363,28 @@ def test_document_extraction_endpoint_success_deliverynote(monkeypatch, client):
     }
 
 
+def test_document_extraction_response_is_gzipped(monkeypatch, client):
+    monkeypatch.setattr(
+        "llumdocs.services.document_extraction_service.extract_document_data",
+        lambda *_, **__: ({"numero_albaran": "123"}, b"%PDF" * 4096),
+    )
+
+    response = client.post(
+        "/api/documents/extract",
+        files={"file": ("test.pdf", b"fake pdf content", "application/pdf")},
+        data={"doc_type": "deliverynote", "model": ""},
+        headers={"Accept-Encoding": "gzip"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json()["extracted_data"] == {"numero_albaran": "123"}
+
+
 def test_document_extraction_endpoint_success_bank(monkeypatch, client):
     """Test successful document extraction for bank type."""
     monkeypatch.setattr(
-        "llumdocs.api.document_extraction_endpoints.extract_document_data",
+        "llumdocs.services.document_extraction_service.extract_document_data",
         lambda *_, **__: ({"banco": "Test Bank", "iban": "ES123456789"}, b"pdf_bytes"),
     )
 
@@ -297,7 +401,7 @@ def test_document_extraction_endpoint_success_bank(monkeypatch, client):
 def test_document_extraction_endpoint_success_payroll(monkeypatch, client):
     """Test successful document extraction for payroll type."""
     monkeypatch.setattr(
-        "llumdocs.api.document_extraction_endpoints.extract_document_data",
+        "llumdocs.services.document_extraction_service.extract_document_data",
         lambda *_, **__: ({"empresa_nif": "12345678A", "periodo": "2024-01"}, b"pdf_bytes"),
     )
 
@@ -321,6 +425,41 @@ def test_document_extraction_endpoint_invalid_doc_type(client):
     assert response.status_code == 422  # Validation error
 
 
+def test_document_extraction_endpoint_checks_extension(monkeypatch, client):
+    seen = {}
+
+    def fake_extract(*, file_path, **__):
+        seen["suffix"] = file_path.suffix
+        return {}, b"pdf_bytes"
+
+    monkeypatch.setattr(
+        "llumdocs.services.document_extraction_service.extract_document_data", fake_extract
+    )
+
+    rejected = client.post(
+        "/api/documents/extract",
+        files={"file": ("notes.txt", b"text", "text/plain")},
+        data={"doc_type": "deliverynote"},
+    )
+    accepted = client.post(
+        "/api/documents/extract",
+        files={"file": ("SCAN.TIFF", b"fake tiff", "image/tiff")},
+        data={"doc_type": "deliverynote"},
+    )
+
+    assert rejected.status_code == 400
+    assert "Unsupported file type" in rejected.json()["detail"]
+    assert accepted.status_code == 200
+    assert seen["suffix"] == ".tiff"
+
+    dot_file = client.post(
+        "/api/documents/extract",
+        files={"file": (".pdf", b"fake pdf content", "application/pdf")},
+        data={"doc_type": "deliverynote"},
+    )
+    assert dot_file.status_code == 400
+
+
 def test_document_extraction_endpoint_error(monkeypatch, client):
     """Test that service errors are handled correctly."""
 
@@ -328,7 +467,7 @@ def test_document_extraction_endpoint_error(monkeypatch, client):
         raise DocumentExtractionError("Unknown doc_type: invalid")
 
     monkeypatch.setattr(
-        "llumdocs.api.document_extraction_endpoints.extract_document_data", fake_extract
+        "llumdocs.services.document_extraction_service.extract_document_data", fake_extract
     )
 
     response = client.post(
@@ -339,3 +478,219 @@ def test_document_extraction_endpoint_error(monkeypatch, client):
 
     assert response.status_code == 400
     assert response.json()["detail"] == "Unknown doc_type: invalid"
+
+
+def test_cors_preflight_is_answered_without_routing(client):
+    response = client.options(
+        "/api/translate",
+        headers={
+            "Origin": "http://localhost:7860",
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "content-type",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "*"
+    assert "POST" in response.headers["access-control-allow-methods"]
+    assert response.headers["access-control-allow-headers"] == "content-type"
+
+
+def test_cors_headers_added_to_simple_requests(client):
+    response = client.get("/health", headers={"Origin": "http://localhost:7860"})
+
+    assert response.status_code == 204
+    assert response.headers["access-control-allow-origin"] == "*"
+
+
+def test_health_returns_empty_no_content(client):
+    response = client.get("/health")
+
+    assert response.status_code == 204
+    assert response.content == b""
+
+
+def test_cors_rejects_disallowed_origin():
+    from fastapi import FastAPI
+
+    from llumdocs.api.cors import ASGICors
+
+    app = FastAPI()
+    app.add_middleware(ASGICors, allow_origins=["http://allowed.example"])
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    with TestClient(app) as test_client:
+        allowed = test_client.get("/ping", headers={"Origin": "http://allowed.example"})
+        denied = test_client.options(
+            "/ping",
+            headers={"Origin": "http://evil.example", "Access-Control-Request-Method": "GET"},
+        )
+
+    assert allowed.headers["access-control-allow-origin"] == "http://allowed.example"
+    assert allowed.headers["vary"] == "Origin"
+    assert denied.status_code == 400
+    assert "access-control-allow-origin" not in denied.headers
+
+
+def test_health_ollama_response_is_cached(monkeypatch, client):
+    calls = {"probe": 0}
+
+    def fake_health(timeout):
+        calls["probe"] += 1
+
+    monkeypatch.setattr("llumdocs.api.app.ollama_health", fake_health)
+
+    first = client.get("/health/ollama")
+    second = client.get("/health/ollama")
+
+    assert first.status_code == 200
+    assert first.json()["ok"] is True
+    assert second.json() == first.json()
+    assert "max-age=10" in first.headers["cache-control"]
+    assert calls["probe"] == 1
+
+
+def test_health_ollama_failure_is_negatively_cached(monkeypatch, client):
+    calls = {"probe": 0}
+
+    def failing_health(timeout):
+        calls["probe"] += 1
+        raise ConnectionError("connection refused")
+
+    monkeypatch.setattr("llumdocs.api.app.ollama_health", failing_health)
+
+    first = client.get("/health/ollama")
+    second = client.get("/health/ollama")
+
+    assert first.status_code == 503
+    assert first.json()["ok"] is False
+    assert second.status_code == 503
+    assert "max-age=2" in first.headers["cache-control"]
+    assert calls["probe"] == 1
+
+
+def test_create_app_features_follow_env(monkeypatch):
+    monkeypatch.setenv("LLUMDOCS_FEATURES", "ready_probe")
+
+    app_client = TestClient(create_app())
+
+    assert app_client.get("/ready").status_code == 200
+    assert app_client.get("/health/ollama").status_code == 404
+    assert app_client.post("/api/documents/extract").status_code == 404
+
+
+def test_create_app_flags_override_env(monkeypatch):
+    monkeypatch.setenv("LLUMDOCS_FEATURES", "")
+
+    app_client = TestClient(create_app(enable_ready_probe=True))
+
+    assert app_client.get("/health").status_code == 204
+    assert app_client.get("/ready").status_code == 200
+    assert app_client.get("/health/ollama").status_code == 404
+
+
+def test_create_app_rejects_duplicate_routes():
+    from llumdocs.api import app as app_module
+
+    app = create_app()
+    app.include_router(app_module.translation_router)
+
+    with pytest.raises(RuntimeError, match="Duplicate route"):
+        app_module._check_unique_routes(app)
+
+
+def test_probes_are_matched_before_api_routes():
+    paths = [route.path for route in create_app().routes]
+
+    assert paths.index("/health") < min(
+        index for index, path in enumerate(paths) if path.startswith("/api/")
+    )
+
+
+def test_importing_the_app_does_not_load_litellm():
+    code = "import sys, llumdocs.api.app; sys.exit('litellm' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code], check=False).returncode == 0
+
+
+def test_mapping_a_service_error_does_not_load_the_pdf_stack():
+    code = (
+        "import sys\n"
+        "from llumdocs.api.error_handling import handle_service_error\n"
+        "from llumdocs.services.errors import TranslationError\n"
+        "assert handle_service_error(TranslationError('bad')).status_code == 400\n"
+        "sys.exit('fitz' in sys.modules or 'llumdocs.document_extraction' in sys.modules)"
+    )
+    assert subprocess.run([sys.executable, "-c", code], check=False).returncode == 0
+
+
+def test_lifespan_shares_one_http_client():
+    from llumdocs.http_client import get_async_client
+
+    app = create_app(enable_ollama_probe=False)
+    with TestClient(app):
+        shared = get_async_client()
+        assert shared is app.state.http_client
+        assert not shared.is_closed
+
+    assert get_async_client() is None
+    assert shared.is_closed
+
+
+def test_document_extraction_endpoint_rejects_oversized_upload(monkeypatch, client):
+    """Test that uploads above the configured limit are rejected with 413."""
+    monkeypatch.setattr("llumdocs.api.document_extraction_endpoints.MAX_DOCUMENT_SIZE_BYTES", 8)
+
+    def fail_extract(*_, **__):
+        raise AssertionError("extraction must not run for oversized uploads")
+
+    monkeypatch.setattr(
+        "llumdocs.services.document_extraction_service.extract_document_data", fail_extract
+    )
+
+    response = client.post(
+        "/api/documents/extract",
+        files={"file": ("test.pdf", b"fake pdf content", "application/pdf")},
+        data={"doc_type": "deliverynote", "model": ""},
+    )
+
+    assert response.status_code == 413
+
+
+def test_image_describe_endpoint_rejects_oversized_upload(monkeypatch, client):
+    monkeypatch.setattr("llumdocs.api.image_endpoints.MAX_IMAGE_SIZE_BYTES", 16)
+
+    def fail_describe(*_, **__):
+        raise AssertionError("description must not run for oversized uploads")
+
+    monkeypatch.setattr("llumdocs.services.image_description_service.describe_image", fail_describe)
+
+    response = client.post(
+        "/api/images/describe",
+        files={"image": ("big.jpg", b"\xff\xd8\xff" + b"0" * 64, "image/jpeg")},
+        data={"detail_level": "short"},
+    )
+
+    assert response.status_code == 413
+
+
+def test_copy_upload_from_spooled_file_on_disk(tmp_path):
+    import tempfile
+
+    from llumdocs.api.uploads import UploadTooLargeError, copy_upload
+
+    payload = b"0123456789" * 1000
+    src = tempfile.SpooledTemporaryFile(max_size=16)
+    src.write(payload)
+    src.seek(0)
+    assert src._rolled
+
+    with open(tmp_path / "copy.bin", "wb") as dst:
+        assert copy_upload(src, dst, max_bytes=len(payload)) == len(payload)
+    assert (tmp_path / "copy.bin").read_bytes() == payload
+
+    src.seek(0)
+    with open(tmp_path / "too_big.bin", "wb") as dst, pytest.raises(UploadTooLargeError):
+        copy_upload(src, dst, max_bytes=len(payload) - 1)
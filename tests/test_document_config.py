@@ -0,0 +1,115 @@
+"""Unit tests for the per-document-type configuration and its redaction helpers."""
+
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from llumdocs.document_extraction.document_config import DOCUMENT_CONFIGS, get_config
+from llumdocs.document_extraction.document_config.legends.payroll import make_payroll_legend
+from llumdocs.document_extraction.document_config.redaction.default import (
+    default_redact,
+    redact_sensitive_info,
+)
+from llumdocs.document_extraction.document_config.redaction.payroll import redact_payroll
+from llumdocs.document_extraction.payroll import PayrollReport
+
+
+def test_redact_sensitive_info_masks_emails_ibans_and_tax_ids_in_one_pass():
+    text = "ana@example.com ES9121000418450200051332 b12345678 12345678Z X1234567L"
+
+    assert redact_sensitive_info(text) == (
+        "••REDACTED-EMAIL•• ••REDACTED-IBAN•• ••REDACTED-TAXID•• ••REDACTED-TAXID•• X1234567L"
+    )
+
+
+def test_redaction_skips_the_pattern_for_text_without_digits_or_at_signs(monkeypatch):
+    from llumdocs.document_extraction.document_config.redaction import default
+
+    calls = []
+    monkeypatch.setattr(default, "redaction_marker", lambda m: calls.append(m) or "X")
+
+    assert default.apply_redaction(default._REDACT_RE, "Banco: Caixa\nTitular: Ana") == (
+        "Banco: Caixa\nTitular: Ana"
+    )
+    assert default.apply_redaction(default._REDACT_RE, "mail a@b.es") == "mail X"
+    assert len(calls) == 1
+
+
+def test_redact_payroll_also_masks_nies_and_keeps_lines():
+    lines = ["DNI: 12345678Z", "", "NIE: x1234567l", "IBAN: ES9121000418450200051332", ""]
+
+    assert redact_payroll(lines) == [
+        "DNI: ••REDACTED-TAXID••",
+        "",
+        "NIE: ••REDACTED-NIE••",
+        "IBAN: ••REDACTED-IBAN••",
+        "",
+    ]
+    assert default_redact(lines)[2] == "NIE: x1234567l"
+
+
+def test_redact_sensitive_info_stays_linear_on_long_dotted_runs():
+    # Every "a" starts a word: an unbounded local part made this quadratic (seconds)
+    text = "a." * 20000
+
+    assert redact_sensitive_info(text) == text
+    assert redact_sensitive_info(f"{'a' * 64}@{'b' * 250}.com") == "••REDACTED-EMAIL••"
+
+
+def test_get_config_returns_the_registered_config_or_lists_the_known_types():
+    assert get_config("bank") is DOCUMENT_CONFIGS["bank"]
+
+    with pytest.raises(ValueError, match="Available types: deliverynote, bank, payroll"):
+        get_config("invoice")
+
+
+def test_document_configs_are_immutable_slotted_records():
+    config = get_config("payroll")
+
+    assert not hasattr(config, "__dict__")
+    assert config.redact_lines is redact_payroll
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.text_limit = 10
+
+
+def test_settings_are_built_once_on_first_access():
+    from llumdocs.document_extraction import settings
+
+    assert settings.SETTINGS is settings.get_settings()
+    assert "SETTINGS" not in vars(settings)
+
+
+def test_call_sites_read_settings_rebuilt_from_the_environment(monkeypatch):
+    from llumdocs.document_extraction.core import extractor
+    from llumdocs.document_extraction.settings import get_settings
+
+    monkeypatch.setenv("DOCUMENT_LLM_RESPONSE_CACHE_DIR", "/tmp/llumdocs-cache")
+    get_settings.cache_clear()
+    try:
+        path = extractor._response_cache_path("m", PayrollReport, "s", "u")
+        assert str(path.parent) == "/tmp/llumdocs-cache"
+    finally:
+        get_settings.cache_clear()
+
+
+def test_payroll_legend_lists_first_five_items_per_block():
+    report = PayrollReport(
+        periodo="2024-01",
+        devengos=[{"concepto": f"d{i}", "importe": i} for i in range(6)],
+        deducciones=[{"concepto": "IRPF", "importe": 1.5}],
+        neto=13.5,
+    )
+
+    assert make_payroll_legend(report) == [
+        "Período: 2024-01",
+        "",
+        "Devengos:",
+        *(f"  {i + 1}. d{i}: {i:.2f} EUR" for i in range(5)),
+        "",
+        "Deducciones:",
+        "  1. IRPF: 1.50 EUR",
+        "",
+        "Neto: 13.50 EUR",
+    ]
@@ -0,0 +1,359 @@
+"""Unit tests for the generic structured-data extractor."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+from pydantic import BaseModel
+
+from llumdocs.document_extraction.albaran.models import AlbaranReport
+from llumdocs.document_extraction.bank.models import BankStatement
+from llumdocs.document_extraction.core import extractor
+from llumdocs.document_extraction.core.extractor import (
+    _inline_refs,
+    _openai_schema,
+    parse_json,
+    transform_schema,
+)
+from llumdocs.document_extraction.settings import get_settings
+
+
+def test_transform_schema_builds_strict_schema_without_mutating_input():
+    schema = AlbaranReport.model_json_schema()
+    original = json.dumps(schema, sort_keys=True)
+
+    transformed = transform_schema(schema)
+
+    assert json.dumps(schema, sort_keys=True) == original
+    assert "$defs" not in transformed
+    assert transformed["required"] == list(transformed["properties"])
+    assert transformed["properties"]["numero_albaran"]["type"] == "string"
+    assert transformed["properties"]["moneda"]["type"] == ["string", "null"]
+
+    items = transformed["properties"]["productos"]["items"]
+    assert items["required"] == list(items["properties"])
+    assert items["properties"]["cantidad"]["type"] == "number"
+    assert items["properties"]["unidad"]["type"] == ["string", "null"]
+
+
+def test_transform_schema_in_place_matches_copying_transform():
+    schema = BankStatement.model_json_schema()
+    expected = transform_schema(schema)
+
+    assert transform_schema(schema, in_place=True) == expected
+
+
+def test_openai_schema_is_built_once_per_model_class():
+    _openai_schema.cache_clear()
+
+    first = _openai_schema(AlbaranReport)
+    second = _openai_schema(AlbaranReport)
+
+    assert first is second
+    assert first == transform_schema(AlbaranReport.model_json_schema())
+    assert _openai_schema.cache_info().misses == 1
+
+
+def test_parse_json_handles_fenced_json_with_braces_in_strings():
+    content = (
+        "Here is the data:\n```json\n"
+        '{"banco": "Banco {Demo}", "moneda": null, "lineas": '
+        '[{"fecha": "2024-01-01", "concepto": "Pago }", "importe": -5}]}'
+        "\n```\nLet me know if you need more."
+    )
+
+    parsed, error = parse_json(content, BankStatement)
+
+    assert error is None
+    assert parsed.banco == "Banco {Demo}"
+    assert parsed.moneda == "EUR"
+    assert parsed.lineas[0].concepto == "Pago }"
+
+
+def test_parse_json_unwraps_single_key_wrappers_and_null_defaults():
+    content = '{"statement": {"banco": "Demo", "moneda": null, "lineas": null}}'
+
+    parsed, error = parse_json(content, BankStatement)
+
+    assert error is None
+    assert (parsed.banco, parsed.moneda, parsed.lineas) == ("Demo", "EUR", [])
+
+
+def test_parse_json_unwraps_wrappers_for_models_that_ignore_extra_keys():
+    class Wrapped(BaseModel):
+        a: str | None = None
+        b: int | None = None
+
+    parsed, error = parse_json('{"report": {"a": "x", "b": 2}}', Wrapped)
+
+    assert error is None
+    assert (parsed.a, parsed.b) == ("x", 2)
+
+
+def test_inline_refs_resolves_nested_refs_into_independent_copies():
+    defs = {
+        "Line": {"type": "object", "properties": {"amount": {"$ref": "#/$defs/Money"}}},
+        "Money": {"type": "number"},
+    }
+    schema = {"properties": {"a": {"$ref": "#/$defs/Line"}, "b": {"$ref": "#/$defs/Line"}}}
+
+    inlined = _inline_refs(schema, defs)
+
+    assert inlined["properties"]["a"]["properties"]["amount"] == {"type": "number"}
+    assert inlined["properties"]["a"] == inlined["properties"]["b"]
+    assert inlined["properties"]["a"] is not inlined["properties"]["b"]
+    assert defs["Line"]["properties"]["amount"] == {"$ref": "#/$defs/Money"}
+
+
+def test_cache_writers_of_the_same_key_never_share_a_temp_file(tmp_path):
+    cache_path = tmp_path / "cache" / "key.json"
+    contents = [json.dumps({"banco": str(i) * 5000}) for i in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda c: extractor._write_cached_response(cache_path, c), contents * 4))
+
+    assert cache_path.read_text(encoding="utf-8") in contents
+    assert [p.name for p in cache_path.parent.iterdir()] == ["key.json"]
+
+
+def test_extract_structured_data_reuses_disk_cached_answer(monkeypatch, tmp_path):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("LLUMDOCS_DISABLE_OLLAMA", "1")
+    monkeypatch.setattr(get_settings(), "response_cache_dir", str(tmp_path))
+    calls = []
+
+    def fake_completion(**kwargs):
+        calls.append(kwargs)
+        message = SimpleNamespace(content='{"banco": "Demo"}')
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    monkeypatch.setattr(extractor, "completion", fake_completion)
+
+    def extract(text):
+        return extractor.extract_structured_data(
+            text, BankStatement, "system", "Text: {text}", model="gpt-4o-mini"
+        )
+
+    assert extract("statement").banco == "Demo"
+    assert extract("statement").banco == "Demo"
+    assert len(calls) == 1
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    extract("another statement")
+    assert len(calls) == 2
+
+
+def test_extract_structured_data_batch_marshals_documents_into_one_call(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("LLUMDOCS_DISABLE_OLLAMA", "1")
+    monkeypatch.setattr(get_settings(), "response_cache_dir", None)
+    monkeypatch.setattr(extractor.time, "sleep", lambda _seconds: None)
+    calls = []
+
+    def fake_completion(**kwargs):
+        calls.append(kwargs)
+        user = kwargs["messages"][1]["content"]
+        if "<<DOCUMENT" in user:
+            count = user.count("<<DOCUMENT")
+            items = [{"banco": f"Bank {index}"} for index in range(1, count + 1)]
+            content = json.dumps({"items": items})
+        else:
+            content = json.dumps({"banco": user.removeprefix("Text: ")})
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    monkeypatch.setattr(extractor, "completion", fake_completion)
+
+    results = extractor.extract_structured_data_batch(
+        ["a", "b", "c", "d", "e"],
+        BankStatement,
+        "system",
+        "Text: {text}",
+        model="gpt-4o-mini",
+        batch_size=4,
+    )
+
+    assert [result.banco for result in results] == ["Bank 1", "Bank 2", "Bank 3", "Bank 4", "e"]
+    assert len(calls) == 2
+    schema = calls[0]["response_format"]["json_schema"]["schema"]
+    assert schema["properties"]["items"]["type"] == "array"
+
+
+def test_extract_structured_data_batch_falls_back_to_single_calls(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("LLUMDOCS_DISABLE_OLLAMA", "1")
+    monkeypatch.setattr(get_settings(), "response_cache_dir", None)
+    calls = []
+
+    def fake_completion(**kwargs):
+        user = kwargs["messages"][1]["content"]
+        calls.append(user)
+        # The batched answer drops a document, so each one is extracted on its own
+        items = [{"banco": "only one"}]
+        content = json.dumps({"items": items} if "<<DOCUMENT" in user else {"banco": user})
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    monkeypatch.setattr(extractor, "completion", fake_completion)
+
+    results = extractor.extract_structured_data_batch(
+        ["x", "y"], BankStatement, "system", "{text}", model="gpt-4o-mini"
+    )
+
+    assert [result.banco for result in results] == ["x", "y"]
+    assert calls[1:] == ["x", "y"]
+
+
+def test_extract_structured_data_batch_applies_defaults_for_null_item_fields(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("LLUMDOCS_DISABLE_OLLAMA", "1")
+    monkeypatch.setattr(get_settings(), "response_cache_dir", None)
+    calls = []
+    empty = dict.fromkeys(BankStatement.model_fields)
+
+    def fake_completion(**kwargs):
+        calls.append(kwargs)
+        items = [{**empty, "banco": "Demo"}, empty]
+        message = SimpleNamespace(content=json.dumps({"items": items}))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    monkeypatch.setattr(extractor, "completion", fake_completion)
+
+    results = extractor.extract_structured_data_batch(
+        ["x", "y"], BankStatement, "system", "{text}", model="gpt-4o-mini"
+    )
+
+    assert len(calls) == 1
+    assert [(r.banco, r.moneda, r.lineas) for r in results] == [
+        ("Demo", "EUR", []),
+        (None, "EUR", []),
+    ]
+
+
+def test_extract_batch_async_bounds_concurrency_and_keeps_order(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("LLUMDOCS_DISABLE_OLLAMA", "1")
+    monkeypatch.setattr(get_settings(), "response_cache_dir", None)
+    in_flight = 0
+    peak = 0
+
+    async def fake_acompletion(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        user = kwargs["messages"][1]["content"]
+        # Later documents answer first, so results must be reordered
+        await asyncio.sleep(0.01 / (1 + int(user)))
+        in_flight -= 1
+        message = SimpleNamespace(content=json.dumps({"banco": user}))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    monkeypatch.setattr(extractor, "acompletion", fake_acompletion)
+
+    texts = [str(index) for index in range(10)]
+    results = asyncio.run(
+        extractor.extract_batch_async(
+            texts, BankStatement, "system", "{text}", model="gpt-4o-mini", concurrency=3
+        )
+    )
+
+    assert [result.banco for result in results] == texts
+    assert peak == 3
+
+
+def test_aextract_structured_data_retries_invalid_answers(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("LLUMDOCS_DISABLE_OLLAMA", "1")
+    monkeypatch.setattr(get_settings(), "response_cache_dir", None)
+    sleeps = []
+    answers = iter(["", '{"banco": "Demo"}'])
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    async def fake_acompletion(**kwargs):
+        message = SimpleNamespace(content=next(answers))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    monkeypatch.setattr(extractor, "acompletion", fake_acompletion)
+    monkeypatch.setattr(extractor.asyncio, "sleep", fake_sleep)
+
+    result = asyncio.run(
+        extractor.aextract_structured_data(
+            "text", BankStatement, "system", "{text}", model="gpt-4o-mini"
+        )
+    )
+
+    assert result.banco == "Demo"
+    assert sleeps == [0.6]
+
+
+def test_failed_extraction_dumps_raw_responses(monkeypatch, tmp_path):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("LLUMDOCS_DISABLE_OLLAMA", "1")
+    monkeypatch.setattr(get_settings(), "response_cache_dir", None)
+    monkeypatch.setattr(extractor.time, "sleep", lambda _seconds: None)
+
+    def fake_completion(**kwargs):
+        message = SimpleNamespace(content="no és JSON")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    monkeypatch.setattr(extractor, "completion", fake_completion)
+
+    with pytest.raises(RuntimeError, match="Failed after 3 attempts"):
+        extractor.extract_structured_data(
+            "text", BankStatement, "system", "{text}", model="gpt-4o-mini", debug_dir=tmp_path
+        )
+
+    dump = (tmp_path / "llm_responses.json").read_text(encoding="utf-8")
+    assert json.loads(dump) == ["no és JSON"] * 3
+    assert "és" in dump
+
+
+def test_compiled_prompt_template_matches_str_format():
+    templates = ["Text: {text}", "{text}", "{{literal}} {text} and {text}!", "no field"]
+    for template in templates:
+        segments = extractor._compile_prompt_template(template)
+        assert "x{y}".join(segments) == template.format(text="x{y}")
+    assert extractor._compile_prompt_template("{text!r}") is None
+    assert extractor._compile_prompt_template("{text} {other}") is None
+
+
+def test_extraction_plan_resolves_model_once(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("LLUMDOCS_DISABLE_OLLAMA", "1")
+    monkeypatch.setattr(get_settings(), "response_cache_dir", None)
+    resolved = []
+    real_resolve = extractor.resolve_model
+
+    def counting_resolve(name):
+        resolved.append(name)
+        return real_resolve(name)
+
+    def fake_completion(**kwargs):
+        content = json.dumps({"banco": kwargs["messages"][1]["content"]})
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    monkeypatch.setattr(extractor, "resolve_model", counting_resolve)
+    monkeypatch.setattr(extractor, "completion", fake_completion)
+
+    plan = extractor.build_plan(BankStatement, "system", "Doc: {text}", model="gpt-4o-mini")
+    results = [extractor.run_plan(plan, text) for text in ("a", "b", "c")]
+
+    assert [result.banco for result in results] == ["Doc: a", "Doc: b", "Doc: c"]
+    assert resolved == ["gpt-4o-mini"]
+
+
+def test_fields_with_defaults_is_cached_per_model_class():
+    fields = extractor._fields_with_defaults(AlbaranReport)
+
+    assert "moneda" in fields
+    assert "nif_cif" not in fields  # defaults to None, so an explicit null is kept
+    assert extractor._fields_with_defaults(AlbaranReport) is fields
+    assert extractor._drop_null_defaults({"moneda": None, "nif_cif": None}, AlbaranReport) == {
+        "nif_cif": None
+    }
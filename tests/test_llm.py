@@ -4,12 +4,15 @@ Tests for llumdocs.llm module, including keep_alive=0 verification for Ollama.
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from llumdocs.llm import (
     LLMConfigurationError,
+    achat_completion,
+    astream_chat_completion,
     available_models,
     available_vision_models,
     chat_completion,
@@ -144,3 +147,107 @@ def test_available_vision_models_includes_ollama(monkeypatch):
 
     assert len(models) >= 1
     assert any("ollama" in model_id.lower() for _, model_id in models)
+
+
+@patch("llumdocs.llm.completion")
+def test_chat_completion_marks_system_prompt_cacheable_for_claude(mock_completion, monkeypatch):
+    """Claude models get an explicit cache_control marker on the static system prompt."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock()]
+    mock_response.choices[0].message.content = "ok"
+    mock_completion.return_value = mock_response
+
+    messages = [
+        {"role": "system", "content": "Static instructions"},
+        {"role": "user", "content": "Dynamic text"},
+    ]
+    chat_completion(messages, model_hint="anthropic/claude-3-5-sonnet-20240620")
+
+    sent = mock_completion.call_args[1]["messages"]
+    assert sent[0]["content"][0]["text"] == "Static instructions"
+    assert sent[0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert sent[1] == messages[1]
+
+    chat_completion(messages, model_hint="gpt-4o-mini")
+
+    assert mock_completion.call_args[1]["messages"] == messages
+
+
+@patch("llumdocs.llm.acompletion", new_callable=AsyncMock)
+def test_achat_completion_awaits_litellm(mock_acompletion, monkeypatch):
+    """achat_completion should await LiteLLM's acompletion with the resolved config."""
+    monkeypatch.setenv("LLUMDOCS_DISABLE_OLLAMA", "0")
+    monkeypatch.setenv("OLLAMA_API_BASE", "http://localhost:11434")
+
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock()]
+    mock_response.choices[0].message.content = "  Async response  "
+    mock_acompletion.return_value = mock_response
+
+    result = asyncio.run(
+        achat_completion([{"role": "user", "content": "Hello"}], model_hint="ollama/llama3.1:8b")
+    )
+
+    assert result == "Async response"
+    call_kwargs = mock_acompletion.call_args[1]
+    assert call_kwargs["model"] == "ollama/llama3.1:8b"
+    assert call_kwargs["keep_alive"] == 0
+
+
+@patch("llumdocs.llm.acompletion", new_callable=AsyncMock)
+def test_astream_chat_completion_yields_non_empty_deltas(mock_acompletion, monkeypatch):
+    """astream_chat_completion should request a stream and yield only content deltas."""
+    monkeypatch.setenv("LLUMDOCS_DISABLE_OLLAMA", "0")
+
+    def chunk(content):
+        part = MagicMock()
+        part.choices = [MagicMock()]
+        part.choices[0].delta.content = content
+        return part
+
+    async def fake_stream():
+        for content in ("Hello", None, " world"):
+            yield chunk(content)
+
+    mock_acompletion.return_value = fake_stream()
+
+    async def collect():
+        return [
+            delta
+            async for delta in astream_chat_completion(
+                [{"role": "user", "content": "Hi"}], model_hint="ollama/llama3.1:8b"
+            )
+        ]
+
+    assert asyncio.run(collect()) == ["Hello", " world"]
+    assert mock_acompletion.call_args[1]["stream"] is True
+
+
+def test_achat_completion_limits_concurrency(monkeypatch):
+    """No more than LLM_CONCURRENCY acompletion calls should be in flight at once."""
+    monkeypatch.setenv("LLUMDOCS_DISABLE_OLLAMA", "0")
+    monkeypatch.setattr("llumdocs.llm.LLM_CONCURRENCY", 2)
+    state = {"active": 0, "peak": 0}
+
+    async def fake_acompletion(**_):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = "ok"
+        return response
+
+    monkeypatch.setattr("llumdocs.llm.acompletion", fake_acompletion)
+
+    async def run_many():
+        messages = [{"role": "user", "content": "Hi"}]
+        return await asyncio.gather(
+            *(achat_completion(messages, model_hint="ollama/llama3.1:8b") for _ in range(6))
+        )
+
+    assert asyncio.run(run_many()) == ["ok"] * 6
+    assert state["peak"] == 2
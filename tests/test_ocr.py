@@ -0,0 +1,355 @@
+"""Unit tests for OCR page extraction."""
+
+from __future__ import annotations
+
+import queue
+import re
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from llumdocs.document_extraction.core import ocr
+from llumdocs.document_extraction.ocr import OcrEngine, OcrPage, OcrWord, OcrWords
+from llumdocs.document_extraction.ocr.base import validate_bbox, validate_bbox_coords
+from llumdocs.document_extraction.settings import get_settings
+
+
+class _SlowEngine(OcrEngine):
+    """Fake engine that fails if two threads use the same instance at once."""
+
+    name = "fake"
+
+    def __init__(self):
+        super().__init__(langs=["eng"])
+        self._busy = threading.Lock()
+
+    def recognize_page(self, img: Image.Image, page_index: int) -> OcrPage:
+        assert self._busy.acquire(blocking=False), "engine shared between threads"
+        try:
+            time.sleep(0.01)
+            return OcrPage(page_index, f"page {page_index}", [], *img.size, 0.01)
+        finally:
+            self._busy.release()
+
+
+def test_recognize_pages_runs_in_parallel_and_keeps_page_order(monkeypatch):
+    monkeypatch.setattr(get_settings(), "ocr_workers", 3)
+    built = []
+
+    def make_engine():
+        built.append(_SlowEngine())
+        return built[-1]
+
+    images = [Image.new("RGB", (10, 10)) for _ in range(8)]
+    pages = ocr._recognize_pages(_SlowEngine(), iter(images), len(images), make_engine)
+
+    assert [page.text for page in pages] == [f"page {i}" for i in range(8)]
+    assert len(built) <= 2
+
+
+def test_recognize_pages_single_worker_uses_given_engine(monkeypatch):
+    monkeypatch.setattr(get_settings(), "ocr_workers", 1)
+
+    def make_engine():
+        raise AssertionError("no extra engine expected")
+
+    pages = ocr._recognize_pages(_SlowEngine(), [Image.new("RGB", (4, 4))] * 2, 2, make_engine)
+
+    assert [page.page_index for page in pages] == [0, 1]
+
+
+def test_recognize_pages_bounds_pages_held_in_memory(monkeypatch):
+    monkeypatch.setattr(get_settings(), "ocr_workers", 2)
+    counts = {"produced": 0, "done": 0, "peak": 0}
+
+    class CountingEngine(_SlowEngine):
+        def recognize_page(self, img, page_index):
+            page = super().recognize_page(img, page_index)
+            counts["done"] += 1
+            return page
+
+    def images():
+        for _ in range(10):
+            counts["produced"] += 1
+            counts["peak"] = max(counts["peak"], counts["produced"] - counts["done"])
+            yield Image.new("RGB", (10, 10))
+
+    pages = ocr._recognize_pages(CountingEngine(), images(), 10, CountingEngine)
+
+    assert len(pages) == 10
+    assert counts["peak"] <= 4
+
+
+def test_split_large_ocr_item_splits_on_pipes_with_proportional_boxes():
+    item = {
+        "page_no": 1,
+        "text": "Codigo | Descripcion | Cantidad | Precio",
+        "bbox": {"l": 0, "t": 0, "r": 40, "b": 10},
+    }
+
+    parts = ocr._split_large_ocr_item(item)
+
+    assert [part["text"] for part in parts] == ["Codigo", "Descripcion", "Cantidad", "Precio"]
+    assert [(part["bbox"]["l"], part["bbox"]["r"]) for part in parts] == [
+        (0.0, 6.0),
+        (9.0, 20.0),
+        (23.0, 31.0),
+        (34.0, 40.0),
+    ]
+
+
+def test_split_large_ocr_item_keeps_short_or_single_field_text():
+    short = {"page_no": 1, "text": "Total: 12,50", "bbox": {}}
+    single = {"page_no": 1, "text": "Observaciones: entrega en horario de mañana", "bbox": {}}
+
+    assert ocr._split_large_ocr_item(short) == [short]
+    assert ocr._split_large_ocr_item(single) == [single]
+
+
+def test_docling_converters_are_reused_but_never_shared_concurrently(monkeypatch):
+    built = []
+
+    def build(*config):
+        built.append(config)
+        return object()
+
+    monkeypatch.setattr(ocr, "_build_docling_converter", build)
+    ocr._idle_docling_converters.cache_clear()
+    config = (("spa",), 2.0, None, False)
+
+    with ocr._borrow_docling_converter(*config) as first:
+        # A concurrent extraction gets its own converter
+        with ocr._borrow_docling_converter(*config) as concurrent:
+            assert concurrent is not first
+    with ocr._borrow_docling_converter(*config) as again:
+        assert again in (first, concurrent)
+    with ocr._borrow_docling_converter(("eng",), 2.0, None, False) as other:
+        assert other not in (first, concurrent)
+
+    assert len(built) == 3
+    ocr._idle_docling_converters.cache_clear()
+
+
+def test_parse_ocr_langs_strips_blanks_and_is_cached():
+    assert ocr._parse_ocr_langs(" spa, eng,,cat ") == ("spa", "eng", "cat")
+    assert ocr._parse_ocr_langs(" spa, eng,,cat ") is ocr._parse_ocr_langs(" spa, eng,,cat ")
+    assert ocr._parse_ocr_langs("") == ()
+
+
+class _FakeBox(SimpleNamespace):
+    def model_dump(self, **_kwargs):
+        return dict(vars(self), coord_origin="BOTTOMLEFT")
+
+
+def test_docling_items_are_read_from_document_objects(monkeypatch):
+    prov = SimpleNamespace(page_no=1, bbox=_FakeBox(l=10.0, t=20.0, r=100.0, b=40.0))
+    document = SimpleNamespace(
+        texts=[
+            SimpleNamespace(text="", orig="", prov=[prov]),
+            SimpleNamespace(text=" Total ", orig="Total", prov=[prov]),
+        ],
+        export_to_markdown=lambda: "Total",
+        export_to_text=lambda: "Total",
+    )
+    converter = SimpleNamespace(convert=lambda _path: SimpleNamespace(document=document))
+    monkeypatch.setattr(ocr, "_build_docling_converter", lambda *_args: converter)
+    monkeypatch.setattr(ocr, "_idle_docling_converters", lambda *_args: queue.SimpleQueue())
+
+    result = ocr._extract_with_docling(Path("doc.pdf"))
+
+    assert result["ocr_items"] == [
+        {
+            "page_no": 1,
+            "text": "Total",
+            "bbox": {"l": 10.0, "t": 20.0, "r": 100.0, "b": 40.0, "coord_origin": "BOTTOMLEFT"},
+        }
+    ]
+    assert result["metadata"]["ocr"]["pages"][0]["width"] == 110
+
+
+def test_split_keeps_long_items_without_field_separators():
+    item = {"page_no": 1, "text": "A long line of plain text with a single: colon", "bbox": {}}
+    assert ocr._split_large_ocr_item(item) == [item]
+    assert ocr._split_large_ocr_item(item)[0] is item
+
+
+def test_engine_items_carry_one_set_of_bbox_keys(monkeypatch, tmp_path):
+    image_path = tmp_path / "page.png"
+    Image.new("RGB", (20, 10)).save(image_path)
+
+    class _WordEngine(OcrEngine):
+        name = "fake"
+
+        def recognize_page(self, img: Image.Image, page_index: int) -> OcrPage:
+            word = OcrWord("Total", (1, 2, 8, 6), 99.0)
+            return OcrPage(page_index, "Total", [word], *img.size, 0.0)
+
+    monkeypatch.setattr(ocr, "build_ocr_engine", lambda **_kwargs: _WordEngine(langs=["eng"]))
+
+    result = ocr._extract_with_engine(image_path, "rapidocr")
+
+    assert result["ocr_items"] == [
+        {"page_no": 1, "text": "Total", "bbox": {"l": 1, "t": 2, "r": 8, "b": 6}}
+    ]
+
+
+@pytest.mark.parametrize(
+    "bbox",
+    [
+        (0, 0, 10, 10),
+        (5, 5, 5, 5),
+        (-1, 0, 4, 4),
+        (0, -1, 4, 4),
+        (6, 0, 4, 4),
+        (0, 6, 4, 4),
+        (0, 0, 11, 4),
+        (0, 0, 4, 11),
+    ],
+)
+def test_validate_bbox_coords_matches_validate_bbox(bbox):
+    try:
+        validate_bbox(bbox, 10, 10)
+    except ValueError as exc:
+        with pytest.raises(ValueError, match=rf"^{re.escape(str(exc))}$"):
+            validate_bbox_coords(*bbox, 10, 10)
+    else:
+        validate_bbox_coords(*bbox, 10, 10)
+
+
+def _tesseract_data():
+    return {
+        "block_num": [1, 1, 1, 1, 1, 2],
+        "par_num": [0, 1, 1, 1, 1, 1],
+        "line_num": [0, 1, 1, 2, 2, 1],
+        "text": ["", "Hello", "  ", "world ", "again", "Total"],
+        "left": [0, 1, 0, 10, 17, 2],
+        "top": [0, 2, 0, 3, 3, 20],
+        "width": [40, 5, 0, 6, 6, 8],
+        "height": [30, 4, 0, 7, 7, 5],
+        "conf": [-1, 96, -1, 88.5, 90, 70],
+    }
+
+
+def test_tesseract_engine_builds_words_from_data_columns(monkeypatch):
+    tesseract_engine = pytest.importorskip("llumdocs.document_extraction.ocr.tesseract_engine")
+    data = _tesseract_data()
+    calls = []
+    monkeypatch.setattr(
+        tesseract_engine.pytesseract, "image_to_data", lambda *a, **k: calls.append(1) or data
+    )
+
+    engine = tesseract_engine.TesseractEngine(["eng"])
+    page = engine.recognize_page(Image.new("RGB", (40, 30)), 0)
+
+    assert [(w.text, w.bbox, w.conf) for w in page.words][:2] == [
+        ("Hello", (1, 2, 6, 6), 96.0),
+        ("world", (10, 3, 16, 10), 88.5),
+    ]
+    assert page.text == "Hello\nworld again\n\nTotal"
+    assert calls == [1]
+    assert all(type(c) is int for w in page.words for c in w.bbox)
+
+    data["width"][3] = 60
+    with pytest.raises(ValueError, match=r"x1 \(70\) must be <= image width \(40\)"):
+        engine.recognize_page(Image.new("RGB", (40, 30)), 0)
+
+
+def test_rapidocr_engine_reduces_polygons_to_int_boxes():
+    from llumdocs.document_extraction.ocr.rapidocr_engine import RapidOCREngine
+
+    result = [
+        ([[1.7, 2.2], [9.9, 2.0], [9.5, 6.8], [1.2, 6.1]], " Hola ", 0.9),
+        ([[0, 0], [1, 0], [1, 1], [0, 1]], "  ", 0.1),
+        ([[10, 8], [20, 8], [20, 12], [10, 12]], "adeu", 0.75),
+    ]
+    engine = RapidOCREngine.__new__(RapidOCREngine)
+    seen = []
+    engine.ocr = lambda np_img: seen.append(np_img) or (result, 0.0)
+
+    page = engine.recognize_page(Image.new("RGB", (30, 20)), 0)
+
+    assert [(w.text, w.bbox, w.conf) for w in page.words] == [
+        ("Hola", (1, 2, 9, 6), 0.9),
+        ("adeu", (10, 8, 20, 12), 0.75),
+    ]
+    assert all(type(c) is int for w in page.words for c in w.bbox)
+    assert page.text == "Hola\nadeu"
+    assert seen[0].shape == (20, 30, 3)
+
+    engine.recognize_page(Image.new("L", (30, 20)), 0)
+    assert seen[1].shape == (20, 30, 3)
+
+
+def test_tesseract_engine_ocrs_tall_pages_as_strips_cut_between_lines(monkeypatch):
+    tesseract_engine = pytest.importorskip("llumdocs.document_extraction.ocr.tesseract_engine")
+    img = Image.new("RGB", (100, 3000), "white")
+    # A dark text line straddles the even split point at row 1500
+    img.paste((0, 0, 0), (0, 1480, 100, 1530))
+
+    def image_to_data(strip, **_kwargs):
+        return {
+            "block_num": [1],
+            "par_num": [1],
+            "line_num": [1],
+            "text": [f"h{strip.height}"],
+            "left": [0],
+            "top": [5],
+            "width": [10],
+            "height": [10],
+            "conf": [90],
+        }
+
+    monkeypatch.setattr(tesseract_engine.pytesseract, "image_to_data", image_to_data)
+    engine = tesseract_engine.TesseractEngine(["eng"], strips=2)
+
+    page = engine.recognize_page(img, 0)
+
+    cut = tesseract_engine._strip_bounds(img, 2)[1]
+    assert not 1480 <= cut < 1530
+    assert [(w.text, w.bbox) for w in page.words] == [
+        (f"h{cut}", (0, 5, 10, 15)),
+        (f"h{3000 - cut}", (0, cut + 5, 10, cut + 15)),
+    ]
+    assert page.text == f"h{cut}\n\nh{3000 - cut}"
+
+
+def test_engine_options_split_tesseract_pages_only_without_page_parallelism(monkeypatch):
+    monkeypatch.setattr(ocr.os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(ocr, "get_settings", lambda: SimpleNamespace(ocr_workers=None))
+
+    assert ocr._engine_options("tesseract", 1) == {"strips": 4}
+    assert ocr._engine_options("tesseract", 3) == {}
+    assert ocr._engine_options("rapidocr", 1) == {}
+
+    monkeypatch.setattr(ocr, "get_settings", lambda: SimpleNamespace(ocr_workers=1))
+    assert ocr._engine_options("tesseract", 3) == {"strips": 4}
+
+
+def test_ocr_records_have_no_instance_dict():
+    word = OcrWord("Total", (1, 2, 8, 6), 99.0)
+    page = OcrPage(0, "Total", [word], 10, 10, 0.0)
+
+    assert not hasattr(word, "__dict__")
+    assert not hasattr(page, "__dict__")
+
+
+def test_ocr_words_read_as_ocr_word_sequence_over_columns():
+    words = OcrWords(
+        ["Total", "12,50"],
+        np.array([[1, 2, 8, 6], [10, 2, 20, 6]], dtype=np.int32),
+        np.array([99.0, 41.5]),
+    )
+
+    assert len(words) == 2
+    assert list(words) == [
+        OcrWord("Total", (1, 2, 8, 6), 99.0),
+        OcrWord("12,50", (10, 2, 20, 6), 41.5),
+    ]
+    assert words[-1] == OcrWord("12,50", (10, 2, 20, 6), 41.5)
+    assert list(words[:1]) == [OcrWord("Total", (1, 2, 8, 6), 99.0)]
+    assert all(type(c) is int for c in words[0].bbox)
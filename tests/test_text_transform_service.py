@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import json
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from llumdocs.llm import LLMConfigurationError
 from llumdocs.services.text_transform_service import (
     TextTransformError,
+    aextract_keywords,
+    aextract_keywords_batch,
+    asummarize_document,
     extract_keywords,
     make_text_more_technical,
     simplify_text,
@@ -186,3 +190,50 @@ def test_simplify_text_includes_reading_level(mock_chat_completion):
 
     assert result == "Simplified"
     assert "teen" in captured["messages"][1]["content"]
+
+
+@patch("llumdocs.services.text_transform_service.common.achat_completion", new_callable=AsyncMock)
+def test_async_variants_share_prompt_and_parsing(mock_achat_completion):
+    mock_achat_completion.return_value = json.dumps(["alpha", "beta", "gamma"])
+
+    keywords = asyncio.run(aextract_keywords("Example text", max_keywords=2))
+
+    assert keywords == ["alpha", "beta"]
+    messages = mock_achat_completion.call_args[0][0]
+    assert "Maximum keywords: 2" in messages[1]["content"]
+
+    mock_achat_completion.side_effect = LLMConfigurationError("no provider")
+    with pytest.raises(TextTransformError):
+        asyncio.run(asummarize_document("Example text"))
+
+
+@patch("llumdocs.services.text_transform_service.common.achat_completion", new_callable=AsyncMock)
+def test_keywords_batch_uses_single_row_marshalled_call(mock_achat_completion):
+    mock_achat_completion.return_value = json.dumps([["alpha", "beta"], ["gamma"]])
+
+    results = asyncio.run(aextract_keywords_batch(["First text", "Second text"]))
+
+    assert results == [["alpha", "beta"], ["gamma"]]
+    assert mock_achat_completion.await_count == 1
+    body = mock_achat_completion.call_args[0][0][1]["content"]
+    assert "<<ROW 1>>" in body and "<<ROW 2>>" in body
+    assert "Second text" in body
+
+
+@patch("llumdocs.services.text_transform_service.common.achat_completion", new_callable=AsyncMock)
+def test_keywords_batch_falls_back_to_per_row_calls(mock_achat_completion):
+    mock_achat_completion.side_effect = [
+        "not a json array",
+        json.dumps(["alpha"]),
+        json.dumps(["beta"]),
+    ]
+
+    results = asyncio.run(aextract_keywords_batch(["First text", "Second text"]))
+
+    assert results == [["alpha"], ["beta"]]
+    assert mock_achat_completion.await_count == 3
+
+
+def test_keywords_batch_rejects_oversized_batch():
+    with pytest.raises(TextTransformError):
+        asyncio.run(aextract_keywords_batch(["text"] * 17))
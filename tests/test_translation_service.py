@@ -73,9 +73,56 @@ def test_translate_text_wraps_llm_errors(monkeypatch):
     [
         ("xx", "en"),
         ("en", "xx"),
-        ("en", "en"),
     ],
 )
 def test_translate_text_validation(source_lang, target_lang):
     with pytest.raises(TranslationError):
         translate_text("test", source_lang=source_lang, target_lang=target_lang)
+
+
+def test_translate_text_reuses_cached_response(monkeypatch):
+    from llumdocs.services.llm_cache import LLMCache
+
+    calls = {"llm": 0}
+
+    def fake_chat_completion(messages, model_hint=None):
+        calls["llm"] += 1
+        return "Hola món"
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr("llumdocs.services.llm_cache.LLM_CACHE", LLMCache(maxsize=8, ttl=60.0))
+    monkeypatch.setattr(
+        "llumdocs.services.translation_service.chat_completion",
+        fake_chat_completion,
+    )
+
+    first = translate_text("Hello world", source_lang="en", target_lang="ca", model_hint="gpt-4o")
+    second = translate_text("Hello world", source_lang="en", target_lang="ca", model_hint="gpt-4o")
+    translate_text("Hello world", source_lang="en", target_lang="es", model_hint="gpt-4o")
+
+    assert first == second == "Hola món"
+    assert calls["llm"] == 2
+
+
+def test_translate_text_returns_identity_without_llm(monkeypatch):
+    def fail_chat_completion(*_, **__):
+        raise AssertionError("LLM should not be called")
+
+    monkeypatch.setattr(
+        "llumdocs.services.translation_service.chat_completion", fail_chat_completion
+    )
+
+    assert translate_text(" Bon dia ", source_lang="ca", target_lang="ca") == "Bon dia"
+
+
+def test_translate_text_skips_llm_when_detected_language_matches(monkeypatch):
+    calls = []
+    monkeypatch.setattr("llumdocs.services.translation_service._detect_language", lambda text: "en")
+    monkeypatch.setattr(
+        "llumdocs.services.translation_service.chat_completion",
+        lambda messages, model_hint=None: calls.append(messages) or "Hola",
+    )
+
+    assert translate_text("Hello", source_lang="auto", target_lang="en") == "Hello"
+    assert translate_text("Hello", source_lang="auto", target_lang="es") == "Hola"
+    assert len(calls) == 1
@@ -0,0 +1,290 @@
+"""Unit tests for the PDF/image visualization helpers."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import fitz
+import pytest
+from PIL import Image, ImageDraw
+
+from llumdocs.document_extraction.core.visualizer import common, image, pdf
+from llumdocs.document_extraction.settings import get_settings
+
+
+def test_redact_sensitive_info_masks_emails_ibans_and_tax_ids():
+    text = "Mail ana@example.com, IBAN ES9121000418450200051332, NIF 12345678z."
+
+    assert common.redact_sensitive_info(text) == (
+        "Mail ••REDACTED-EMAIL••, IBAN ••REDACTED-IBAN••, NIF ••REDACTED-TAXID••."
+    )
+
+
+def test_normalize_text_collapses_whitespace_and_case():
+    assert common.normalize_text("  Total\t A\n\nPagar ") == "total a pagar"
+    assert common.normalize_text("") == ""
+
+
+def test_get_font_is_loaded_once_per_size():
+    assert common.get_font(11) is common.get_font(11)
+    assert common.get_font(11) is not common.get_font(12)
+
+
+def test_draw_bbox_with_annotations_reuses_text_measurements():
+    image = Image.new("RGB", (200, 100), "white")
+    draw = ImageDraw.Draw(image)
+    common._text_bbox.cache_clear()
+
+    for _ in range(3):
+        common.draw_bbox_with_annotations(draw, 10, 30, 120, 60, "Total", field_name="total")
+
+    info = common._text_bbox.cache_info()
+    assert (info.misses, info.hits) == (2, 4)
+    assert image.getpixel((10, 45)) == (0, 200, 0)
+
+
+def test_overlay_legend_blends_the_panel_in_place_on_rgb():
+    image = Image.new("RGB", (100, 50), (255, 255, 255))
+
+    result = common.overlay_legend(image, ["total: 12,50"], title="")
+
+    assert result is image
+    assert result.mode == "RGB"
+    assert result.getpixel((10, 45)) == (255, 255, 255)
+    # White under black at alpha 180/255
+    assert result.getpixel((99, 45)) == (75, 75, 75)
+
+
+def test_page_boxes_px_scales_flips_and_clips_like_the_per_item_path():
+    bboxes = [
+        {"l": 10.0, "t": 700.0, "r": 110.0, "b": 680.0, "coord_origin": "BOTTOMLEFT"},
+        {"l": 2000.0, "t": 1500.0, "r": 2400.0, "b": 1600.0},  # 300 DPI pixels
+        {"l": 50.0, "t": 50.0, "r": 40.0, "b": 60.0},  # empty after clipping
+    ]
+
+    boxes, valid = pdf._page_boxes_px(bboxes, None, (1240, 1754), (595.0, 842.0))
+
+    sx, sy = 1240 / 595.0, 1754 / 842.0
+    assert boxes[0].tolist() == [
+        round(10 * sx),
+        round((842 - 700) * sy),
+        round(110 * sx),
+        round((842 - 680) * sy),
+    ]
+    assert boxes[1].tolist() == [
+        round(2000 * 0.24 * sx),
+        round(1500 * 0.24 * sy),
+        round(2400 * 0.24 * sx),
+        round(1600 * 0.24 * sy),
+    ]
+    assert valid.tolist() == [True, True, False]
+
+
+def test_page_boxes_px_scales_ocr_pixels_only_when_sizes_differ():
+    bboxes = [{"l": 100.5, "t": 200.25, "r": 300.75, "b": 260.5}]
+
+    same, _ = pdf._page_boxes_px(bboxes, (2480, 3508), (2480, 3508), (595.0, 842.0))
+    half, _ = pdf._page_boxes_px(bboxes, (2480, 3508), (1240, 1754), (595.0, 842.0))
+
+    assert same.tolist() == [[100, 200, 301, 260]]
+    assert half.tolist() == [[50, 100, 150, 130]]
+
+
+def test_page_boxes_px_handles_pages_without_items():
+    boxes, valid = pdf._page_boxes_px([], (2480, 3508), (2480, 3508), (595.0, 842.0))
+
+    assert boxes.shape == (0, 4)
+    assert valid.shape == (0,)
+
+
+def test_annotate_image_as_pdf_scales_ocr_boxes_and_flips_bottomleft(tmp_path, monkeypatch):
+    input_image = tmp_path / "in.png"
+    Image.new("RGB", (100, 50), "white").save(input_image)
+    items = [
+        {"page_no": 1, "text": "Total", "bbox": {"l": 20, "t": 20, "r": 160, "b": 60}},
+        {"text": "NIF", "bbox": {"l": 10, "t": 40, "r": 30, "b": 30, "coord_origin": "BOTTOMLEFT"}},
+    ]
+    drawn = []
+    monkeypatch.setattr(
+        image, "draw_bbox_with_annotations", lambda _draw, *args: drawn.append(args[:5])
+    )
+
+    image.annotate_image_as_pdf(
+        input_image,
+        items,
+        tmp_path / "scaled.pdf",
+        ocr_metadata={"ocr": {"pages": [{"page_index": 0, "width": 200, "height": 100}]}},
+    )
+    image.annotate_image_as_pdf(input_image, items[1:], tmp_path / "flipped.pdf")
+    assert all("_index" not in item for item in items)
+
+    # Scaled OCR boxes are never flipped, so the BOTTOMLEFT one is empty there
+    assert drawn == [(10, 10, 80, 30, "Total"), (10, 10, 30, 20, "NIF")]
+
+
+def test_map_fields_to_ocr_items_tags_each_field_once():
+    class Report:
+        def model_dump(self):
+            return {"total": "12,50", "nif": "B12345678", "lines": [1], "notes": None}
+
+    items = [
+        {"text": "Total: 12,50"},
+        {"text": "12,50"},
+        {"text": "  "},
+        {"text": "NIF b12345678"},
+        {"text": "B12345678"},
+    ]
+
+    assert common.map_fields_to_ocr_items(Report(), items) == {0: "total", 3: "nif"}
+
+
+def test_map_fields_to_ocr_items_matches_many_fields_like_the_pairwise_scan(monkeypatch):
+    pytest.importorskip("ahocorasick")
+    values = {"total": "12,50", "base": "10", "iva": "2,50", "nif": "B12345678", "ref": "a1"}
+
+    class Report:
+        def model_dump(self):
+            return values
+
+    items = [
+        {"text": "IVA 2,50"},
+        {"text": "12,50"},  # contains iva's "2,50" but total comes first
+        {"text": "1"},  # inside base "10", ref "a1" and nif: base is first
+        {"text": "NIF b12345678 A1"},  # contains nif and ref: nif comes first
+        {"text": "a1"},
+    ]
+    expected = common.map_fields_to_ocr_items(Report(), items)
+    monkeypatch.setattr(common, "_AHOCORASICK_MIN_FIELDS", 1)
+
+    assert common.map_fields_to_ocr_items(Report(), items) == expected
+    assert expected == {0: "iva", 1: "total", 2: "base", 3: "nif", 4: "ref"}
+
+
+def test_annotate_pdf_writes_one_page_per_input_page(tmp_path):
+    source = fitz.open()
+    for _ in range(2):
+        source.new_page(width=200, height=100)
+    input_pdf = tmp_path / "in.pdf"
+    source.save(input_pdf)
+    source.close()
+    items = [{"page_no": 2, "text": "Total", "bbox": {"l": 10, "t": 10, "r": 80, "b": 30}}]
+
+    output = pdf.annotate_pdf(input_pdf, items, tmp_path / "out" / "annotated.pdf", dpi=144)
+
+    with fitz.open(output) as annotated:
+        assert annotated.page_count == 2
+        assert (annotated[1].rect.width, annotated[1].rect.height) == (200, 100)
+        # The first page has nothing to draw: it is copied, not rasterized
+        assert annotated[0].get_images() == []
+        assert len(annotated[1].get_images()) == 1
+    assert "_index" not in items[0]
+
+
+def test_annotate_pdf_renders_below_dpi_without_shrinking_pages(tmp_path):
+    source = fitz.open()
+    source.new_page(width=200, height=100)
+    input_pdf = tmp_path / "in.pdf"
+    source.save(input_pdf)
+    source.close()
+
+    items = [{"page_no": 1, "text": "Total", "bbox": {"l": 10, "t": 10, "r": 80, "b": 30}}]
+
+    output = pdf.annotate_pdf(input_pdf, items, tmp_path / "annotated.pdf", dpi=144, render_dpi=72)
+
+    with fitz.open(output) as annotated:
+        page = annotated[0]
+        assert (page.rect.width, page.rect.height) == (200, 100)
+        image_info = page.get_image_info()[0]
+        assert (image_info["width"], image_info["height"]) == (200, 100)
+
+
+def test_annotate_pdf_embeds_pages_at_the_configured_jpeg_quality(tmp_path, monkeypatch):
+    source = fitz.open()
+    page = source.new_page(width=200, height=100)
+    page.insert_text((10, 50), "Total 12,50")
+    input_pdf = tmp_path / "in.pdf"
+    source.save(input_pdf)
+    source.close()
+
+    items = [{"page_no": 1, "text": "Total", "bbox": {"l": 10, "t": 40, "r": 80, "b": 60}}]
+
+    sizes = []
+    for quality in (90, 30):
+        monkeypatch.setattr(get_settings(), "jpeg_quality", quality)
+        output = pdf.annotate_pdf(input_pdf, items, tmp_path / f"q{quality}.pdf", dpi=144)
+        with fitz.open(output) as annotated:
+            xref = annotated[0].get_images()[0][0]
+            image_data = annotated.extract_image(xref)
+            assert image_data["ext"] == "jpeg"
+            sizes.append(len(image_data["image"]))
+
+    assert sizes[1] < sizes[0]
+
+
+@pytest.fixture()
+def render_pool():
+    """Start each test without a render pool and shut down the one it started."""
+    pdf._render_pool.cache_clear()
+    yield pdf._render_pool
+    if pdf._render_pool.cache_info().currsize:
+        pdf._render_pool(get_settings().render_workers).shutdown()
+    pdf._render_pool.cache_clear()
+
+
+def test_annotate_pdf_renders_pages_in_worker_processes(tmp_path, monkeypatch, render_pool):
+    source = fitz.open()
+    for _ in range(3):
+        source.new_page(width=200, height=100)
+    input_pdf = tmp_path / "in.pdf"
+    source.save(input_pdf)
+    source.close()
+    items = [{"page_no": 3, "text": "Total", "bbox": {"l": 10, "t": 10, "r": 80, "b": 30}}]
+    monkeypatch.setattr(get_settings(), "render_workers", 2)
+
+    # API requests annotate from threadpool threads; a lambda cannot be pickled, so the
+    # legend must be resolved before pages are dispatched
+    with ThreadPoolExecutor(max_workers=1) as threads:
+        outputs = [
+            threads.submit(
+                pdf.annotate_pdf,
+                input_pdf,
+                items,
+                tmp_path / f"annotated-{run}.pdf",
+                legend_lines_fn=lambda: ["total: 12,50"],
+                dpi=72,
+                field_mapping={0: "total"},
+            ).result(timeout=120)
+            for run in range(2)
+        ]
+
+    for output in outputs:
+        with fitz.open(output) as annotated:
+            assert annotated.page_count == 3
+            assert [page.rect.width for page in annotated] == [200, 200, 200]
+    # Both calls were served by the same long-lived pool
+    assert render_pool.cache_info().misses == 1
+    assert render_pool.cache_info().hits == 1
+
+
+def test_annotate_pdf_renders_in_process_unless_workers_are_configured(tmp_path, monkeypatch):
+    source = fitz.open()
+    for _ in range(3):
+        source.new_page(width=200, height=100)
+    input_pdf = tmp_path / "in.pdf"
+    source.save(input_pdf)
+    source.close()
+    items = [
+        {"page_no": n, "text": "Total", "bbox": {"l": 10, "t": 10, "r": 80, "b": 30}}
+        for n in (1, 2, 3)
+    ]
+    monkeypatch.setattr(get_settings(), "render_workers", None)
+
+    def no_pool(*_args, **_kwargs):
+        raise AssertionError("no worker processes expected")
+
+    monkeypatch.setattr(pdf, "ProcessPoolExecutor", no_pool)
+
+    output = pdf.annotate_pdf(input_pdf, items, tmp_path / "annotated.pdf", dpi=72)
+
+    with fitz.open(output) as annotated:
+        assert annotated.page_count == 3